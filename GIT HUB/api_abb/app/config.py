@@ -1,5 +1,5 @@
 from pydantic import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -11,6 +11,58 @@ class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     DEBUG: bool = True
     
+    # Motor de almacenamiento del servicio AVL: "avl" (árbol de punteros),
+    # "sorted_array" (arreglo ordenado con búfer de escritura) o "persistent"
+    # (AVL inmutable con copia de camino: lectores sin candados), "splay"
+    # (árbol splay: los IDs consultados hace poco quedan cerca de la raíz) o
+    # "splay_read_mostly" (splay con lecturas sin candado y splay limitado)
+    AVL_STORAGE_ENGINE: str = "avl"
+    # Profundidad desde la que una búsqueda de splay_read_mostly hace splay
+    # (None = la altura de un árbol balanceado, ⌊log2 n⌋ + 1)
+    SPLAY_READ_MOSTLY_DEPTH: Optional[int] = None
+    # Inserciones acumuladas en el búfer antes de fusionarlo con el arreglo
+    SORTED_ARRAY_BUFFER_SIZE: int = 512
+    
+    # Factor α del modo chivo expiatorio del ABB (entre 0.5 y 1): al superar
+    # la profundidad log_{1/α}(n) se reconstruye el subárbol desbalanceado.
+    # None deja el ABB clásico sin rebalanceo automático
+    ABB_SCAPEGOAT_ALPHA: Optional[float] = None
+    
+    # Entradas de la caché de respuestas JSON de GET /children/{id} (0 la desactiva)
+    CHILD_PAYLOAD_CACHE_SIZE: int = 4096
+    
+    # Filas validadas e insertadas por bloque en POST /import
+    IMPORT_CHUNK_SIZE: int = 1000
+    
+    # Agrupaciones con contadores incrementales para GET /aggregate
+    # (cada una es una lista de dimensiones separadas por comas)
+    AGGREGATE_GROUP_BY: List[str] = ["city", "gender", "city,gender", "age_bucket"]
+    # Ancho de los rangos de edad de la dimensión age_bucket
+    AGE_BUCKET_SIZE: int = 5
+    
+    # Perfilado por muestreo de peticiones (solo con DEBUG activo): se perfilan
+    # las que traen el header (por ejemplo "X-Debug-Profile"; None lo desactiva)
+    # y, al azar, la fracción PROFILE_SAMPLE_RATE del resto.
+    # Sin DEBUG, o sin header ni tasa, el middleware no se registra
+    PROFILE_HEADER: Optional[str] = None
+    PROFILE_SAMPLE_RATE: float = 0.0
+    # Milisegundos entre muestras de la pila
+    PROFILE_INTERVAL_MS: float = 1.0
+    # Directorio de los perfiles (.collapsed) y cantidad conservada
+    PROFILE_DIR: str = "profiles"
+    PROFILE_MAX_FILES: int = 50
+    
+    # Umbral en milisegundos del registro JSON de operaciones lentas
+    # (inserción, búsqueda, recorridos y estructura); None lo desactiva
+    SLOW_OPERATION_THRESHOLD_MS: Optional[float] = None
+    
+    # Espacios de nombres de /trees/{name}: motor por defecto, segundos sin
+    # accesos antes de descargar uno a su instantánea (None nunca los descarga)
+    # y directorio de las instantáneas
+    NAMESPACE_DEFAULT_ENGINE: str = "avl"
+    NAMESPACE_IDLE_SECONDS: Optional[float] = 900
+    NAMESPACE_SNAPSHOT_DIR: str = "snapshots"
+    
     # Agregar más configuraciones según sea necesario
     # DATABASE_URL: str
     # SECRET_KEY: str
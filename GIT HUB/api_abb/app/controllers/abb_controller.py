@@ -1,13 +1,33 @@
-from fastapi import APIRouter, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from typing import List, Optional, Union
 
 from app.models.schemas import (
+    BatchResultResponse,
+    ChildBatchRequest,
     ChildCreate,
+    ChildUpdate,
     ChildResponse,
+    ChildLookupRequest,
+    ChildLookupResponse,
+    ChildPageResponse,
+    ChildQueryResponse,
+    DEFAULT_PAGE_LIMIT,
+    ExportFormat,
+    FuzzyMatchResponse,
+    Gender,
+    ImportResultResponse,
+    MAX_PAGE_LIMIT,
     TreeResponse,
     TraversalResponse,
     MessageResponse
 )
+from app.config import settings
+from app.utils.batch import BatchConflictError
+from app.utils.bulk_import import import_children_stream, open_import_source
+from app.utils.cursor import decode_cursor
+from app.utils.export import accepts_gzip, gzip_chunks
+from app.utils.slow_log import json_response, slow_operation_log
 from app.services.abb_service import abb_service
 
 
@@ -37,22 +57,156 @@ async def add_child(child: ChildCreate):
     Raises:
         HTTPException 409: Si el ID del niño ya existe en el árbol
     """
-    # Llamar al servicio para agregar el niño
-    result = abb_service.add_child(child)
+    with slow_operation_log.track("insert", abb_service, child.id):
+        # Llamar al servicio para agregar el niño
+        result = abb_service.add_child(child)
+        
+        # Si la inserción falló porque el ID ya existe
+        if not result["success"]:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=result["message"]
+            )
+        
+        # Retornar el resultado exitoso
+        return json_response(result, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/children/batch", response_model=BatchResultResponse)
+async def apply_children_batch(batch: ChildBatchRequest):
+    """
+    Aplica un lote de operaciones sobre el árbol ABB como una unidad.
+    
+    Cada elemento es un insert, update, upsert o delete y se aplica en orden.
+    Todo el lote se valida antes de tocar el árbol; si una operación no se
+    puede aplicar (ID repetido o inexistente), se deshacen las anteriores y
+    el árbol queda exactamente como estaba. Índices y caché se actualizan
+    una sola vez al final, mucho más rápido que una petición por niño.
     
-    # Si la inserción falló porque el ID ya existe
-    if not result["success"]:
+    Args:
+        batch: Operaciones del lote
+        
+    Returns:
+        Cantidad de niños insertados, actualizados y eliminados
+        
+    Raises:
+        HTTPException 409: Si alguna operación falla (no se aplica ninguna)
+    """
+    try:
+        result = abb_service.apply_batch(batch.items)
+    except BatchConflictError as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail=result["message"]
+            detail=str(exc)
         )
     
-    # Retornar el resultado exitoso
     return result
 
 
+# ==================== ENDPOINTS PARA ACTUALIZAR NIÑOS ====================
+
+@router.patch("/children/{child_id}", response_model=ChildResponse)
+async def update_child(child_id: int, changes: ChildUpdate):
+    """
+    Actualiza parcialmente un niño del árbol ABB.
+    
+    Solo se cambian los campos enviados (nombre, edad, ciudad o género).
+    El ID es la clave del nodo y no cambia, así que el niño se ubica con una
+    sola búsqueda O(log n) y se actualiza en el lugar, sin reorganizar el
+    árbol. Índices, contadores y caché se actualizan solo con la diferencia.
+    
+    Args:
+        child_id: ID del niño a actualizar
+        changes: Campos a cambiar
+        
+    Returns:
+        Datos actualizados del niño
+        
+    Raises:
+        HTTPException 400: Si no se envía ningún campo o algún valor no es válido
+        HTTPException 404: Si el niño no existe en el árbol
+    """
+    try:
+        child = abb_service.update_child(child_id, changes)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
+    
+    if child is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Niño con ID {child_id} no encontrado en el árbol"
+        )
+    
+    return child
+
+
 # ==================== ENDPOINTS PARA BUSCAR NIÑOS ====================
 
+@router.get("/children/search", response_model=List[ChildResponse])
+async def search_children_by_name(
+    name_prefix: str = Query(..., min_length=1, max_length=100, description="Inicio del nombre a buscar"),
+    limit: int = Query(20, ge=1, le=100, description="Cantidad máxima de resultados")
+):
+    """
+    Busca niños del árbol por el inicio de su nombre.
+    
+    Usa un trie de nombres normalizados (sin tildes ni mayúsculas), así que
+    el costo es O(largo del prefijo + resultados) y no depende del total
+    de niños. Los resultados se ordenan por nombre y luego por ID.
+    
+    Args:
+        name_prefix: Prefijo del nombre (por ejemplo "jos" encuentra "José")
+        limit: Cantidad máxima de resultados (máximo 100)
+        
+    Returns:
+        Lista de niños cuyo nombre empieza por el prefijo
+        
+    Raises:
+        HTTPException 400: Si el prefijo queda vacío después de normalizarlo
+    """
+    try:
+        return abb_service.search_by_name_prefix(name_prefix, limit)
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error)
+        )
+
+
+@router.get("/children/fuzzy", response_model=List[FuzzyMatchResponse])
+async def fuzzy_search_children(
+    q: str = Query(..., min_length=1, max_length=100, description="Nombre a buscar (admite errores de escritura)"),
+    k: int = Query(10, ge=1, le=50, description="Cantidad máxima de resultados")
+):
+    """
+    Busca niños del árbol con el nombre más parecido a q.
+    
+    Usa un índice invertido de trigramas sobre los nombres normalizados
+    (sin tildes ni mayúsculas) y la similitud de Dice, de modo que
+    "Lucaz" encuentra "Lucas" sin recorrer todos los niños.
+    
+    Args:
+        q: Nombre a buscar
+        k: Cantidad máxima de resultados (máximo 50)
+        
+    Returns:
+        Lista de niños con su similitud, de mayor a menor
+        
+    Raises:
+        HTTPException 400: Si la consulta queda vacía después de normalizarla
+    """
+    try:
+        return abb_service.fuzzy_search_by_name(q, k)
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error)
+        )
+
+
 @router.get("/children/{child_id}", response_model=ChildResponse)
 async def get_child_by_id(child_id: int):
     """
@@ -67,39 +221,145 @@ async def get_child_by_id(child_id: int):
     Args:
         child_id: ID del niño a buscar
         
+    Las respuestas se sirven desde una caché LRU de JSON pre-serializado
+    que se invalida cuando el árbol cambia.
+    
     Returns:
         Datos del niño encontrado (ID, nombre, edad)
         
     Raises:
         HTTPException 404: Si el niño no existe en el árbol
     """
-    # Buscar el niño en el árbol
-    child = abb_service.search_child(child_id)
+    # Obtener el JSON del niño (desde la caché de respuestas si está disponible)
+    with slow_operation_log.track("search", abb_service, child_id):
+        payload = abb_service.get_child_payload(child_id)
     
     # Si no se encontró, lanzar excepción 404
-    if not child:
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Niño con ID {child_id} no encontrado en el árbol"
         )
     
-    # Retornar los datos del niño encontrado
-    return child
+    # Retornar los bytes ya serializados sin volver a codificarlos
+    return Response(content=payload, media_type="application/json")
 
 
-@router.get("/children", response_model=List[ChildResponse])
-async def get_all_children():
+@router.post("/children/lookup", response_model=ChildLookupResponse)
+async def lookup_children(lookup: ChildLookupRequest):
+    """
+    Busca varios niños del árbol en una sola petición.
+    
+    Los IDs se ordenan y se resuelven en un único descenso del árbol,
+    en lugar de hacer una búsqueda (y una petición HTTP) por cada ID.
+    Los IDs repetidos se consideran una sola vez.
+    
+    Args:
+        lookup: Lista de IDs a buscar (máximo 1000)
+        
+    Returns:
+        Niños encontrados (ordenados por ID) y los IDs que no existen
+    """
+    # Resolver todos los IDs de una vez
+    return abb_service.lookup_children(lookup.ids)
+
+
+@router.get("/children", response_model=Union[List[ChildResponse], ChildPageResponse, ChildQueryResponse])
+async def get_all_children(
+    after_id: Optional[int] = Query(None, ge=0, description="Último ID ya recibido; la página empieza después de él"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_LIMIT, description="Tamaño máximo de la página"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco devuelto en next_cursor por la página anterior"),
+    city: Optional[str] = Query(None, description="Filtrar por ciudad"),
+    gender: Optional[Gender] = Query(None, description="Filtrar por género"),
+    min_age: Optional[int] = Query(None, ge=0, le=150, description="Edad mínima (incluida)"),
+    max_age: Optional[int] = Query(None, ge=0, le=150, description="Edad máxima (incluida)"),
+    min_id: Optional[int] = Query(None, ge=0, description="ID mínimo (incluido)"),
+    max_id: Optional[int] = Query(None, ge=0, description="ID máximo (incluido)"),
+    explain: bool = Query(False, description="Incluir el plan de ejecución de los filtros")
+):
     """
     Obtiene todos los niños del árbol ordenados por ID (de menor a mayor).
     
     Utiliza el recorrido inorden del ABB, que garantiza que los nodos
     se visiten en orden ascendente.
     
+    Paginación por cursor (opcional): si se envía after_id, limit o cursor,
+    la respuesta es una página con los niños y un next_cursor. El servidor
+    reanuda con un descenso O(log n) al primer ID posterior, así que los
+    cursores siguen siendo válidos aunque se inserten niños entre páginas.
+    
+    Filtros (opcionales): city, gender, min_age/max_age y min_id/max_id se
+    combinan con AND. Un planificador estima la selectividad de cada filtro
+    con sus índices e interseca mapas de bits de ciudad, género y edad con
+    operaciones vectorizadas; solo recorre el árbol completo si ningún
+    filtro es selectivo.
+    Con explain=true la respuesta incluye el plan y las filas examinadas.
+    
+    Args:
+        after_id: Último ID ya recibido (alternativa legible al cursor)
+        limit: Tamaño máximo de la página (por defecto 100)
+        cursor: Cursor devuelto por la página anterior
+        city: Ciudad exacta
+        gender: Género
+        min_age: Edad mínima (incluida)
+        max_age: Edad máxima (incluida)
+        min_id: ID mínimo (incluido)
+        max_id: ID máximo (incluido)
+        explain: Si es True, devuelve también el plan de ejecución
+        
     Returns:
-        Lista de niños ordenada por ID
+        Lista de niños ordenada por ID, una página con next_cursor,
+        o los niños filtrados con su plan (explain=true)
+        
+    Raises:
+        HTTPException 400: Si el cursor es inválido, se envía junto con after_id,
+                           se combinan filtros con paginación o un rango está invertido
     """
-    # Obtener todos los niños ordenados
-    return abb_service.get_all_children()
+    filters = (city, gender, min_age, max_age, min_id, max_id)
+    if explain or any(value is not None for value in filters):
+        # Los filtros devuelven todos los resultados; no se combinan con páginas
+        if after_id is not None or limit is not None or cursor is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Los filtros no se pueden combinar con la paginación"
+            )
+        try:
+            result = abb_service.query_children(
+                city=city,
+                gender=gender.value if gender else None,
+                min_age=min_age,
+                max_age=max_age,
+                min_id=min_id,
+                max_id=max_id
+            )
+        except ValueError as error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(error)
+            )
+        return result if explain else result.children
+    
+    # Sin parámetros de paginación se mantiene la respuesta original
+    if after_id is None and limit is None and cursor is None:
+        return abb_service.get_all_children()
+    
+    # El cursor y after_id indican lo mismo, no se pueden combinar
+    if cursor is not None:
+        if after_id is not None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Use cursor o after_id, pero no ambos"
+            )
+        try:
+            after_id = decode_cursor(cursor)
+        except ValueError as error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(error)
+            )
+    
+    # Obtener la página solicitada
+    return abb_service.get_children_page(after_id, limit or DEFAULT_PAGE_LIMIT)
 
 
 # ==================== ENDPOINTS PARA VISUALIZAR EL ÁRBOL ====================
@@ -116,7 +376,8 @@ async def get_tree_structure():
         Estructura del árbol con la raíz y todos sus descendientes
     """
     # Obtener la estructura del árbol
-    return abb_service.get_tree_structure()
+    with slow_operation_log.track("serialize", abb_service):
+        return json_response(abb_service.get_tree_structure())
 
 
 # ==================== ENDPOINTS PARA RECORRIDOS DEL ÁRBOL ====================
@@ -138,7 +399,8 @@ async def get_inorder_traversal():
         Lista de niños en orden inorden
     """
     # Obtener recorrido inorden
-    return abb_service.get_inorder_traversal()
+    with slow_operation_log.track("traversal", abb_service):
+        return json_response(abb_service.get_inorder_traversal())
 
 
 @router.get("/traversal/preorder", response_model=TraversalResponse)
@@ -158,7 +420,8 @@ async def get_preorder_traversal():
         Lista de niños en orden preorden
     """
     # Obtener recorrido preorden
-    return abb_service.get_preorder_traversal()
+    with slow_operation_log.track("traversal", abb_service):
+        return json_response(abb_service.get_preorder_traversal())
 
 
 @router.get("/traversal/postorder", response_model=TraversalResponse)
@@ -178,7 +441,39 @@ async def get_postorder_traversal():
         Lista de niños en orden postorden
     """
     # Obtener recorrido postorden
-    return abb_service.get_postorder_traversal()
+    with slow_operation_log.track("traversal", abb_service):
+        return json_response(abb_service.get_postorder_traversal())
+
+
+@router.get("/traversal/levelorder")
+async def get_levelorder_traversal(
+    max_level: Optional[int] = Query(None, ge=0, description="Último nivel a incluir (la raíz es el nivel 0)"),
+    accept_encoding: Optional[str] = Header(None)
+):
+    """
+    Obtiene el recorrido por niveles (BFS) del árbol, de arriba hacia abajo.
+    
+    La respuesta es NDJSON en streaming: una línea por nivel con la forma
+    {"level": n, "children": [...]}, enviada apenas se recorre ese nivel.
+    Con max_level el recorrido se detiene allí, así que mostrar la parte
+    superior de un árbol grande solo cuesta los nodos mostrados.
+    
+    Args:
+        max_level: Último nivel a incluir (opcional)
+        accept_encoding: Encabezado Accept-Encoding del cliente
+        
+    Returns:
+        Respuesta en streaming con un nivel por línea
+    """
+    chunks = abb_service.export_levelorder(max_level)
+    headers = {"Vary": "Accept-Encoding"}
+    
+    # Comprimir sobre la marcha si el cliente lo acepta
+    if accepts_gzip(accept_encoding):
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    
+    return StreamingResponse(chunks, media_type="application/x-ndjson", headers=headers)
 
 
 # ==================== ENDPOINTS PARA ESTADÍSTICAS ====================
@@ -202,6 +497,235 @@ async def get_tree_statistics():
     return abb_service.get_tree_stats()
 
 
+@router.get("/stats/ages")
+async def get_age_statistics(
+    group_by: str = Query("city", description="city, gender, city,gender o vacío para no agrupar"),
+    percentiles: str = Query("25,50,75,90", description="Percentiles separados por comas")
+):
+    """
+    Obtiene estadísticas de edad por grupo de los niños del árbol.
+    
+    Por cada grupo devuelve cantidad, media, mediana, mínimo, máximo y los
+    percentiles pedidos (rango más cercano). Se calculan con NumPy sobre una
+    copia columnar del árbol que solo se reconstruye si el árbol cambió.
+    
+    Ejemplo: /stats/ages?group_by=city,gender&percentiles=50,90
+    
+    Args:
+        group_by: Dimensiones de agrupación
+        percentiles: Percentiles a calcular
+        
+    Returns:
+        Diccionario con la agrupación, el total y los grupos
+        
+    Raises:
+        HTTPException 400: Si la agrupación o algún percentil no es válido
+    """
+    try:
+        return abb_service.get_age_stats(group_by, percentiles)
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error)
+        )
+
+
+@router.get("/stats/histogram")
+async def get_age_histogram(
+    bin_size: int = Query(1, ge=1, le=150, description="Ancho de cada intervalo en años"),
+    city: Optional[str] = Query(None, description="Ciudad (opcional)"),
+    gender: Optional[Gender] = Query(None, description="Género (opcional)")
+):
+    """
+    Obtiene el histograma de edades de los niños del árbol.
+    
+    Se calcula con np.bincount sobre la copia columnar del árbol.
+    
+    Args:
+        bin_size: Ancho de cada intervalo en años
+        city: Ciudad (opcional)
+        gender: Género (opcional)
+        
+    Returns:
+        Diccionario con los intervalos no vacíos y sus cantidades
+    """
+    return abb_service.get_age_distribution(bin_size, city, gender.value if gender else None)
+
+
+@router.get("/aggregate")
+async def aggregate_children(
+    group_by: str = Query("city", description="Dimensiones separadas por comas: city, gender, age_bucket"),
+    metrics: str = Query("count", description="Métricas separadas por comas: count, sum_age, avg_age, min_age, max_age")
+):
+    """
+    Obtiene métricas agregadas por grupo de los niños del árbol.
+    
+    Los contadores de cada grupo (cantidad, suma de edades, mínimo y máximo)
+    se actualizan en cada inserción, así que la consulta cuesta O(grupos)
+    en lugar de recorrer todo el árbol.
+    
+    Ejemplo: /aggregate?group_by=city,gender&metrics=count,avg_age
+    
+    Args:
+        group_by: Agrupación a consultar (debe estar en AGGREGATE_GROUP_BY)
+        metrics: Métricas a calcular por grupo
+        
+    Returns:
+        Diccionario con la agrupación, las métricas y los grupos
+        
+    Raises:
+        HTTPException 400: Si la dimensión o métrica no existe o la agrupación no está configurada
+    """
+    try:
+        return abb_service.aggregate(group_by, metrics)
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error)
+        )
+
+
+@router.get("/ages/count")
+async def count_children_by_age(
+    min_age: int = Query(0, alias="min", ge=0, le=150, description="Edad mínima (incluida)"),
+    max_age: int = Query(150, alias="max", ge=0, le=150, description="Edad máxima (incluida)"),
+    city: Optional[str] = Query(None, description="Ciudad (opcional)")
+):
+    """
+    Cuenta los niños del árbol con edad entre min y max.
+    
+    Usa un árbol de Fenwick sobre las edades (0–150), global o por ciudad,
+    así que responde en O(log 151) sin recorrer el árbol.
+    
+    Returns:
+        Diccionario con el rango consultado y la cantidad de niños
+    """
+    return abb_service.count_by_age(min_age, max_age, city)
+
+
+@router.get("/ages/percentile")
+async def get_age_percentile(
+    p: float = Query(..., gt=0, le=100, description="Percentil entre 0 (excluido) y 100"),
+    city: Optional[str] = Query(None, description="Ciudad (opcional)")
+):
+    """
+    Obtiene el percentil p de la edad de los niños del árbol.
+    
+    Se usa el método del rango más cercano sobre el árbol de Fenwick
+    de edades, en O(log 151).
+    
+    Returns:
+        Diccionario con el percentil y la edad correspondiente (None si no hay niños)
+    """
+    return abb_service.get_age_percentile(p, city)
+
+
+@router.get("/ages/median")
+async def get_age_median(
+    city: Optional[str] = Query(None, description="Ciudad (opcional)")
+):
+    """
+    Obtiene la mediana de edad de los niños del árbol en O(log 151).
+    
+    Returns:
+        Diccionario con la mediana de edad (None si no hay niños)
+    """
+    return abb_service.get_age_median(city)
+
+
+@router.get("/cache/stats")
+async def get_cache_statistics():
+    """
+    Obtiene las métricas de la caché de respuestas de GET /children/{id}.
+    
+    Incluye tamaño actual, aciertos, fallos, tasa de acierto,
+    desalojos e invalidaciones acumuladas.
+    
+    Returns:
+        Diccionario con las métricas de la caché
+    """
+    return abb_service.get_cache_stats()
+
+
+# ==================== ENDPOINTS PARA EXPORTAR E IMPORTAR ====================
+
+@router.get("/export")
+async def export_children(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Formato de salida: ndjson o csv"),
+    accept_encoding: Optional[str] = Header(None)
+):
+    """
+    Exporta todos los niños del árbol en orden de ID como un flujo.
+    
+    Los niños se serializan en bloques a medida que el iterador inorden
+    los produce, así que la memoria del servidor no crece con el tamaño
+    del árbol. Si el cliente envía Accept-Encoding: gzip, el flujo se
+    comprime sobre la marcha.
+    
+    Args:
+        format: Formato de salida (ndjson por defecto, o csv)
+        accept_encoding: Encabezado Accept-Encoding del cliente
+        
+    Returns:
+        Respuesta en streaming con el contenido exportado
+    """
+    # Generador perezoso de bloques serializados
+    chunks = abb_service.export_children(format)
+    
+    media_type = "text/csv; charset=utf-8" if format == ExportFormat.CSV else "application/x-ndjson"
+    headers = {
+        "Content-Disposition": f'attachment; filename="abb_children.{format.value}"',
+        "Vary": "Accept-Encoding"
+    }
+    
+    # Comprimir sobre la marcha si el cliente lo acepta
+    if accepts_gzip(accept_encoding):
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+
+@router.post("/import", response_model=ImportResultResponse)
+async def import_children(
+    request: Request,
+    format: Optional[ExportFormat] = Query(None, description="Formato del archivo: ndjson o csv (por defecto se deduce)")
+):
+    """
+    Importa niños al árbol desde un archivo NDJSON o CSV.
+    
+    Acepta un archivo multipart en el campo "file" o el cuerpo crudo de la
+    petición. El contenido se lee de forma incremental, se valida con las
+    reglas de ChildCreate y se inserta por bloques, cediendo el event loop
+    entre bloques para no bloquear otras peticiones.
+    
+    Args:
+        request: Petición con el archivo o el cuerpo a importar
+        format: Formato explícito; si no se indica se deduce del nombre
+                del archivo o del Content-Type (CSV si contiene "csv")
+        
+    Returns:
+        Cantidad de filas insertadas, duplicadas e inválidas, con el
+        número de línea de las filas rechazadas
+        
+    Raises:
+        HTTPException 400: Si falta el archivo o el encabezado CSV es inválido
+    """
+    try:
+        chunks, import_format = await open_import_source(request, format)
+        return await import_children_stream(
+            chunks,
+            import_format,
+            abb_service.import_children_chunk,
+            settings.IMPORT_CHUNK_SIZE
+        )
+    except ValueError as error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(error)
+        )
+
+
 # ==================== ENDPOINTS PARA GESTIÓN DEL ÁRBOL ====================
 
 @router.delete("/tree", response_model=MessageResponse)
@@ -231,6 +755,26 @@ async def clear_tree():
     )
 
 
+@router.post("/rebalance", response_model=MessageResponse)
+async def rebalance_tree():
+    """
+    Reorganiza el ABB en forma balanceada.
+    
+    Si los IDs llegan casi ordenados el ABB degenera en una lista y cada
+    búsqueda cuesta O(n). Este endpoint aplica el algoritmo de
+    Day–Stout–Warren: convierte el árbol en una vara con rotaciones y la
+    comprime en un árbol completo, en O(n) tiempo y O(1) memoria adicional.
+    
+    Returns:
+        Mensaje con la altura antes y después del rebalanceo
+    """
+    result = abb_service.rebalance_tree()
+    return MessageResponse(
+        message="ABB rebalanceado exitosamente",
+        details=result
+    )
+
+
 @router.get("/tree/count")
 async def get_tree_count():
     """
@@ -299,15 +843,31 @@ async def welcome():
         "description": "Esta API permite gestionar un ABB de niños con ID, nombre, edad, ciudad y género",
         "endpoints": {
             "POST /children": "Agregar un nuevo niño al árbol",
+            "GET /children/search": "Buscar niños por prefijo del nombre (?name_prefix=&limit=)",
+            "GET /children/fuzzy": "Búsqueda aproximada por nombre (?q=&k=)",
             "GET /children/{id}": "Buscar un niño por su ID",
-            "GET /children": "Obtener todos los niños ordenados",
+            "POST /children/batch": "Aplicar un lote atómico de insert/update/upsert/delete",
+            "PATCH /children/{id}": "Actualizar parcialmente un niño (nombre, edad, ciudad o género)",
+            "POST /children/lookup": "Buscar varios niños por ID en una sola petición",
+            "GET /children": "Obtener todos los niños ordenados (paginable con ?limit=&cursor=; filtrable con ?city=&gender=&min_age=&max_age=&min_id=&max_id=&explain=true)",
             "GET /tree": "Ver la estructura completa del árbol",
             "GET /traversal/inorder": "Recorrido inorden (orden ascendente)",
             "GET /traversal/preorder": "Recorrido preorden",
             "GET /traversal/postorder": "Recorrido postorden",
+            "GET /traversal/levelorder": "Recorrido por niveles en streaming NDJSON (?max_level=)",
             "GET /stats": "Estadísticas del árbol",
+            "GET /stats/ages": "Media, mediana y percentiles de edad por grupo (?group_by=&percentiles=)",
+            "GET /stats/histogram": "Histograma de edades (?bin_size=&city=&gender=)",
+            "GET /aggregate": "Métricas por grupo (?group_by=city,gender&metrics=count,avg_age)",
+            "GET /ages/count": "Niños por rango de edad (?min=&max=&city=)",
+            "GET /ages/percentile": "Percentil de edad (?p=&city=)",
+            "GET /ages/median": "Mediana de edad (?city=)",
+            "GET /cache/stats": "Métricas de la caché de respuestas por ID",
+            "GET /export": "Exportar el árbol en streaming (NDJSON o CSV, con gzip opcional)",
+            "POST /import": "Importar niños desde un archivo NDJSON o CSV",
             "GET /tree/count": "Cantidad de niños en el árbol",
             "GET /kids-by-city-and-gender": "Estadísticas por ciudad y género",
+            "POST /rebalance": "Rebalancear el ABB en O(n) (Day–Stout–Warren)",
             "DELETE /tree": "Limpiar el árbol completo"
         },
         "documentation": "/docs para ver la documentación interactiva"
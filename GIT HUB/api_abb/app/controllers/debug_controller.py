@@ -0,0 +1,125 @@
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+from app.utils.memory import allocation_tracker
+from app.utils.profiling import profile_store
+
+
+# Router con los endpoints de diagnóstico del proceso
+# Se usará el prefijo "/debug" en el archivo main.py (solo con DEBUG activo)
+router = APIRouter()
+
+
+# ==================== ENDPOINTS DE MEMORIA ====================
+
+@router.get("/memory")
+async def get_memory_usage(
+    top: int = Query(10, ge=1, le=100, description="Cantidad de líneas con más asignaciones a informar")
+):
+    """
+    Obtiene la huella de memoria profunda de cada árbol y las líneas de código
+    que más memoria asignaron desde el último POST /debug/memory/reset.
+    
+    Cada árbol se separa en:
+    - nodes: nodos y demás estructura del motor
+    - children: objetos Child (sin sus textos)
+    - strings: nombres y ciudades, con los bytes repetidos que se ahorrarían internándolos
+    - indexes: agregados, histograma, índices de nombre y mapas de bits
+    - caches: caché de respuestas serializadas
+    
+    La medición recorre todos los objetos de cada árbol (O(n)).
+    
+    Args:
+        top: Cantidad de líneas con más asignaciones a informar
+        
+    Returns:
+        Diccionario con la memoria de cada árbol y el estado de tracemalloc
+    """
+    return {
+        "trees": {
+            "abb": abb_service.get_memory_usage(),
+            "avl": avl_service.get_memory_usage(),
+        },
+        "tracemalloc": allocation_tracker.top(top),
+    }
+
+
+@router.post("/memory/reset")
+async def reset_allocation_tracking():
+    """
+    Inicia tracemalloc (si no estaba activo) y toma una nueva foto de
+    referencia: GET /debug/memory informará las asignaciones posteriores.
+    
+    Mientras está activo, tracemalloc hace más lenta cada asignación.
+    
+    Returns:
+        Estado del rastreo
+    """
+    return allocation_tracker.reset()
+
+
+@router.delete("/memory/tracing")
+async def stop_allocation_tracking():
+    """
+    Detiene tracemalloc y descarta la foto de referencia.
+    
+    Returns:
+        Estado del rastreo
+    """
+    return allocation_tracker.stop()
+
+
+# ==================== ENDPOINTS DE PERFILES ====================
+
+@router.get("/profiles")
+async def list_profiles():
+    """
+    Lista los perfiles recientes, del más reciente al más antiguo.
+    
+    Se perfila una petición cuando trae el header PROFILE_HEADER
+    (X-Debug-Profile por defecto) o cae en la fracción PROFILE_SAMPLE_RATE;
+    su respuesta lleva el header X-Profile-Id.
+    
+    Returns:
+        Diccionario con el directorio y los metadatos de cada perfil
+    """
+    profiles = profile_store.list()
+    return {"directory": profile_store.directory, "total": len(profiles), "profiles": profiles}
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str):
+    """
+    Obtiene las pilas de un perfil en formato colapsado, listo para
+    flamegraph.pl, speedscope o inferno.
+    
+    Args:
+        profile_id: Identificador del perfil (header X-Profile-Id)
+        
+    Returns:
+        Una línea "raíz;...;hoja muestras" por pila
+        
+    Raises:
+        HTTPException 404: Si el perfil no existe o ya fue descartado
+    """
+    collapsed = profile_store.read(profile_id)
+    if collapsed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No existe el perfil '{profile_id}'"
+        )
+    return collapsed
+
+
+@router.delete("/profiles")
+async def clear_profiles():
+    """
+    Borra todos los perfiles y sus archivos.
+    
+    Returns:
+        Diccionario con un mensaje de confirmación
+    """
+    profile_store.clear()
+    return {"message": "Perfiles eliminados"}
@@ -0,0 +1,370 @@
+from fastapi import APIRouter, HTTPException, Path, Query, Response, status
+from typing import List, Optional
+
+from app.models.schemas import (
+    BatchResultResponse,
+    ChildBatchRequest,
+    ChildCreate,
+    ChildUpdate,
+    ChildResponse,
+    TreeResponse,
+    TraversalResponse,
+    MessageResponse
+)
+from app.services.namespace_service import (
+    NAMESPACE_ENGINES,
+    Namespace,
+    NamespaceExistsError,
+    namespace_registry
+)
+from app.utils.batch import BatchConflictError
+from app.utils.slow_log import json_response, slow_operation_log
+
+
+# Router para los árboles independientes por espacio de nombres
+# Se usará el prefijo "/trees" en el archivo main.py
+router = APIRouter()
+
+# Nombre del espacio en la ruta (las reglas completas las valida el registro)
+NAME_PATH = Path(..., description="Nombre del espacio (minúsculas, dígitos, '-' o '_')")
+
+
+def _get_namespace(name: str, create: bool = False) -> Namespace:
+    """
+    Obtiene un espacio (recargándolo si estaba descargado a disco).
+
+    Args:
+        name: Nombre del espacio
+        create: Si True, lo crea con el motor por defecto cuando no existe
+
+    Returns:
+        Espacio de nombres
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido
+        HTTPException 404: Si el espacio no existe y create es False
+    """
+    try:
+        namespace = namespace_registry.get_or_create(name) if create else namespace_registry.get(name)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
+
+    if namespace is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"El espacio '{name}' no existe"
+        )
+    return namespace
+
+
+# ==================== ENDPOINTS PARA ADMINISTRAR ESPACIOS ====================
+
+@router.get("")
+async def list_namespaces():
+    """
+    Lista los espacios de nombres, cargados en memoria o descargados a disco.
+
+    Returns:
+        Diccionario con cada espacio (motor, estado, nodos, bytes de su
+        instantánea) y los totales
+    """
+    return namespace_registry.list()
+
+
+@router.post("/_evict")
+async def evict_idle_namespaces():
+    """
+    Descarga ahora a disco los espacios inactivos por más de
+    NAMESPACE_IDLE_SECONDS (también ocurre en cada acceso a /trees).
+    La ruta empieza con "_", que ningún nombre de espacio puede usar, así
+    que no tapa a POST /trees/{name}.
+
+    Returns:
+        Diccionario con los nombres de los espacios descargados
+    """
+    return {"evicted": namespace_registry.evict_idle()}
+
+
+@router.post("/{name}", status_code=status.HTTP_201_CREATED)
+async def create_namespace(
+    name: str = NAME_PATH,
+    engine: Optional[str] = Query(None, description=f"Motor del árbol: {', '.join(NAMESPACE_ENGINES)}")
+):
+    """
+    Crea un espacio de nombres vacío con el motor elegido.
+
+    Las escrituras sobre un espacio inexistente también lo crean, con el
+    motor NAMESPACE_DEFAULT_ENGINE.
+
+    Args:
+        name: Nombre del espacio
+        engine: Motor del árbol (por defecto NAMESPACE_DEFAULT_ENGINE)
+
+    Returns:
+        Estado del espacio creado
+
+    Raises:
+        HTTPException 400: Si el nombre o el motor no son válidos
+        HTTPException 409: Si el espacio ya existe
+    """
+    try:
+        namespace = namespace_registry.create(name, engine)
+    except NamespaceExistsError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc)
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
+
+    return namespace_registry.describe(namespace)
+
+
+@router.get("/{name}")
+async def get_namespace(name: str = NAME_PATH):
+    """
+    Obtiene el estado de un espacio: motor, nodos y memoria que ocupa.
+
+    Si estaba descargado, se recarga desde su instantánea. La memoria se
+    mide recorriendo todo el árbol (O(n)).
+
+    Args:
+        name: Nombre del espacio
+
+    Returns:
+        Estado del espacio con memory_bytes medido
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido
+        HTTPException 404: Si el espacio no existe
+    """
+    return namespace_registry.describe(_get_namespace(name), measure_memory=True)
+
+
+@router.delete("/{name}", response_model=MessageResponse)
+async def delete_namespace(name: str = NAME_PATH):
+    """
+    Elimina un espacio de nombres y su instantánea en disco.
+
+    Args:
+        name: Nombre del espacio
+
+    Returns:
+        Mensaje de confirmación
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido
+        HTTPException 404: Si el espacio no existe
+    """
+    try:
+        existed = namespace_registry.delete(name)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
+
+    if not existed:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"El espacio '{name}' no existe"
+        )
+    return MessageResponse(message=f"Espacio '{name}' eliminado")
+
+
+# ==================== ENDPOINTS PARA LOS NIÑOS DE UN ESPACIO ====================
+
+@router.post("/{name}/children", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def add_child(child: ChildCreate, name: str = NAME_PATH):
+    """
+    Agrega un niño al árbol del espacio (lo crea si no existe).
+
+    Args:
+        child: Datos del niño a agregar
+        name: Nombre del espacio
+
+    Returns:
+        Diccionario con el resultado de la operación y los datos del niño agregado
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido
+        HTTPException 409: Si el ID del niño ya existe en el árbol
+    """
+    service = _get_namespace(name, create=True).service
+    with slow_operation_log.track("insert", service, child.id):
+        result = service.add_child(child)
+
+        if not result["success"]:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=result["message"]
+            )
+
+        return json_response(result, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/{name}/children/batch", response_model=BatchResultResponse)
+async def apply_children_batch(batch: ChildBatchRequest, name: str = NAME_PATH):
+    """
+    Aplica un lote de operaciones sobre el árbol del espacio como una unidad
+    (lo crea si no existe). Si una operación falla, no se aplica ninguna.
+
+    Args:
+        batch: Operaciones del lote
+        name: Nombre del espacio
+
+    Returns:
+        Cantidad de niños insertados, actualizados y eliminados
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido
+        HTTPException 409: Si alguna operación falla
+    """
+    service = _get_namespace(name, create=True).service
+    try:
+        return service.apply_batch(batch.items)
+    except BatchConflictError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(exc)
+        )
+
+
+@router.patch("/{name}/children/{child_id}", response_model=ChildResponse)
+async def update_child(child_id: int, changes: ChildUpdate, name: str = NAME_PATH):
+    """
+    Actualiza parcialmente un niño del árbol del espacio.
+
+    Args:
+        child_id: ID del niño a actualizar
+        changes: Campos a cambiar
+        name: Nombre del espacio
+
+    Returns:
+        Datos actualizados del niño
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido, no se envía ningún campo o algún valor no es válido
+        HTTPException 404: Si el espacio o el niño no existen
+    """
+    service = _get_namespace(name).service
+    try:
+        child = service.update_child(child_id, changes)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc)
+        )
+
+    if child is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Niño con ID {child_id} no encontrado en el espacio '{name}'"
+        )
+    return child
+
+
+@router.get("/{name}/children", response_model=List[ChildResponse])
+async def get_all_children(name: str = NAME_PATH):
+    """
+    Obtiene todos los niños del espacio ordenados por ID.
+
+    Args:
+        name: Nombre del espacio
+
+    Returns:
+        Lista de niños en orden ascendente por ID
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido
+        HTTPException 404: Si el espacio no existe
+    """
+    return _get_namespace(name).service.get_all_children()
+
+
+@router.get("/{name}/children/{child_id}", response_model=ChildResponse)
+async def get_child(child_id: int, name: str = NAME_PATH):
+    """
+    Busca un niño del espacio por su ID.
+
+    Args:
+        child_id: ID del niño a buscar
+        name: Nombre del espacio
+
+    Returns:
+        Datos del niño encontrado
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido
+        HTTPException 404: Si el espacio o el niño no existen
+    """
+    service = _get_namespace(name).service
+    with slow_operation_log.track("search", service, child_id):
+        payload = service.get_child_payload(child_id)
+
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Niño con ID {child_id} no encontrado en el espacio '{name}'"
+        )
+    return Response(content=payload, media_type="application/json")
+
+
+# ==================== ENDPOINTS PARA VISUALIZAR Y RECORRER ====================
+
+@router.get("/{name}/tree", response_model=TreeResponse)
+async def get_tree_structure(name: str = NAME_PATH):
+    """
+    Obtiene la estructura jerárquica del árbol del espacio.
+
+    Args:
+        name: Nombre del espacio
+
+    Returns:
+        Estructura del árbol con la raíz y todos sus descendientes
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido o el árbol es demasiado
+                           profundo para la estructura anidada
+        HTTPException 404: Si el espacio no existe
+    """
+    service = _get_namespace(name).service
+    with slow_operation_log.track("serialize", service):
+        try:
+            tree = service.get_tree_structure()
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(exc)
+            )
+        return json_response(tree)
+
+
+@router.get("/{name}/traversal/{order}", response_model=TraversalResponse)
+async def get_traversal(
+    name: str = NAME_PATH,
+    order: str = Path(..., regex="^(inorder|preorder|postorder)$", description="inorder, preorder o postorder")
+):
+    """
+    Obtiene un recorrido del árbol del espacio.
+
+    Args:
+        name: Nombre del espacio
+        order: Recorrido (inorder, preorder o postorder)
+
+    Returns:
+        Lista de niños en el orden del recorrido
+
+    Raises:
+        HTTPException 400: Si el nombre no es válido
+        HTTPException 404: Si el espacio no existe
+    """
+    service = _get_namespace(name).service
+    with slow_operation_log.track("traversal", service):
+        return json_response(getattr(service, f"get_{order}_traversal")())
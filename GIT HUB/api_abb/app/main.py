@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.controllers import abb_controller, avl_controller
+from app.config import settings
+from app.controllers import abb_controller, avl_controller, debug_controller, namespace_controller
+from app.utils.profiling import ProfilingMiddleware, profile_store
 
 # Crear instancia de la aplicación FastAPI
 app = FastAPI(
@@ -20,6 +22,18 @@ app.add_middleware(
     allow_headers=["*"],  # Permitir todos los headers
 )
 
+# Perfilado por muestreo de las peticiones con el header de depuración o en la muestra.
+# Es opcional y solo existe en modo DEBUG (igual que /debug): sin DEBUG, o sin
+# header ni tasa configurados, no se registra y no agrega ningún costo
+if settings.DEBUG and (settings.PROFILE_HEADER or settings.PROFILE_SAMPLE_RATE > 0):
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        header=settings.PROFILE_HEADER,
+        sample_rate=settings.PROFILE_SAMPLE_RATE,
+        interval=settings.PROFILE_INTERVAL_MS / 1000
+    )
+
 # Registrar el router del ABB con el prefijo /abb
 app.include_router(
     abb_controller.router,
@@ -34,6 +48,21 @@ app.include_router(
     tags=["Árbol AVL (Auto-balanceado)"]
 )
 
+# Registrar los árboles independientes por espacio de nombres con el prefijo /trees
+app.include_router(
+    namespace_controller.router,
+    prefix="/trees",
+    tags=["Espacios de nombres"]
+)
+
+# Registrar los endpoints de diagnóstico con el prefijo /debug (solo en modo DEBUG)
+if settings.DEBUG:
+    app.include_router(
+        debug_controller.router,
+        prefix="/debug",
+        tags=["Diagnóstico"]
+    )
+
 
 # Endpoint raíz de bienvenida
 @app.get("/")
@@ -53,6 +82,7 @@ async def root():
             "swagger": "/docs",
             "redoc": "/redoc"
         },
+        "debug": "/debug/memory" if settings.DEBUG else None,
         "available_trees": {
             "abb": {
                 "name": "Árbol Binario de Búsqueda",
@@ -65,6 +95,12 @@ async def root():
                 "base_path": "/avl",
                 "description": "Árbol AVL auto-balanceado con rotaciones",
                 "info_endpoint": "/avl/"
+            },
+            "namespaces": {
+                "name": "Árboles por espacio de nombres",
+                "base_path": "/trees/{name}",
+                "description": "Árboles independientes por colegio, con motor propio y descarga a disco por inactividad",
+                "info_endpoint": "/trees"
             }
         },
         "status": "online"
@@ -1,4 +1,6 @@
-from typing import Optional, List
+import math
+from bisect import bisect_left
+from typing import Iterator, Optional, List, Tuple
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 from app.models.schemas import ChildResponse, TreeNode as TreeNodeSchema
@@ -112,6 +114,24 @@ class Child(BaseModel):
         """
         return self.dict()
     
+    def updated(self, changes: dict) -> "Child":
+        """
+        Crea un niño nuevo con los campos indicados cambiados.
+        El ID no cambia: es la clave del nodo.
+        
+        Args:
+            changes: Campos a cambiar (name, age, city, gender)
+            
+        Returns:
+            Nuevo objeto Child validado
+            
+        Raises:
+            ValueError: Si algún valor no es válido o se intenta cambiar el ID
+        """
+        if "id" in changes and changes["id"] != self.id:
+            raise ValueError("El ID de un niño no se puede modificar")
+        return Child(**{**self.dict(), **changes})
+    
     def to_response(self) -> ChildResponse:
         """
         Convierte el objeto Child a un esquema de respuesta Pydantic.
@@ -205,20 +225,40 @@ class BinarySearchTree:
     - No se permiten IDs duplicados
     """
     
-    def __init__(self):
+    def __init__(self, scapegoat_alpha: Optional[float] = None):
         """
         Constructor de la clase BinarySearchTree.
         Inicializa un árbol vacío con la raíz en None.
+        
+        Args:
+            scapegoat_alpha: Si se indica (entre 0.5 y 1), activa el modo
+                             chivo expiatorio: cuando una inserción queda más
+                             profunda que log_{1/α}(n), se reconstruye solo el
+                             subárbol desbalanceado. Sin rotaciones ni campos
+                             extra por nodo. None mantiene el ABB clásico.
+                             
+        Raises:
+            ValueError: Si scapegoat_alpha no está entre 0.5 y 1 (excluidos)
         """
+        if scapegoat_alpha is not None and not 0.5 < scapegoat_alpha < 1:
+            raise ValueError("scapegoat_alpha debe estar entre 0.5 y 1 (excluidos)")
         # Raíz del árbol (None si el árbol está vacío)
         self.root: Optional[Node] = None
         # Contador de nodos en el árbol
         self._count: int = 0
+        # Factor α del modo chivo expiatorio (None = ABB clásico)
+        self.scapegoat_alpha = scapegoat_alpha
+        # Subárboles reconstruidos por el modo chivo expiatorio
+        self.rebuilds: int = 0
+        # Máximo de nodos desde la última reconstrucción completa (modo chivo expiatorio)
+        self._max_count: int = 0
     
     def insert(self, child: Child) -> bool:
         """
         Inserta un nuevo niño en el árbol.
         Sigue las reglas del ABB para ubicar el nuevo nodo.
+        Desciende con un ciclo en lugar de recursión: un árbol degenerado
+        (IDs crecientes) puede tener tanta profundidad como nodos.
         
         Args:
             child: Objeto Child a insertar
@@ -232,47 +272,92 @@ class BinarySearchTree:
             self._count += 1
             return True
         
-        # Si no está vacío, usamos un método auxiliar recursivo
-        result = self._insert_recursive(self.root, child)
-        if result:
-            self._count += 1
-        return result
+        # Camino de la raíz al nuevo nodo (lo usa el modo chivo expiatorio)
+        path: List[Node] = []
+        current_node = self.root
+        while True:
+            path.append(current_node)
+            # Si el ID ya existe, no se puede insertar (IDs únicos)
+            if child.id == current_node.child.id:
+                return False
+            
+            # Si el ID es menor, debe ir a la izquierda
+            if child.id < current_node.child.id:
+                # Si no hay hijo izquierdo, insertamos aquí
+                if current_node.left is None:
+                    current_node.left = Node(child)
+                    path.append(current_node.left)
+                    break
+                current_node = current_node.left
+            
+            # Si el ID es mayor, debe ir a la derecha
+            else:
+                # Si no hay hijo derecho, insertamos aquí
+                if current_node.right is None:
+                    current_node.right = Node(child)
+                    path.append(current_node.right)
+                    break
+                current_node = current_node.right
+        
+        self._count += 1
+        self._max_count = max(self._max_count, self._count)
+        
+        # Profundidad del nuevo nodo (en aristas) frente a la cota log_{1/α}(n)
+        if self.scapegoat_alpha is not None:
+            depth = len(path) - 1
+            if depth > math.log(self._count, 1 / self.scapegoat_alpha):
+                self._rebuild_scapegoat(path)
+        return True
     
-    def _insert_recursive(self, current_node: Node, child: Child) -> bool:
+    @staticmethod
+    def _subtree_size(node: Optional[Node]) -> int:
         """
-        Método auxiliar recursivo para insertar un nodo.
-        Navega por el árbol hasta encontrar la posición correcta.
+        Cuenta los nodos de un subárbol con una pila explícita.
         
         Args:
-            current_node: Nodo actual en el recorrido
-            child: Objeto Child a insertar
+            node: Raíz del subárbol
             
         Returns:
-            True si se insertó, False si el ID ya existe
+            Cantidad de nodos
+        """
+        size = 0
+        stack = [node] if node else []
+        while stack:
+            current_node = stack.pop()
+            size += 1
+            if current_node.left is not None:
+                stack.append(current_node.left)
+            if current_node.right is not None:
+                stack.append(current_node.right)
+        return size
+    
+    def _rebuild_scapegoat(self, path: List[Node]):
         """
-        # Si el ID ya existe, no se puede insertar (IDs únicos)
-        if child.id == current_node.child.id:
-            return False
-        
-        # Si el ID es menor, debe ir a la izquierda
-        if child.id < current_node.child.id:
-            # Si no hay hijo izquierdo, insertamos aquí
-            if current_node.left is None:
-                current_node.left = Node(child)
-                return True
-            # Si hay hijo izquierdo, continuamos recursivamente
-            else:
-                return self._insert_recursive(current_node.left, child)
+        Sube desde el nodo recién insertado hasta el primer ancestro cuyo hijo
+        en el camino tiene más de α · tamaño(ancestro) nodos (el chivo
+        expiatorio) y reconstruye solo ese subárbol en forma balanceada.
         
-        # Si el ID es mayor, debe ir a la derecha
-        else:
-            # Si no hay hijo derecho, insertamos aquí
-            if current_node.right is None:
-                current_node.right = Node(child)
-                return True
-            # Si hay hijo derecho, continuamos recursivamente
-            else:
-                return self._insert_recursive(current_node.right, child)
+        Args:
+            path: Camino de la raíz al nodo recién insertado
+        """
+        alpha = self.scapegoat_alpha
+        # Tamaño del subárbol del nodo del camino que se está examinando
+        size = 1
+        for index in range(len(path) - 2, -1, -1):
+            ancestor, below = path[index], path[index + 1]
+            sibling = ancestor.right if ancestor.left is below else ancestor.left
+            ancestor_size = 1 + size + self._subtree_size(sibling)
+            if size > alpha * ancestor_size:
+                rebuilt = self._rebuild_subtree(ancestor)
+                if index == 0:
+                    self.root = rebuilt
+                elif path[index - 1].left is ancestor:
+                    path[index - 1].left = rebuilt
+                else:
+                    path[index - 1].right = rebuilt
+                self.rebuilds += 1
+                return
+            size = ancestor_size
     
     def search(self, child_id: int) -> Optional[Child]:
         """
@@ -284,37 +369,127 @@ class BinarySearchTree:
         Returns:
             Objeto Child si se encuentra, None si no existe
         """
-        # Usamos el método auxiliar recursivo para buscar
-        node = self._search_recursive(self.root, child_id)
-        # Retornamos el Child del nodo encontrado, o None
-        return node.child if node else None
+        current_node = self.root
+        while current_node is not None:
+            # Si encontramos el ID, retornamos el niño
+            if child_id == current_node.child.id:
+                return current_node.child
+            # Si el ID buscado es menor, seguimos por la izquierda; si no, por la derecha
+            if child_id < current_node.child.id:
+                current_node = current_node.left
+            else:
+                current_node = current_node.right
+        return None
     
-    def _search_recursive(self, current_node: Optional[Node], child_id: int) -> Optional[Node]:
+    def delete(self, child_id: int) -> Optional[Child]:
         """
-        Método auxiliar recursivo para buscar un nodo por ID.
+        Elimina un niño por su ID.
+        Si el nodo tiene dos hijos, toma el lugar de su sucesor inorden.
+        En modo chivo expiatorio, cuando quedan menos de α · (máximo de nodos)
+        se reconstruye el árbol completo.
         
         Args:
-            current_node: Nodo actual en el recorrido
-            child_id: ID del niño a buscar
+            child_id: ID del niño a eliminar
             
         Returns:
-            Node si se encuentra, None si no existe
+            Objeto Child eliminado, o None si el ID no existe
         """
-        # Caso base: árbol vacío o nodo no encontrado
-        if current_node is None:
+        parent, node = None, self.root
+        while node is not None and node.child.id != child_id:
+            parent = node
+            node = node.left if child_id < node.child.id else node.right
+        if node is None:
             return None
         
-        # Si encontramos el ID, retornamos el nodo
-        if child_id == current_node.child.id:
-            return current_node
+        removed = node.child
+        if node.left is not None and node.right is not None:
+            # Dos hijos: copiar el sucesor y eliminar su nodo (tiene a lo sumo un hijo)
+            parent, successor = node, node.right
+            while successor.left is not None:
+                parent, successor = successor, successor.left
+            node.child = successor.child
+            node = successor
+        
+        replacement = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = replacement
+        elif parent.left is node:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        self._count -= 1
+        
+        if self.scapegoat_alpha is not None and self._count < self.scapegoat_alpha * self._max_count:
+            self.root = self._rebuild_subtree(self.root)
+            self._max_count = self._count
+            self.rebuilds += 1
+        return removed
+    
+    def update(self, child_id: int, changes: dict) -> Optional[Tuple[Child, Child]]:
+        """
+        Actualiza los datos de un niño en su mismo nodo.
+        La clave no cambia, así que la forma del árbol tampoco.
         
-        # Si el ID buscado es menor, buscamos a la izquierda
-        if child_id < current_node.child.id:
-            return self._search_recursive(current_node.left, child_id)
+        Args:
+            child_id: ID del niño a actualizar
+            changes: Campos a cambiar
+            
+        Returns:
+            Tupla (niño_anterior, niño_nuevo), o None si el ID no existe
+        """
+        current_node = self.root
+        while current_node is not None:
+            if child_id == current_node.child.id:
+                previous = current_node.child
+                current_node.child = previous.updated(changes)
+                return previous, current_node.child
+            current_node = current_node.left if child_id < current_node.child.id else current_node.right
+        return None
+    
+    def search_many(self, child_ids: List[int]) -> Tuple[List[Child], List[int]]:
+        """
+        Busca varios niños en un solo descenso ordenado del árbol.
+        Los IDs se ordenan y en cada nodo se reparten entre el subárbol
+        izquierdo y el derecho, de modo que cada nodo se visita a lo sumo
+        una vez aunque lo compartan varios caminos de búsqueda.
+        Usa una pila explícita para soportar árboles degenerados.
         
-        # Si el ID buscado es mayor, buscamos a la derecha
-        else:
-            return self._search_recursive(current_node.right, child_id)
+        Args:
+            child_ids: IDs de los niños a buscar (pueden venir repetidos o desordenados)
+            
+        Returns:
+            Tupla (niños_encontrados, ids_no_encontrados), ambas en orden ascendente
+        """
+        ids = sorted(set(child_ids))
+        found: List[Child] = []
+        missing: List[int] = []
+        
+        # Cada entrada resuelve ids[lo:hi] en un subárbol, o registra un acierto
+        # (child no es None). Se apilan en orden inverso: derecha, nodo, izquierda.
+        stack = [(self.root, 0, len(ids), None)]
+        while stack:
+            current_node, lo, hi, child = stack.pop()
+            if child is not None:
+                found.append(child)
+                continue
+            # No quedan IDs por resolver en este subárbol
+            if lo >= hi:
+                continue
+            # Si el subárbol está vacío, ninguno de los IDs restantes existe
+            if current_node is None:
+                missing.extend(ids[lo:hi])
+                continue
+            
+            # Repartir los IDs: menores a la izquierda, mayores a la derecha
+            key = current_node.child.id
+            split = bisect_left(ids, key, lo, hi)
+            hit = split < hi and ids[split] == key
+            stack.append((current_node.right, split + hit, hi, None))
+            if hit:
+                stack.append((None, 0, 0, current_node.child))
+            stack.append((current_node.left, lo, split, None))
+        
+        return found, missing
     
     def inorder_traversal(self) -> List[Child]:
         """
@@ -324,97 +499,87 @@ class BinarySearchTree:
         Returns:
             Lista de objetos Child en orden ascendente
         """
-        result = []
-        self._inorder_recursive(self.root, result)
-        return result
+        # iter_inorder usa una pila explícita: sirve también para árboles degenerados
+        return list(self.iter_inorder())
     
-    def _inorder_recursive(self, current_node: Optional[Node], result: List[Child]):
+    def iter_inorder(self, after_id: Optional[int] = None) -> Iterator[Child]:
         """
-        Método auxiliar recursivo para el recorrido inorden.
+        Iterador perezoso del recorrido inorden (orden ascendente por ID).
+        Usa una pila explícita en lugar de recursión y no construye la lista
+        completa: cada niño se produce a medida que se consume.
+        
+        Si se indica after_id, primero se hace un descenso O(log n) para
+        ubicar el primer ID mayor que after_id y el recorrido continúa desde ahí.
         
         Args:
-            current_node: Nodo actual en el recorrido
-            result: Lista que acumula los resultados
+            after_id: Si se indica, solo se recorren los IDs estrictamente mayores
+            
+        Yields:
+            Objetos Child en orden ascendente por ID
         """
-        # Caso base: si el nodo es None, no hacemos nada
-        if current_node is None:
-            return
-        
-        # 1. Recorremos el subárbol izquierdo
-        self._inorder_recursive(current_node.left, result)
+        stack: List[Node] = []
+        node = self.root
         
-        # 2. Visitamos el nodo actual (agregamos el child a la lista)
-        result.append(current_node.child)
-        
-        # 3. Recorremos el subárbol derecho
-        self._inorder_recursive(current_node.right, result)
+        # Descenso inicial: apilar los nodos cuyo ID es mayor que after_id
+        while node is not None:
+            if after_id is None or node.child.id > after_id:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        
+        # Recorrido inorden clásico con pila
+        while stack:
+            node = stack.pop()
+            yield node.child
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
     
     def preorder_traversal(self) -> List[Child]:
         """
         Recorrido preorden del árbol (raíz - izquierda - derecha).
         Este recorrido visita primero la raíz, luego los hijos.
+        Usa una pila explícita para soportar árboles degenerados.
         
         Returns:
             Lista de objetos Child en orden preorden
         """
         result = []
-        self._preorder_recursive(self.root, result)
+        stack = [self.root] if self.root else []
+        while stack:
+            current_node = stack.pop()
+            # 1. Visitamos el nodo actual primero
+            result.append(current_node.child)
+            # 2. y 3. Apilamos la derecha antes para recorrer primero la izquierda
+            if current_node.right is not None:
+                stack.append(current_node.right)
+            if current_node.left is not None:
+                stack.append(current_node.left)
         return result
     
-    def _preorder_recursive(self, current_node: Optional[Node], result: List[Child]):
-        """
-        Método auxiliar recursivo para el recorrido preorden.
-        
-        Args:
-            current_node: Nodo actual en el recorrido
-            result: Lista que acumula los resultados
-        """
-        # Caso base: si el nodo es None, no hacemos nada
-        if current_node is None:
-            return
-        
-        # 1. Visitamos el nodo actual primero
-        result.append(current_node.child)
-        
-        # 2. Recorremos el subárbol izquierdo
-        self._preorder_recursive(current_node.left, result)
-        
-        # 3. Recorremos el subárbol derecho
-        self._preorder_recursive(current_node.right, result)
-    
     def postorder_traversal(self) -> List[Child]:
         """
         Recorrido postorden del árbol (izquierda - derecha - raíz).
         Este recorrido visita los hijos antes que la raíz.
+        Se obtiene invirtiendo un recorrido raíz - derecha - izquierda.
         
         Returns:
             Lista de objetos Child en orden postorden
         """
         result = []
-        self._postorder_recursive(self.root, result)
+        stack = [self.root] if self.root else []
+        while stack:
+            current_node = stack.pop()
+            result.append(current_node.child)
+            if current_node.left is not None:
+                stack.append(current_node.left)
+            if current_node.right is not None:
+                stack.append(current_node.right)
+        result.reverse()
         return result
     
-    def _postorder_recursive(self, current_node: Optional[Node], result: List[Child]):
-        """
-        Método auxiliar recursivo para el recorrido postorden.
-        
-        Args:
-            current_node: Nodo actual en el recorrido
-            result: Lista que acumula los resultados
-        """
-        # Caso base: si el nodo es None, no hacemos nada
-        if current_node is None:
-            return
-        
-        # 1. Recorremos el subárbol izquierdo
-        self._postorder_recursive(current_node.left, result)
-        
-        # 2. Recorremos el subárbol derecho
-        self._postorder_recursive(current_node.right, result)
-        
-        # 3. Visitamos el nodo actual al final
-        result.append(current_node.child)
-    
     def get_count(self) -> int:
         """
         Retorna la cantidad total de nodos en el árbol.
@@ -440,6 +605,99 @@ class BinarySearchTree:
         """
         self.root = None
         self._count = 0
+        self._max_count = 0
+    
+    def get_tree_height(self) -> int:
+        """
+        Calcula la altura del árbol recorriéndolo por niveles.
+        
+        Returns:
+            Altura del árbol (0 si está vacío)
+        """
+        height = 0
+        level = [self.root] if self.root else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not None]
+        return height
+    
+    def rebalance(self) -> Tuple[int, int]:
+        """
+        Reorganiza el árbol en forma balanceada con el algoritmo de
+        Day–Stout–Warren: O(n) tiempo y O(1) memoria adicional.
+        
+        1. Con rotaciones a la derecha convierte el árbol en una "vara"
+           (lista enlazada por la derecha en orden ascendente).
+        2. Con rotaciones a la izquierda sobre nodos alternos de la vara
+           la comprime en un árbol completo: el último nivel queda lleno
+           de izquierda a derecha y la altura es ⌊log2 n⌋ + 1.
+        
+        Returns:
+            Tupla (altura_antes, altura_después)
+        """
+        height_before = self.get_tree_height()
+        self.root = self._rebuild_subtree(self.root)
+        return height_before, self.get_tree_height()
+    
+    def _rebuild_subtree(self, subtree_root: Optional[Node]) -> Optional[Node]:
+        """
+        Reorganiza un subárbol en forma completa con Day–Stout–Warren.
+        
+        Args:
+            subtree_root: Raíz del subárbol (sus nodos se reutilizan)
+            
+        Returns:
+            Nueva raíz del subárbol balanceado
+        """
+        # Nodo ancla temporal: su hijo derecho es la raíz del subárbol
+        anchor = Node(None)
+        anchor.right = subtree_root
+        
+        # Paso 1: árbol -> vara
+        tail = anchor
+        rest = tail.right
+        size = 0
+        while rest is not None:
+            if rest.left is None:
+                # Sin hijo izquierdo: el nodo ya está en la vara
+                tail = rest
+                rest = rest.right
+                size += 1
+            else:
+                # Rotación a la derecha sobre rest
+                pivot = rest.left
+                rest.left = pivot.right
+                pivot.right = rest
+                rest = pivot
+                tail.right = pivot
+        
+        # Paso 2: vara -> árbol balanceado
+        # Nodos que caben en el mayor árbol perfecto con a lo sumo n nodos
+        perfect = (1 << ((size + 1).bit_length() - 1)) - 1
+        self._compress(anchor, size - perfect)
+        while perfect > 1:
+            perfect //= 2
+            self._compress(anchor, perfect)
+        
+        return anchor.right
+    
+    @staticmethod
+    def _compress(anchor: Node, count: int):
+        """
+        Aplica `count` rotaciones a la izquierda sobre nodos alternos de la vara
+        que cuelga a la derecha de anchor (paso de compresión de DSW).
+        
+        Args:
+            anchor: Nodo cuya derecha es la vara
+            count: Cantidad de rotaciones
+        """
+        scanner = anchor
+        for _ in range(count):
+            child = scanner.right
+            scanner.right = child.right
+            scanner = scanner.right
+            child.right = scanner.left
+            scanner.left = child
     
     def to_tree_schema(self) -> Optional[TreeNodeSchema]:
         """
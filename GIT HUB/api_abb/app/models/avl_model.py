@@ -1,4 +1,5 @@
-from typing import Optional, List, Tuple
+from bisect import bisect_left
+from typing import Iterator, Optional, List, Tuple
 from pydantic import BaseModel, Field, validator
 from app.models.schemas import TreeNode as TreeNodeSchema
 from app.models.abb_model import Child
@@ -16,13 +17,16 @@ class AVLNode(BaseModel):
     left: Optional['AVLNode'] = Field(None, description="Referencia al hijo izquierdo (valores menores)")
     right: Optional['AVLNode'] = Field(None, description="Referencia al hijo derecho (valores mayores)")
     height: int = Field(1, description="Altura del nodo (importante para el balanceo AVL)", ge=1)
+    size: int = Field(1, description="Cantidad de nodos del subárbol (permite contar tras split/join)", ge=1)
     
     class Config:
         """
         Configuración de Pydantic para el modelo AVLNode.
         """
-        # Permite la validación al asignar valores después de la creación
-        validate_assignment = True
+        # No se valida al asignar: con validate_assignment Pydantic guarda una
+        # copia del nodo asignado y las rotaciones terminan enlazando copias
+        # (ciclos y subárboles perdidos). Los hijos se reasignan en cada rotación.
+        validate_assignment = False
         # Permite tipos arbitrarios (para referencias circulares)
         arbitrary_types_allowed = True
         # Ejemplo para documentación
@@ -31,7 +35,8 @@ class AVLNode(BaseModel):
                 "child": {"id": 10, "name": "Lucas", "age": 7},
                 "left": None,
                 "right": None,
-                "height": 1
+                "height": 1,
+                "size": 1
             }
         }
     
@@ -94,6 +99,8 @@ class AVLTree:
         self.root: Optional[AVLNode] = None
         # Contador de nodos en el árbol
         self._count: int = 0
+        # Rotaciones simples hechas desde la creación (doble rotación = 2)
+        self.rotations: int = 0
     
     def _get_height(self, node: Optional[AVLNode]) -> int:
         """
@@ -116,12 +123,15 @@ class AVLTree:
         """
         Actualiza la altura de un nodo basándose en las alturas de sus hijos.
         La altura de un nodo es 1 + el máximo de las alturas de sus hijos.
+        También actualiza el tamaño del subárbol.
         
         Args:
             node: Nodo cuya altura se va a actualizar
         """
         # La altura es 1 más el máximo de las alturas de los hijos
         node.height = 1 + max(self._get_height(node.left), self._get_height(node.right))
+        # El tamaño es 1 más los tamaños de los hijos
+        node.size = 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
     
     def _get_balance_factor(self, node: Optional[AVLNode]) -> int:
         """
@@ -172,6 +182,7 @@ class AVLTree:
         # Actualizar alturas (primero z, luego y)
         self._update_height(z)
         self._update_height(y)
+        self.rotations += 1
         
         # Retornar la nueva raíz
         return y
@@ -206,6 +217,7 @@ class AVLTree:
         # Actualizar alturas (primero z, luego y)
         self._update_height(z)
         self._update_height(y)
+        self.rotations += 1
         
         # Retornar la nueva raíz
         return y
@@ -317,6 +329,264 @@ class AVLTree:
         
         return True, node
     
+    # ==================== SPLIT Y JOIN ====================
+    
+    @classmethod
+    def _from_root(cls, root: Optional[AVLNode]) -> "AVLTree":
+        """
+        Crea un árbol a partir de una raíz ya balanceada.
+        
+        Args:
+            root: Raíz del árbol (puede ser None)
+            
+        Returns:
+            AVLTree con esa raíz y su contador calculado en O(1)
+        """
+        tree = cls()
+        tree.root = root
+        tree._count = root.size if root else 0
+        return tree
+    
+    def _join3(self, left: Optional[AVLNode], node: AVLNode, right: Optional[AVLNode]) -> AVLNode:
+        """
+        Une dos subárboles AVL con un nodo intermedio (claves left < node < right).
+        Desciende por el lado del árbol más alto hasta un subárbol de altura
+        similar a la del otro y rebalancea en el camino de vuelta: O(|h(left) - h(right)| + 1).
+        
+        Args:
+            left: Subárbol con claves menores
+            node: Nodo que queda entre ambos (se reutiliza)
+            right: Subárbol con claves mayores
+            
+        Returns:
+            Raíz del árbol unido
+        """
+        left_height, right_height = self._get_height(left), self._get_height(right)
+        
+        # El izquierdo es más alto: colgar la unión en su borde derecho
+        if left_height > right_height + 1:
+            left.right = self._join3(left.right, node, right)
+            return self._rebalance(left)
+        
+        # El derecho es más alto: colgar la unión en su borde izquierdo
+        if right_height > left_height + 1:
+            right.left = self._join3(left, node, right.left)
+            return self._rebalance(right)
+        
+        # Alturas similares: el nodo intermedio es la nueva raíz
+        node.left = left
+        node.right = right
+        self._update_height(node)
+        return node
+    
+    def _split(self, node: Optional[AVLNode], key: int) -> Tuple[Optional[AVLNode], Optional[AVLNode], Optional[AVLNode]]:
+        """
+        Divide un subárbol por una clave en O(log n) usando _join3.
+        
+        Args:
+            node: Raíz del subárbol (sus nodos se reutilizan)
+            key: Clave de corte
+            
+        Returns:
+            Tupla (claves menores, nodo con la clave o None, claves mayores)
+        """
+        if node is None:
+            return None, None, None
+        
+        left, right = node.left, node.right
+        if key < node.child.id:
+            smaller, found, greater = self._split(left, key)
+            return smaller, found, self._join3(greater, node, right)
+        if key > node.child.id:
+            smaller, found, greater = self._split(right, key)
+            return self._join3(left, node, smaller), found, greater
+        
+        # El nodo tiene la clave: se separa de sus hijos
+        node.left = node.right = None
+        self._update_height(node)
+        return left, node, right
+    
+    def _pop_min(self, node: AVLNode) -> Tuple[AVLNode, Optional[AVLNode]]:
+        """
+        Quita el nodo de menor clave de un subárbol y lo rebalancea.
+        
+        Args:
+            node: Raíz del subárbol (no vacío)
+            
+        Returns:
+            Tupla (nodo mínimo desenganchado, nueva raíz del subárbol)
+        """
+        if node.left is None:
+            rest = node.right
+            node.right = None
+            self._update_height(node)
+            return node, rest
+        
+        minimum, node.left = self._pop_min(node.left)
+        return minimum, self._rebalance(node)
+    
+    def split(self, key: int) -> Tuple["AVLTree", "AVLTree"]:
+        """
+        Divide el árbol en O(log n): el izquierdo queda con los IDs menores
+        que key y el derecho con los IDs mayores o iguales.
+        Los nodos se mueven a los árboles nuevos y este árbol queda vacío.
+        
+        Args:
+            key: ID de corte
+            
+        Returns:
+            Tupla (árbol con IDs < key, árbol con IDs >= key)
+        """
+        smaller, found, greater = self._split(self.root, key)
+        if found is not None:
+            greater = self._join3(None, found, greater)
+        self.clear()
+        return AVLTree._from_root(smaller), AVLTree._from_root(greater)
+    
+    @staticmethod
+    def join(left: "AVLTree", right: "AVLTree") -> "AVLTree":
+        """
+        Une dos árboles cuyos IDs no se solapan en O(log n).
+        Usa el mínimo del derecho como nodo intermedio de _join3.
+        Los nodos se mueven al árbol resultante y ambos árboles quedan vacíos.
+        
+        Args:
+            left: Árbol con los IDs menores
+            right: Árbol con los IDs mayores
+            
+        Returns:
+            Árbol AVL con todos los niños
+            
+        Raises:
+            ValueError: Si algún ID de left no es menor que todos los de right
+        """
+        if left.root is None or right.root is None:
+            result = AVLTree._from_root(left.root or right.root)
+        else:
+            # Máximo de left y mínimo de right: bordes de cada árbol
+            node = left.root
+            while node.right is not None:
+                node = node.right
+            max_left = node.child.id
+            node = right.root
+            while node.left is not None:
+                node = node.left
+            if max_left >= node.child.id:
+                raise ValueError("Los IDs del árbol izquierdo deben ser menores que los del derecho")
+            
+            middle, rest = right._pop_min(right.root)
+            result = AVLTree._from_root(left._join3(left.root, middle, rest))
+        
+        left.clear()
+        right.clear()
+        return result
+    
+    @classmethod
+    def from_sorted(cls, children: List[Child]) -> "AVLTree":
+        """
+        Construye un árbol perfectamente balanceado en O(n) a partir de
+        niños ordenados por ID, sin rotaciones.
+        
+        Args:
+            children: Niños ordenados por ID y sin repetidos
+            
+        Returns:
+            AVLTree con todos los niños
+        """
+        def build(lo: int, hi: int) -> Optional[AVLNode]:
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = AVLNode(child=children[mid])
+            node.left = build(lo, mid)
+            node.right = build(mid + 1, hi)
+            tree._update_height(node)
+            return node
+        
+        tree = cls()
+        tree.root = build(0, len(children))
+        tree._count = len(children)
+        return tree
+    
+    def delete_range(self, min_id: int, max_id: int) -> List[Child]:
+        """
+        Elimina todos los niños con min_id <= ID <= max_id con dos split y un join:
+        O(log n) más el recorrido de los k niños eliminados.
+        
+        Args:
+            min_id: ID mínimo (incluido)
+            max_id: ID máximo (incluido)
+            
+        Returns:
+            Lista de niños eliminados, en orden ascendente
+        """
+        before, rest = self.split(min_id)
+        removed, after = rest.split(max_id + 1)
+        joined = AVLTree.join(before, after)
+        self.root, self._count = joined.root, joined._count
+        return removed.inorder_traversal()
+    
+    def delete(self, child_id: int) -> Optional[Child]:
+        """
+        Elimina un niño por su ID con split/join (un rango de un solo ID).
+        
+        Args:
+            child_id: ID del niño a eliminar
+            
+        Returns:
+            Objeto Child eliminado, o None si el ID no existe
+        """
+        removed = self.delete_range(child_id, child_id)
+        return removed[0] if removed else None
+    
+    def merge(self, other: "AVLTree") -> List[Child]:
+        """
+        Incorpora los niños de otro árbol (unión por split/join).
+        Los IDs que ya existen se conservan y el niño del otro árbol se descarta.
+        Si los rangos de IDs no se solapan cuesta O(log n); en general
+        O(m · log(n / m + 1)) para m niños nuevos. El otro árbol queda vacío.
+        
+        Args:
+            other: Árbol con los niños a incorporar
+            
+        Returns:
+            Lista de niños de other descartados por ID repetido
+        """
+        duplicates: List[Child] = []
+        self.root = self._union(self.root, other.root, duplicates)
+        self._count = self.root.size if self.root else 0
+        other.clear()
+        return duplicates
+    
+    def _union(self, node: Optional[AVLNode], other: Optional[AVLNode], duplicates: List[Child]) -> Optional[AVLNode]:
+        """
+        Método auxiliar recursivo de merge.
+        Divide este subárbol por la raíz del otro y une recursivamente cada lado.
+        
+        Args:
+            node: Subárbol de este árbol
+            other: Subárbol del otro árbol
+            duplicates: Lista que acumula los niños descartados
+            
+        Returns:
+            Raíz de la unión
+        """
+        if other is None:
+            return node
+        if node is None:
+            return other
+        
+        pivot, other_left, other_right = other, other.left, other.right
+        smaller, found, greater = self._split(node, pivot.child.id)
+        if found is not None:
+            # El ID ya existía: se conserva el niño actual
+            duplicates.append(pivot.child)
+            pivot = found
+        
+        left = self._union(smaller, other_left, duplicates)
+        right = self._union(greater, other_right, duplicates)
+        return self._join3(left, pivot, right)
+    
     def search(self, child_id: int) -> Optional[Child]:
         """
         Busca un niño en el árbol por su ID.
@@ -360,6 +630,79 @@ class AVLTree:
         else:
             return self._search_recursive(node.right, child_id)
     
+    def update(self, child_id: int, changes: dict) -> Optional[Tuple[Child, Child]]:
+        """
+        Actualiza los datos de un niño en su mismo nodo.
+        La clave no cambia: no hay rotaciones ni cambios de altura.
+        
+        Args:
+            child_id: ID del niño a actualizar
+            changes: Campos a cambiar
+            
+        Returns:
+            Tupla (niño_anterior, niño_nuevo), o None si el ID no existe
+        """
+        node = self._search_recursive(self.root, child_id)
+        if node is None:
+            return None
+        previous = node.child
+        node.child = previous.updated(changes)
+        return previous, node.child
+    
+    def search_many(self, child_ids: List[int]) -> Tuple[List[Child], List[int]]:
+        """
+        Busca varios niños en un solo descenso ordenado del árbol.
+        Los IDs se ordenan y en cada nodo se reparten entre el subárbol
+        izquierdo y el derecho, de modo que cada nodo se visita a lo sumo
+        una vez aunque lo compartan varios caminos de búsqueda.
+        
+        Args:
+            child_ids: IDs de los niños a buscar (pueden venir repetidos o desordenados)
+            
+        Returns:
+            Tupla (niños_encontrados, ids_no_encontrados), ambas en orden ascendente
+        """
+        ids = sorted(set(child_ids))
+        found: List[Child] = []
+        missing: List[int] = []
+        self._search_many_recursive(self.root, ids, 0, len(ids), found, missing)
+        return found, missing
+    
+    def _search_many_recursive(self, node: Optional[AVLNode], ids: List[int],
+                               lo: int, hi: int, found: List[Child], missing: List[int]):
+        """
+        Método auxiliar recursivo para la búsqueda múltiple.
+        Resuelve los IDs ids[lo:hi] dentro del subárbol de node.
+        
+        Args:
+            node: Nodo actual en el recorrido
+            ids: Lista ordenada de IDs buscados
+            lo: Índice inicial del rango de IDs (incluido)
+            hi: Índice final del rango de IDs (excluido)
+            found: Lista que acumula los niños encontrados
+            missing: Lista que acumula los IDs no encontrados
+        """
+        # Caso base: no quedan IDs por resolver en este subárbol
+        if lo >= hi:
+            return
+        
+        # Si el subárbol está vacío, ninguno de los IDs restantes existe
+        if node is None:
+            missing.extend(ids[lo:hi])
+            return
+        
+        # Repartir los IDs: menores a la izquierda, mayores a la derecha
+        key = node.child.id
+        split = bisect_left(ids, key, lo, hi)
+        self._search_many_recursive(node.left, ids, lo, split, found, missing)
+        
+        # Si el ID del nodo actual fue solicitado, es un acierto
+        if split < hi and ids[split] == key:
+            found.append(node.child)
+            split += 1
+        
+        self._search_many_recursive(node.right, ids, split, hi, found, missing)
+    
     def inorder_traversal(self) -> List[Child]:
         """
         Recorrido inorden del árbol (izquierda - raíz - derecha).
@@ -393,6 +736,41 @@ class AVLTree:
         # 3. Recorremos el subárbol derecho
         self._inorder_recursive(node.right, result)
     
+    def iter_inorder(self, after_id: Optional[int] = None) -> Iterator[Child]:
+        """
+        Iterador perezoso del recorrido inorden (orden ascendente por ID).
+        Usa una pila explícita en lugar de recursión y no construye la lista
+        completa: cada niño se produce a medida que se consume.
+        
+        Si se indica after_id, primero se hace un descenso O(log n) para
+        ubicar el primer ID mayor que after_id y el recorrido continúa desde ahí.
+        
+        Args:
+            after_id: Si se indica, solo se recorren los IDs estrictamente mayores
+            
+        Yields:
+            Objetos Child en orden ascendente por ID
+        """
+        stack: List[AVLNode] = []
+        node = self.root
+        
+        # Descenso inicial: apilar los nodos cuyo ID es mayor que after_id
+        while node is not None:
+            if after_id is None or node.child.id > after_id:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        
+        # Recorrido inorden clásico con pila
+        while stack:
+            node = stack.pop()
+            yield node.child
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+    
     def preorder_traversal(self) -> List[Child]:
         """
         Recorrido preorden del árbol (raíz - izquierda - derecha).
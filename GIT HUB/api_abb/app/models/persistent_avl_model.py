@@ -0,0 +1,571 @@
+import threading
+from bisect import bisect_left
+from typing import Iterator, List, Optional, Tuple
+from app.models.schemas import TreeNode as TreeNodeSchema
+from app.models.abb_model import Child
+
+
+class PersistentAVLNode:
+    """
+    Nodo inmutable del AVL persistente.
+    Una vez creado no se modifica: las inserciones crean nodos nuevos en el
+    camino de la raíz a la hoja y reutilizan el resto de los subárboles.
+    """
+
+    __slots__ = ("child", "left", "right", "height")
+
+    def __init__(self, child: Child, left: Optional["PersistentAVLNode"], right: Optional["PersistentAVLNode"]):
+        """
+        Constructor del nodo. La altura se calcula a partir de los hijos.
+
+        Args:
+            child: Datos del niño almacenado en este nodo
+            left: Subárbol izquierdo (valores menores)
+            right: Subárbol derecho (valores mayores)
+        """
+        self.child = child
+        self.left = left
+        self.right = right
+        self.height = 1 + max(_height(left), _height(right))
+
+    def to_tree_node_schema(self) -> TreeNodeSchema:
+        """
+        Convierte el nodo y sus descendientes a un esquema TreeNode.
+
+        Returns:
+            TreeNodeSchema con la estructura del nodo y sus descendientes
+        """
+        return TreeNodeSchema(
+            child=self.child.to_response(),
+            left=self.left.to_tree_node_schema() if self.left else None,
+            right=self.right.to_tree_node_schema() if self.right else None
+        )
+
+    def __str__(self) -> str:
+        """Representación en string del nodo para debugging"""
+        return f"PersistentAVLNode({self.child}, height={self.height})"
+
+
+def _height(node: Optional[PersistentAVLNode]) -> int:
+    """Altura de un nodo (0 para None)."""
+    return node.height if node is not None else 0
+
+
+def _balance(child: Child, left: Optional[PersistentAVLNode], right: Optional[PersistentAVLNode]) -> PersistentAVLNode:
+    """
+    Crea un nodo con los hijos dados aplicando la rotación AVL que haga falta.
+    Las rotaciones también crean nodos nuevos: los subárboles recibidos no cambian.
+
+    Args:
+        child: Niño del nodo
+        left: Subárbol izquierdo
+        right: Subárbol derecho
+
+    Returns:
+        Raíz del subárbol balanceado
+    """
+    left_height, right_height = _height(left), _height(right)
+
+    if left_height > right_height + 1:
+        if _height(left.left) >= _height(left.right):
+            # Caso Izquierda-Izquierda: rotación simple a la derecha
+            return PersistentAVLNode(left.child, left.left, PersistentAVLNode(child, left.right, right))
+        # Caso Izquierda-Derecha: rotación doble
+        pivot = left.right
+        return PersistentAVLNode(
+            pivot.child,
+            PersistentAVLNode(left.child, left.left, pivot.left),
+            PersistentAVLNode(child, pivot.right, right)
+        )
+
+    if right_height > left_height + 1:
+        if _height(right.right) >= _height(right.left):
+            # Caso Derecha-Derecha: rotación simple a la izquierda
+            return PersistentAVLNode(right.child, PersistentAVLNode(child, left, right.left), right.right)
+        # Caso Derecha-Izquierda: rotación doble
+        pivot = right.left
+        return PersistentAVLNode(
+            pivot.child,
+            PersistentAVLNode(child, left, pivot.left),
+            PersistentAVLNode(right.child, pivot.right, right.right)
+        )
+
+    return PersistentAVLNode(child, left, right)
+
+
+def _insert(node: Optional[PersistentAVLNode], child: Child) -> Optional[PersistentAVLNode]:
+    """
+    Inserta copiando solo el camino de la raíz al punto de inserción.
+
+    Args:
+        node: Raíz del subárbol (no se modifica)
+        child: Niño a insertar
+
+    Returns:
+        Raíz de la nueva versión del subárbol, o None si el ID ya existe
+    """
+    if node is None:
+        return PersistentAVLNode(child, None, None)
+    if child.id < node.child.id:
+        left = _insert(node.left, child)
+        return None if left is None else _balance(node.child, left, node.right)
+    if child.id > node.child.id:
+        right = _insert(node.right, child)
+        return None if right is None else _balance(node.child, node.left, right)
+    return None
+
+
+def _pop_min(node: PersistentAVLNode) -> Tuple[Child, Optional[PersistentAVLNode]]:
+    """
+    Quita el menor niño de un subárbol copiando el camino izquierdo.
+
+    Args:
+        node: Raíz del subárbol (no vacío, no se modifica)
+
+    Returns:
+        Tupla (menor niño, raíz de la nueva versión del subárbol)
+    """
+    if node.left is None:
+        return node.child, node.right
+    minimum, left = _pop_min(node.left)
+    return minimum, _balance(node.child, left, node.right)
+
+
+def _delete(node: Optional[PersistentAVLNode], child_id: int) -> Optional[Tuple[Optional[PersistentAVLNode], Child]]:
+    """
+    Elimina un niño copiando solo el camino afectado y rebalanceando.
+
+    Args:
+        node: Raíz del subárbol (no se modifica)
+        child_id: ID del niño a eliminar
+
+    Returns:
+        Tupla (raíz de la nueva versión, niño eliminado), o None si el ID no existe
+    """
+    if node is None:
+        return None
+    if child_id < node.child.id:
+        result = _delete(node.left, child_id)
+        return None if result is None else (_balance(node.child, result[0], node.right), result[1])
+    if child_id > node.child.id:
+        result = _delete(node.right, child_id)
+        return None if result is None else (_balance(node.child, node.left, result[0]), result[1])
+    if node.left is None or node.right is None:
+        return (node.left or node.right), node.child
+    # Dos hijos: el sucesor ocupa el lugar del nodo eliminado
+    successor, right = _pop_min(node.right)
+    return _balance(successor, node.left, right), node.child
+
+
+def _update(node: Optional[PersistentAVLNode], child_id: int,
+            changes: dict) -> Optional[Tuple[PersistentAVLNode, Child, Child]]:
+    """
+    Actualiza un niño copiando solo el camino hasta su nodo.
+    Las alturas no cambian, así que no hace falta rebalancear.
+
+    Args:
+        node: Raíz del subárbol (no se modifica)
+        child_id: ID del niño a actualizar
+        changes: Campos a cambiar
+
+    Returns:
+        Tupla (raíz de la nueva versión, niño anterior, niño nuevo),
+        o None si el ID no existe
+    """
+    if node is None:
+        return None
+    if child_id == node.child.id:
+        child = node.child.updated(changes)
+        return PersistentAVLNode(child, node.left, node.right), node.child, child
+    result = _update(node.left if child_id < node.child.id else node.right, child_id, changes)
+    if result is None:
+        return None
+    subtree, previous, child = result
+    if child_id < node.child.id:
+        return PersistentAVLNode(node.child, subtree, node.right), previous, child
+    return PersistentAVLNode(node.child, node.left, subtree), previous, child
+
+
+class PersistentAVLSnapshot:
+    """
+    Versión inmutable de un AVL persistente: raíz y cantidad de nodos.
+
+    Todas las lecturas trabajan sobre la raíz capturada, así que un recorrido
+    largo ve siempre el mismo árbol aunque se publiquen versiones nuevas.
+    Cuando nadie referencia una versión, el conteo de referencias de Python
+    libera los nodos que no comparte con las versiones vigentes.
+    """
+
+    def __init__(self, root: Optional[PersistentAVLNode] = None, count: int = 0):
+        """
+        Constructor de la versión.
+
+        Args:
+            root: Raíz de la versión
+            count: Cantidad de nodos de la versión
+        """
+        # Raíz y contador se publican juntos en una sola asignación atómica
+        self._state: Tuple[Optional[PersistentAVLNode], int] = (root, count)
+
+    @property
+    def root(self) -> Optional[PersistentAVLNode]:
+        """Raíz de la versión (None si está vacía)"""
+        return self._state[0]
+
+    def search(self, child_id: int) -> Optional[Child]:
+        """
+        Busca un niño por su ID.
+
+        Args:
+            child_id: ID del niño a buscar
+
+        Returns:
+            Objeto Child si se encuentra, None si no existe
+        """
+        node = self._state[0]
+        while node is not None:
+            if child_id == node.child.id:
+                return node.child
+            node = node.left if child_id < node.child.id else node.right
+        return None
+
+    def search_many(self, child_ids: List[int]) -> Tuple[List[Child], List[int]]:
+        """
+        Busca varios niños en un único descenso, repartiendo los IDs
+        ordenados entre los subárboles como en AVLTree.search_many.
+
+        Args:
+            child_ids: IDs de los niños a buscar (pueden venir repetidos o desordenados)
+
+        Returns:
+            Tupla (niños_encontrados, ids_no_encontrados), ambas en orden ascendente
+        """
+        found: List[Child] = []
+        missing: List[int] = []
+        self._search_many_recursive(self._state[0], sorted(set(child_ids)), found, missing)
+        return found, missing
+
+    def _search_many_recursive(self, node: Optional[PersistentAVLNode], ids: List[int],
+                               found: List[Child], missing: List[int]):
+        """
+        Método auxiliar recursivo de search_many.
+
+        Args:
+            node: Nodo actual
+            ids: IDs ordenados que pueden estar en el subárbol del nodo
+            found: Lista que acumula los niños encontrados (en orden)
+            missing: Lista que acumula los IDs no encontrados (en orden)
+        """
+        if not ids:
+            return
+        if node is None:
+            missing.extend(ids)
+            return
+        key = node.child.id
+        index = bisect_left(ids, key)
+        self._search_many_recursive(node.left, ids[:index], found, missing)
+        if index < len(ids) and ids[index] == key:
+            found.append(node.child)
+            index += 1
+        self._search_many_recursive(node.right, ids[index:], found, missing)
+
+    def inorder_traversal(self) -> List[Child]:
+        """
+        Recorrido inorden (orden ascendente por ID).
+
+        Returns:
+            Lista de objetos Child en orden ascendente
+        """
+        return list(self.iter_inorder())
+
+    def iter_inorder(self, after_id: Optional[int] = None) -> Iterator[Child]:
+        """
+        Iterador perezoso del recorrido inorden con pila explícita.
+        Captura la raíz al empezar: sigue sobre la misma versión aunque
+        el árbol reciba inserciones mientras se consume.
+
+        Args:
+            after_id: Si se indica, solo se recorren los IDs estrictamente mayores
+
+        Yields:
+            Objetos Child en orden ascendente por ID
+        """
+        stack: List[PersistentAVLNode] = []
+        node = self._state[0]
+        while node is not None:
+            if after_id is None or node.child.id > after_id:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+
+        while stack:
+            node = stack.pop()
+            yield node.child
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def preorder_traversal(self) -> List[Child]:
+        """
+        Recorrido preorden (raíz - izquierda - derecha).
+
+        Returns:
+            Lista de objetos Child en orden preorden
+        """
+        result = []
+        stack = [self._state[0]] if self._state[0] is not None else []
+        while stack:
+            node = stack.pop()
+            result.append(node.child)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+        return result
+
+    def postorder_traversal(self) -> List[Child]:
+        """
+        Recorrido postorden (izquierda - derecha - raíz).
+        Se obtiene invirtiendo un recorrido raíz - derecha - izquierda.
+
+        Returns:
+            Lista de objetos Child en orden postorden
+        """
+        result = []
+        stack = [self._state[0]] if self._state[0] is not None else []
+        while stack:
+            node = stack.pop()
+            result.append(node.child)
+            if node.left is not None:
+                stack.append(node.left)
+            if node.right is not None:
+                stack.append(node.right)
+        result.reverse()
+        return result
+
+    def get_count(self) -> int:
+        """
+        Retorna la cantidad de nodos de la versión.
+
+        Returns:
+            Número de niños
+        """
+        return self._state[1]
+
+    def is_empty(self) -> bool:
+        """
+        Verifica si la versión está vacía.
+
+        Returns:
+            True si no hay niños, False si hay al menos uno
+        """
+        return self._state[0] is None
+
+    def get_tree_height(self) -> int:
+        """
+        Altura del árbol (guardada en la raíz).
+
+        Returns:
+            Altura del árbol (0 si está vacío)
+        """
+        return _height(self._state[0])
+
+    def is_balanced(self) -> bool:
+        """
+        Verifica la propiedad AVL en todos los nodos.
+
+        Returns:
+            True si todos los nodos tienen factor de balance entre -1 y 1
+        """
+        def check(node: Optional[PersistentAVLNode]) -> bool:
+            if node is None:
+                return True
+            if abs(_height(node.left) - _height(node.right)) > 1:
+                return False
+            return check(node.left) and check(node.right)
+
+        return check(self._state[0])
+
+    def to_tree_schema(self) -> Optional[TreeNodeSchema]:
+        """
+        Convierte la versión a un esquema TreeNode.
+
+        Returns:
+            TreeNodeSchema con la estructura completa, o None si está vacía
+        """
+        root = self._state[0]
+        if root is None:
+            return None
+        return root.to_tree_node_schema()
+
+
+class PersistentAVLTree(PersistentAVLSnapshot):
+    """
+    AVL persistente (copia de camino) con la misma interfaz que AVLTree.
+
+    Cada inserción copia solo los O(log n) nodos del camino modificado y
+    publica la nueva raíz con una única asignación atómica. Los lectores no
+    toman ningún candado: cada operación de lectura captura la raíz vigente y
+    trabaja sobre esa versión, y snapshot() entrega una versión estable para
+    varias lecturas consistentes. Solo los escritores se serializan entre sí.
+    """
+
+    def __init__(self):
+        """
+        Constructor de la clase PersistentAVLTree.
+        Inicializa un árbol vacío.
+        """
+        super().__init__()
+        # Serializa a los escritores; los lectores nunca lo toman
+        self._write_lock = threading.Lock()
+
+    def snapshot(self) -> PersistentAVLSnapshot:
+        """
+        Versión actual del árbol, inmutable. Cuesta O(1).
+
+        Returns:
+            PersistentAVLSnapshot con la raíz y la cantidad vigentes
+        """
+        root, count = self._state
+        return PersistentAVLSnapshot(root, count)
+
+    def batch(self) -> "PersistentAVLBatch":
+        """
+        Abre un lote de escrituras que se publica como una sola versión.
+        Se usa en un bloque with: toma el candado de escritura al entrar y,
+        al salir sin error, publica la raíz local del lote; si el bloque
+        termina con una excepción, la raíz local se descarta.
+
+        Returns:
+            PersistentAVLBatch con insert, update y delete
+        """
+        return PersistentAVLBatch(self)
+
+    def insert(self, child: Child) -> bool:
+        """
+        Inserta un niño creando una nueva versión del árbol.
+
+        Args:
+            child: Objeto Child a insertar
+
+        Returns:
+            True si se insertó correctamente, False si el ID ya existe
+        """
+        with self.batch() as batch:
+            return batch.insert(child)
+
+    def delete(self, child_id: int) -> Optional[Child]:
+        """
+        Elimina un niño publicando una versión nueva.
+        Las versiones tomadas antes lo siguen viendo.
+
+        Args:
+            child_id: ID del niño a eliminar
+
+        Returns:
+            Objeto Child eliminado, o None si el ID no existe
+        """
+        with self.batch() as batch:
+            return batch.delete(child_id)
+
+    def update(self, child_id: int, changes: dict) -> Optional[Tuple[Child, Child]]:
+        """
+        Actualiza los datos de un niño publicando una versión nueva.
+        Las versiones tomadas antes siguen viendo los datos anteriores.
+
+        Args:
+            child_id: ID del niño a actualizar
+            changes: Campos a cambiar
+
+        Returns:
+            Tupla (niño_anterior, niño_nuevo), o None si el ID no existe
+        """
+        with self.batch() as batch:
+            return batch.update(child_id, changes)
+
+    def clear(self):
+        """
+        Publica una versión vacía. Las versiones tomadas antes siguen válidas.
+        """
+        with self._write_lock:
+            self._state = (None, 0)
+
+
+class PersistentAVLBatch:
+    """
+    Escrituras sobre una raíz local de un PersistentAVLTree.
+
+    Las operaciones avanzan la raíz y la cantidad del lote sin tocar la
+    versión publicada, así que los lectores nunca ven un lote a medias.
+    Al salir del bloque with sin error se publica la raíz local con una
+    única asignación atómica; con error se descarta (no hace falta deshacer
+    nada: las versiones anteriores son inmutables).
+    """
+
+    __slots__ = ("_tree", "_root", "_count")
+
+    def __init__(self, tree: PersistentAVLTree):
+        """
+        Args:
+            tree: Árbol sobre el que se publica el lote
+        """
+        self._tree = tree
+
+    def __enter__(self) -> "PersistentAVLBatch":
+        self._tree._write_lock.acquire()
+        self._root, self._count = self._tree._state
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        try:
+            if exc_type is None and self._root is not self._tree._state[0]:
+                # Publicación atómica de la versión final del lote
+                self._tree._state = (self._root, self._count)
+        finally:
+            self._tree._write_lock.release()
+
+    def get_count(self) -> int:
+        """Cantidad de nodos de la raíz local."""
+        return self._count
+
+    def insert(self, child: Child) -> bool:
+        """
+        Inserta un niño en la raíz local.
+
+        Returns:
+            True si se insertó, False si el ID ya existe
+        """
+        new_root = _insert(self._root, child)
+        if new_root is None:
+            return False
+        self._root, self._count = new_root, self._count + 1
+        return True
+
+    def delete(self, child_id: int) -> Optional[Child]:
+        """
+        Elimina un niño de la raíz local.
+
+        Returns:
+            Objeto Child eliminado, o None si el ID no existe
+        """
+        result = _delete(self._root, child_id)
+        if result is None:
+            return None
+        self._root, removed = result
+        self._count -= 1
+        return removed
+
+    def update(self, child_id: int, changes: dict) -> Optional[Tuple[Child, Child]]:
+        """
+        Actualiza un niño en la raíz local.
+
+        Returns:
+            Tupla (niño_anterior, niño_nuevo), o None si el ID no existe
+        """
+        result = _update(self._root, child_id, changes)
+        if result is None:
+            return None
+        self._root, previous, child = result
+        return previous, child
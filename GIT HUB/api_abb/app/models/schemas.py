@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, root_validator
 from typing import Optional, List
 from enum import Enum
 
@@ -10,6 +10,12 @@ class Gender(str, Enum):
     OTHER = "other"
 
 
+class ExportFormat(str, Enum):
+    """Formatos disponibles para exportar el árbol."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 # ========== ESQUEMAS PARA NIÑO (CHILD) ==========
 
 class ChildCreate(BaseModel):
@@ -36,6 +42,28 @@ class ChildCreate(BaseModel):
         }
 
 
+class ChildUpdate(BaseModel):
+    """
+    Esquema para actualizar parcialmente un niño (PATCH).
+    Solo se cambian los campos enviados; el ID es la clave y no se modifica.
+    """
+    name: Optional[str] = Field(None, description="Nombre del niño", min_length=1, max_length=100)
+    age: Optional[int] = Field(None, description="Edad del niño", ge=0, le=150)
+    city: Optional[str] = Field(None, description="Ciudad de origen del niño", min_length=1, max_length=100)
+    gender: Optional[Gender] = Field(None, description="Género del niño (male, female, other)")
+
+    class Config:
+        # Previene campos extra (por ejemplo, intentar cambiar el ID)
+        extra = 'forbid'
+        # Ejemplo para documentación de la API
+        json_schema_extra = {
+            "example": {
+                "age": 8,
+                "city": "Medellín"
+            }
+        }
+
+
 class ChildResponse(BaseModel):
     """
     Esquema de respuesta que representa un niño.
@@ -60,6 +88,230 @@ class ChildResponse(BaseModel):
         }
 
 
+# ========== ESQUEMAS PARA BÚSQUEDA APROXIMADA ==========
+
+class FuzzyMatchResponse(BaseModel):
+    """
+    Esquema de un resultado de la búsqueda aproximada por nombre.
+    """
+    child: ChildResponse = Field(..., description="Niño encontrado")
+    score: float = Field(..., description="Similitud de trigramas con la consulta (0 a 1)")
+
+
+# ========== ESQUEMAS PARA BÚSQUEDA MÚLTIPLE ==========
+
+# Máximo de IDs aceptados en una búsqueda múltiple
+MAX_LOOKUP_IDS = 1000
+
+
+class ChildLookupRequest(BaseModel):
+    """
+    Esquema para buscar varios niños en una sola petición.
+    """
+    ids: List[int] = Field(
+        ...,
+        description="IDs de los niños a buscar",
+        min_items=1,
+        max_items=MAX_LOOKUP_IDS
+    )
+
+    class Config:
+        # Ejemplo para documentación de la API
+        json_schema_extra = {
+            "example": {
+                "ids": [10, 5, 42]
+            }
+        }
+
+
+class ChildLookupResponse(BaseModel):
+    """
+    Esquema de respuesta de la búsqueda múltiple.
+    Separa los niños encontrados de los IDs que no existen en el árbol.
+    """
+    found: List[ChildResponse] = Field(..., description="Niños encontrados, ordenados por ID")
+    missing: List[int] = Field(..., description="IDs solicitados que no existen en el árbol")
+    total_found: int = Field(..., description="Cantidad de niños encontrados")
+    total_missing: int = Field(..., description="Cantidad de IDs no encontrados")
+
+
+# ========== ESQUEMAS PARA UNIÓN DE CONJUNTOS ==========
+
+# Máximo de niños aceptados en una unión en bloque
+MAX_MERGE_CHILDREN = 10000
+
+
+class ChildMergeRequest(BaseModel):
+    """
+    Esquema para incorporar un conjunto de niños al árbol en bloque.
+    """
+    children: List[ChildCreate] = Field(
+        ...,
+        description="Niños a incorporar (los IDs existentes se conservan)",
+        min_items=1,
+        max_items=MAX_MERGE_CHILDREN
+    )
+
+
+# ========== ESQUEMAS PARA LOTES ATÓMICOS ==========
+
+# Máximo de operaciones aceptadas en un lote
+MAX_BATCH_ITEMS = 50000
+
+
+class BatchOperationType(str, Enum):
+    """Operaciones permitidas dentro de un lote."""
+    INSERT = "insert"
+    UPDATE = "update"
+    UPSERT = "upsert"
+    DELETE = "delete"
+
+
+class BatchItem(BaseModel):
+    """
+    Una operación de un lote:
+    - insert: agrega un niño (falla si el ID existe); requiere todos los campos
+    - update: cambia los campos enviados (falla si el ID no existe)
+    - upsert: agrega el niño o reemplaza sus datos; requiere todos los campos
+    - delete: elimina el niño (falla si el ID no existe); no lleva campos
+    """
+    op: BatchOperationType = Field(..., description="Operación: insert, update, upsert o delete")
+    id: int = Field(..., description="ID del niño", gt=0)
+    name: Optional[str] = Field(None, description="Nombre del niño", min_length=1, max_length=100)
+    age: Optional[int] = Field(None, description="Edad del niño", ge=0, le=150)
+    city: Optional[str] = Field(None, description="Ciudad de origen del niño", min_length=1, max_length=100)
+    gender: Optional[Gender] = Field(None, description="Género del niño (male, female, other)")
+
+    class Config:
+        extra = 'forbid'
+
+    @root_validator(skip_on_failure=True)
+    def fields_match_operation(cls, values: dict) -> dict:
+        """
+        Valida que los campos enviados correspondan a la operación.
+
+        Raises:
+            ValueError: Si faltan o sobran campos para la operación
+        """
+        op = values["op"]
+        present = [name for name in ("name", "age", "city", "gender") if values.get(name) is not None]
+        if op in (BatchOperationType.INSERT, BatchOperationType.UPSERT) and len(present) < 4:
+            raise ValueError(f"La operación {op.value} requiere name, age, city y gender")
+        if op == BatchOperationType.UPDATE and not present:
+            raise ValueError("La operación update requiere al menos un campo")
+        if op == BatchOperationType.DELETE and present:
+            raise ValueError("La operación delete solo lleva el ID")
+        return values
+
+
+class ChildBatchRequest(BaseModel):
+    """
+    Esquema de un lote de operaciones que se aplica completo o no se aplica.
+    Las operaciones se aplican en orden.
+    """
+    items: List[BatchItem] = Field(
+        ...,
+        description="Operaciones del lote, en orden",
+        min_items=1,
+        max_items=MAX_BATCH_ITEMS
+    )
+
+    class Config:
+        # Ejemplo para documentación de la API
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"op": "upsert", "id": 10, "name": "Lucas", "age": 7, "city": "Bogotá", "gender": "male"},
+                    {"op": "update", "id": 5, "age": 8},
+                    {"op": "delete", "id": 3}
+                ]
+            }
+        }
+
+
+class BatchResultResponse(BaseModel):
+    """
+    Esquema de respuesta de un lote aplicado.
+    """
+    inserted: int = Field(..., description="Niños insertados (incluye upserts de IDs nuevos)")
+    updated: int = Field(..., description="Niños actualizados (incluye upserts de IDs existentes)")
+    deleted: int = Field(..., description="Niños eliminados")
+    total_children: int = Field(..., description="Niños en el árbol después del lote")
+
+
+# ========== ESQUEMAS PARA PAGINACIÓN POR CURSOR ==========
+
+# Tamaño de página por defecto y máximo para la paginación por cursor
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+
+class ChildPageResponse(BaseModel):
+    """
+    Esquema de respuesta para una página de niños ordenada por ID.
+    Para pedir la página siguiente se envía next_cursor en el parámetro cursor.
+    """
+    children: List[ChildResponse] = Field(..., description="Niños de la página, ordenados por ID")
+    limit: int = Field(..., description="Tamaño máximo de la página solicitada")
+    next_cursor: Optional[str] = Field(None, description="Cursor opaco de la página siguiente (None si es la última)")
+
+
+# ========== ESQUEMAS PARA CONSULTAS CON FILTROS ==========
+
+class PredicateEstimate(BaseModel):
+    """
+    Estimación de un predicado de la consulta según su índice.
+    """
+    predicate: str = Field(..., description="Predicado (por ejemplo 'city = Bogotá')")
+    estimated_rows: int = Field(..., description="Niños que cumplirían el predicado según el índice")
+
+
+class QueryPlan(BaseModel):
+    """
+    Plan elegido para una consulta con filtros (salida de ?explain=true).
+    """
+    strategy: str = Field(..., description="full_scan, id_range_scan o bitmap_intersection")
+    driver: Optional[str] = Field(None, description="Predicado del que parte la consulta")
+    predicates: List[PredicateEstimate] = Field(..., description="Estimaciones de todos los predicados")
+    intersected: List[str] = Field(..., description="Predicados resueltos con la intersección de mapas de bits")
+    residual: List[str] = Field(..., description="Predicados comprobados sobre cada niño examinado")
+    bitmap_rows: Optional[int] = Field(None, description="Filas que cumplen ciudad, género y edad según los mapas de bits")
+    total_rows: int = Field(..., description="Niños en el árbol")
+    rows_examined: int = Field(..., description="Niños leídos del árbol para responder")
+    rows_returned: int = Field(..., description="Niños que cumplen todos los predicados")
+
+
+class ChildQueryResponse(BaseModel):
+    """
+    Esquema de respuesta de una consulta con filtros y su plan.
+    """
+    children: List[ChildResponse] = Field(..., description="Niños que cumplen los filtros, ordenados por ID")
+    plan: QueryPlan = Field(..., description="Plan de ejecución")
+
+
+# ========== ESQUEMAS PARA IMPORTACIÓN MASIVA ==========
+
+class ImportRowError(BaseModel):
+    """
+    Esquema que describe una fila rechazada durante una importación.
+    """
+    line: int = Field(..., description="Número de línea en el archivo (desde 1)")
+    error: str = Field(..., description="Motivo del rechazo")
+
+
+class ImportResultResponse(BaseModel):
+    """
+    Esquema de respuesta de una importación masiva.
+    """
+    format: ExportFormat = Field(..., description="Formato con el que se leyó el archivo")
+    total_rows: int = Field(..., description="Filas de datos procesadas")
+    inserted: int = Field(..., description="Niños insertados")
+    duplicates: int = Field(..., description="Filas válidas cuyo ID ya existía")
+    invalid: int = Field(..., description="Filas con formato o datos inválidos")
+    invalid_rows: List[ImportRowError] = Field(..., description="Detalle de las primeras filas inválidas")
+    invalid_rows_truncated: bool = Field(..., description="True si hubo más filas inválidas que las detalladas")
+
+
 # ========== ESQUEMAS PARA RESPUESTAS DEL ÁRBOL ==========
 
 class TreeNode(BaseModel):
@@ -72,6 +324,12 @@ class TreeNode(BaseModel):
     right: Optional['TreeNode'] = Field(None, description="Hijo derecho (valores mayores)")
 
 
+# Altura máxima de un árbol devuelto como estructura anidada: cada nivel
+# agrega varios cuadros de pila al construir, validar y serializar el
+# esquema, así que una cadena más profunda agota el límite de recursión
+MAX_TREE_SCHEMA_HEIGHT = 500
+
+
 class TreeResponse(BaseModel):
     """
     Esquema de respuesta para visualizar el árbol completo.
@@ -0,0 +1,428 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from typing import Iterator, Optional, List, Tuple
+from app.models.schemas import TreeNode as TreeNodeSchema
+from app.models.abb_model import Child
+from app.models.avl_model import AVLTree
+
+
+class SortedArrayNode:
+    """
+    Vista de un nodo del árbol implícito que forma el arreglo ordenado.
+    El nodo de un rango [lo, hi) es el elemento central; su hijo izquierdo
+    es el centro de [lo, mid) y su hijo derecho el centro de [mid + 1, hi).
+    No almacena punteros: los hijos se calculan al consultarlos.
+    """
+
+    __slots__ = ("_values", "_lo", "_hi", "_mid")
+
+    def __init__(self, values: List[Child], lo: int, hi: int):
+        """
+        Constructor de la vista de nodo.
+
+        Args:
+            values: Niños ordenados por ID sobre los que se forma el árbol
+            lo: Índice inicial del rango (incluido)
+            hi: Índice final del rango (excluido)
+        """
+        self._values = values
+        self._lo = lo
+        self._hi = hi
+        self._mid = (lo + hi) // 2
+
+    @property
+    def child(self) -> Child:
+        """Niño almacenado en la posición central del rango"""
+        return self._values[self._mid]
+
+    @property
+    def left(self) -> Optional["SortedArrayNode"]:
+        """Hijo izquierdo implícito (None si el rango izquierdo está vacío)"""
+        if self._lo < self._mid:
+            return SortedArrayNode(self._values, self._lo, self._mid)
+        return None
+
+    @property
+    def right(self) -> Optional["SortedArrayNode"]:
+        """Hijo derecho implícito (None si el rango derecho está vacío)"""
+        if self._mid + 1 < self._hi:
+            return SortedArrayNode(self._values, self._mid + 1, self._hi)
+        return None
+
+    def to_tree_node_schema(self) -> TreeNodeSchema:
+        """
+        Convierte el nodo implícito y sus descendientes a un esquema TreeNode.
+
+        Returns:
+            TreeNodeSchema con la estructura del nodo y sus descendientes
+        """
+        left = self.left
+        right = self.right
+        return TreeNodeSchema(
+            child=self.child.to_response(),
+            left=left.to_tree_node_schema() if left else None,
+            right=right.to_tree_node_schema() if right else None
+        )
+
+    def __str__(self) -> str:
+        """Representación en string del nodo para debugging"""
+        return f"SortedArrayNode({self.child})"
+
+
+class SortedArrayTree:
+    """
+    Motor de almacenamiento optimizado para lectura con la misma interfaz que AVLTree.
+
+    Los datos viven en un arreglo compacto ordenado por ID (búsqueda con bisect)
+    y las inserciones nuevas entran en un búfer AVL pequeño. Cuando el búfer
+    alcanza `buffer_size` elementos se fusiona con el arreglo principal en O(n),
+    al estilo de un árbol LSM de dos niveles.
+
+    Costos:
+    - Búsqueda: O(log n) sobre el arreglo + O(log b) sobre el búfer
+    - Inserción: O(log b) amortizado más una fusión O(n) cada `buffer_size` inserciones
+    """
+
+    def __init__(self, buffer_size: int = 512):
+        """
+        Constructor de la clase SortedArrayTree.
+
+        Args:
+            buffer_size: Cantidad de inserciones acumuladas antes de fusionar el búfer
+        """
+        if buffer_size < 1:
+            raise ValueError("El tamaño del búfer debe ser al menos 1")
+        # Claves ordenadas en un arreglo compacto de enteros de 64 bits
+        self._keys = array("q")
+        # Niños en el mismo orden que las claves
+        self._values: List[Child] = []
+        # Búfer balanceado para las inserciones recientes
+        self._buffer = AVLTree()
+        self._buffer_size = buffer_size
+        # Contador de nodos (arreglo + búfer)
+        self._count: int = 0
+
+    def _search_main(self, child_id: int) -> int:
+        """
+        Busca un ID en el arreglo principal.
+
+        Args:
+            child_id: ID del niño a buscar
+
+        Returns:
+            Índice del ID en el arreglo, o -1 si no existe
+        """
+        index = bisect_left(self._keys, child_id)
+        if index < len(self._keys) and self._keys[index] == child_id:
+            return index
+        return -1
+
+    def _merge_buffer(self):
+        """
+        Fusiona el búfer con el arreglo principal en un solo recorrido lineal.
+        Ambos están ordenados por ID, así que basta con intercalarlos.
+        """
+        if self._buffer.is_empty():
+            return
+
+        merged = list(merge(self._values, self._buffer.inorder_traversal(), key=lambda c: c.id))
+        self._values = merged
+        self._keys = array("q", (child.id for child in merged))
+        self._buffer.clear()
+
+    def flush(self):
+        """
+        Fuerza la fusión del búfer con el arreglo principal.
+        Es una escritura: quien la llame debe serializarla con las demás.
+        """
+        self._merge_buffer()
+
+    def _merged_values(self) -> List[Child]:
+        """
+        Niños del arreglo y del búfer intercalados por ID, sin modificar el
+        árbol. Con el búfer vacío devuelve el arreglo principal sin copiarlo
+        (las escrituras crean listas nuevas, no alteran la capturada).
+
+        Returns:
+            Lista de niños en orden ascendente por ID
+        """
+        values = self._values
+        if self._buffer.is_empty():
+            return values
+        return list(merge(values, self._buffer.iter_inorder(), key=lambda c: c.id))
+
+    def insert(self, child: Child) -> bool:
+        """
+        Inserta un nuevo niño en el búfer de escritura.
+
+        Args:
+            child: Objeto Child a insertar
+
+        Returns:
+            True si se insertó correctamente, False si el ID ya existe
+        """
+        # El ID no puede existir ni en el arreglo ni en el búfer
+        if self._search_main(child.id) != -1:
+            return False
+        if not self._buffer.insert(child):
+            return False
+
+        self._count += 1
+
+        # Si el búfer se llenó, fusionarlo con el arreglo principal
+        if self._buffer.get_count() >= self._buffer_size:
+            self._merge_buffer()
+
+        return True
+
+    def search(self, child_id: int) -> Optional[Child]:
+        """
+        Busca un niño por su ID en el arreglo principal y luego en el búfer.
+
+        Args:
+            child_id: ID del niño a buscar
+
+        Returns:
+            Objeto Child si se encuentra, None si no existe
+        """
+        index = self._search_main(child_id)
+        if index != -1:
+            return self._values[index]
+        return self._buffer.search(child_id)
+
+    def delete(self, child_id: int) -> Optional[Child]:
+        """
+        Elimina un niño del arreglo principal o del búfer.
+        En el arreglo crea listas nuevas (copia O(n) de memoria contigua),
+        igual que la fusión, para no alterar las que iter_inorder capturó.
+        
+        Args:
+            child_id: ID del niño a eliminar
+            
+        Returns:
+            Objeto Child eliminado, o None si el ID no existe
+        """
+        index = self._search_main(child_id)
+        if index == -1:
+            removed = self._buffer.delete(child_id)
+        else:
+            removed = self._values[index]
+            self._values = self._values[:index] + self._values[index + 1:]
+            self._keys = self._keys[:index] + self._keys[index + 1:]
+        if removed is not None:
+            self._count -= 1
+        return removed
+    
+    def update(self, child_id: int, changes: dict) -> Optional[Tuple[Child, Child]]:
+        """
+        Actualiza los datos de un niño en su misma posición del arreglo
+        o del búfer. El ID no cambia, así que el orden tampoco.
+        
+        Args:
+            child_id: ID del niño a actualizar
+            changes: Campos a cambiar
+            
+        Returns:
+            Tupla (niño_anterior, niño_nuevo), o None si el ID no existe
+        """
+        index = self._search_main(child_id)
+        if index == -1:
+            return self._buffer.update(child_id, changes)
+        previous = self._values[index]
+        self._values[index] = previous.updated(changes)
+        return previous, self._values[index]
+    
+    def search_many(self, child_ids: List[int]) -> Tuple[List[Child], List[int]]:
+        """
+        Busca varios niños con un único barrido del arreglo ordenado.
+        Como los IDs se ordenan, cada bisect empieza donde terminó el anterior;
+        los que no están en el arreglo se resuelven juntos en el búfer.
+
+        Args:
+            child_ids: IDs de los niños a buscar (pueden venir repetidos o desordenados)
+
+        Returns:
+            Tupla (niños_encontrados, ids_no_encontrados), ambas en orden ascendente
+        """
+        found: List[Child] = []
+        pending: List[int] = []
+        lo = 0
+        for child_id in sorted(set(child_ids)):
+            lo = bisect_left(self._keys, child_id, lo)
+            if lo < len(self._keys) and self._keys[lo] == child_id:
+                found.append(self._values[lo])
+            else:
+                pending.append(child_id)
+
+        if not pending:
+            return found, []
+
+        buffered, missing = self._buffer.search_many(pending)
+        return list(merge(found, buffered, key=lambda c: c.id)), missing
+
+    @property
+    def root(self) -> Optional[SortedArrayNode]:
+        """
+        Raíz del árbol implícito (elemento central del arreglo).
+        Si el búfer tiene niños, el árbol implícito se forma sobre una copia
+        intercalada (O(n)) sin fusionarlo: las lecturas no escriben.
+
+        Returns:
+            SortedArrayNode de la raíz, o None si el árbol está vacío
+        """
+        values = self._merged_values()
+        if not values:
+            return None
+        return SortedArrayNode(values, 0, len(values))
+
+    def inorder_traversal(self) -> List[Child]:
+        """
+        Recorrido inorden (orden ascendente por ID).
+        Intercala el arreglo principal con el búfer sin fusionarlos.
+
+        Returns:
+            Lista de objetos Child en orden ascendente
+        """
+        if self._buffer.is_empty():
+            return list(self._values)
+        return list(merge(self._values, self._buffer.inorder_traversal(), key=lambda c: c.id))
+
+    def iter_inorder(self, after_id: Optional[int] = None) -> Iterator[Child]:
+        """
+        Iterador perezoso del recorrido inorden (orden ascendente por ID).
+        Ubica el punto de partida con bisect en el arreglo y en el búfer, y
+        luego intercala ambos sin construir la lista completa.
+
+        Args:
+            after_id: Si se indica, solo se recorren los IDs estrictamente mayores
+
+        Yields:
+            Objetos Child en orden ascendente por ID
+        """
+        # Capturar las listas actuales: una fusión posterior crea listas nuevas
+        keys, values = self._keys, self._values
+        start = 0 if after_id is None else bisect_right(keys, after_id)
+        main = (values[i] for i in range(start, len(values)))
+        if self._buffer.is_empty():
+            yield from main
+        else:
+            yield from merge(main, self._buffer.iter_inorder(after_id), key=lambda c: c.id)
+
+    def preorder_traversal(self) -> List[Child]:
+        """
+        Recorrido preorden del árbol implícito (raíz - izquierda - derecha).
+
+        Returns:
+            Lista de objetos Child en orden preorden
+        """
+        values = self._merged_values()
+        result = []
+        self._preorder_recursive(values, 0, len(values), result)
+        return result
+
+    def _preorder_recursive(self, values: List[Child], lo: int, hi: int, result: List[Child]):
+        """
+        Método auxiliar recursivo para el recorrido preorden sobre el rango [lo, hi).
+
+        Args:
+            values: Niños ordenados por ID
+            lo: Índice inicial del rango (incluido)
+            hi: Índice final del rango (excluido)
+            result: Lista que acumula los resultados
+        """
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        result.append(values[mid])
+        self._preorder_recursive(values, lo, mid, result)
+        self._preorder_recursive(values, mid + 1, hi, result)
+
+    def postorder_traversal(self) -> List[Child]:
+        """
+        Recorrido postorden del árbol implícito (izquierda - derecha - raíz).
+
+        Returns:
+            Lista de objetos Child en orden postorden
+        """
+        values = self._merged_values()
+        result = []
+        self._postorder_recursive(values, 0, len(values), result)
+        return result
+
+    def _postorder_recursive(self, values: List[Child], lo: int, hi: int, result: List[Child]):
+        """
+        Método auxiliar recursivo para el recorrido postorden sobre el rango [lo, hi).
+
+        Args:
+            values: Niños ordenados por ID
+            lo: Índice inicial del rango (incluido)
+            hi: Índice final del rango (excluido)
+            result: Lista que acumula los resultados
+        """
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        self._postorder_recursive(values, lo, mid, result)
+        self._postorder_recursive(values, mid + 1, hi, result)
+        result.append(values[mid])
+
+    def get_count(self) -> int:
+        """
+        Retorna la cantidad total de niños (arreglo + búfer).
+
+        Returns:
+            Número de niños almacenados
+        """
+        return self._count
+
+    def is_empty(self) -> bool:
+        """
+        Verifica si el árbol está vacío.
+
+        Returns:
+            True si no hay niños, False si hay al menos uno
+        """
+        return self._count == 0
+
+    def clear(self):
+        """
+        Elimina todos los niños del arreglo y del búfer.
+        """
+        self._keys = array("q")
+        self._values = []
+        self._buffer.clear()
+        self._count = 0
+
+    def get_tree_height(self) -> int:
+        """
+        Altura del árbol implícito sobre todos los niños (arreglo + búfer).
+        Un árbol implícito de n nodos tiene altura ⌊log2 n⌋ + 1, así que se
+        calcula en O(1) sin fusionar el búfer.
+
+        Returns:
+            Altura del árbol (0 si está vacío)
+        """
+        return self._count.bit_length()
+
+    def is_balanced(self) -> bool:
+        """
+        El árbol implícito siempre está balanceado: los dos rangos de cada
+        nodo difieren a lo sumo en un elemento.
+
+        Returns:
+            True siempre
+        """
+        return True
+
+    def to_tree_schema(self) -> Optional[TreeNodeSchema]:
+        """
+        Convierte el árbol implícito a un esquema TreeNode.
+
+        Returns:
+            TreeNodeSchema con la estructura completa del árbol, o None si está vacío
+        """
+        root = self.root
+        if root is None:
+            return None
+        return root.to_tree_node_schema()
@@ -0,0 +1,524 @@
+import threading
+from typing import Iterator, List, Optional, Tuple
+from app.models.schemas import TreeNode as TreeNodeSchema
+from app.models.abb_model import Child
+
+
+class SplayNode:
+    """
+    Nodo del árbol splay. No guarda altura ni tamaño: el árbol se reorganiza
+    con cada acceso y no necesita información de balance.
+    """
+
+    __slots__ = ("child", "left", "right")
+
+    def __init__(self, child: Optional[Child]):
+        """
+        Constructor del nodo.
+
+        Args:
+            child: Datos del niño almacenado en este nodo
+        """
+        self.child = child
+        self.left: Optional["SplayNode"] = None
+        self.right: Optional["SplayNode"] = None
+
+    def to_tree_node_schema(self) -> TreeNodeSchema:
+        """
+        Convierte el nodo y sus descendientes a un esquema TreeNode.
+
+        Returns:
+            TreeNodeSchema con la estructura del nodo y sus descendientes
+        """
+        return TreeNodeSchema(
+            child=self.child.to_response(),
+            left=self.left.to_tree_node_schema() if self.left else None,
+            right=self.right.to_tree_node_schema() if self.right else None
+        )
+
+    def __str__(self) -> str:
+        """Representación en string del nodo para debugging"""
+        return f"SplayNode({self.child})"
+
+
+def _splay(root: SplayNode, key: int) -> SplayNode:
+    """
+    Splay descendente (Sleator-Tarjan): sube a la raíz el nodo con la clave,
+    o el último nodo visitado si no existe, en una sola pasada sin pila.
+
+    Args:
+        root: Raíz del árbol (no vacío)
+        key: ID buscado
+
+    Returns:
+        Nueva raíz del árbol
+    """
+    # Ancla temporal: su derecha acumula el árbol "menores" y su izquierda el árbol "mayores"
+    header = SplayNode(None)
+    left_max = right_min = header
+    node = root
+    while True:
+        if key < node.child.id:
+            if node.left is None:
+                break
+            if key < node.left.child.id:
+                # Zig-zig: rotación a la derecha
+                pivot = node.left
+                node.left = pivot.right
+                pivot.right = node
+                node = pivot
+                if node.left is None:
+                    break
+            # Enlazar a la derecha
+            right_min.left = node
+            right_min = node
+            node = node.left
+        elif key > node.child.id:
+            if node.right is None:
+                break
+            if key > node.right.child.id:
+                # Zag-zag: rotación a la izquierda
+                pivot = node.right
+                node.right = pivot.left
+                pivot.left = node
+                node = pivot
+                if node.right is None:
+                    break
+            # Enlazar a la izquierda
+            left_max.right = node
+            left_max = node
+            node = node.right
+        else:
+            break
+    # Reensamblar
+    left_max.right = node.left
+    right_min.left = node.right
+    node.left = header.right
+    node.right = header.left
+    return node
+
+
+class SplayTree:
+    """
+    Motor de almacenamiento splay con la misma interfaz que AVLTree.
+
+    Cada búsqueda e inserción sube el nodo accedido a la raíz, así que los IDs
+    consultados hace poco quedan a pocos pasos: con accesos muy sesgados
+    (unos cientos de IDs calientes que cambian con el tiempo) el costo se
+    adapta al conjunto de trabajo en vez de a log n. El costo amortizado por
+    operación es O(log n), aunque una operación aislada puede ser O(n).
+
+    Como las lecturas también reorganizan el árbol, toda modificación se hace
+    con un candado y aumenta un contador de secuencia (impar mientras dura).
+
+    Variante read_mostly: las búsquedas descienden sin candado y validan con
+    el contador de secuencia que nadie reorganizó el árbol mientras tanto
+    (si ocurrió, repiten con el candado). Solo hacen splay si el nodo está
+    más profundo que `splay_depth` y el candado está libre, de modo que los
+    lectores concurrentes no se bloquean entre sí ni mueven nodos que ya
+    están cerca de la raíz.
+    """
+
+    def __init__(self, read_mostly: bool = False, splay_depth: Optional[int] = None):
+        """
+        Constructor de la clase SplayTree.
+
+        Args:
+            read_mostly: Activa la variante con lecturas sin candado y splay limitado
+            splay_depth: Profundidad a partir de la cual una búsqueda read_mostly
+                         hace splay. None usa la altura de un árbol balanceado
+                         con los mismos nodos (⌊log2 n⌋ + 1): solo suben los
+                         nodos más profundos de lo que estarían en un AVL
+
+        Raises:
+            ValueError: Si splay_depth es menor que 1
+        """
+        if splay_depth is not None and splay_depth < 1:
+            raise ValueError("splay_depth debe ser al menos 1")
+        # Raíz del árbol (None si el árbol está vacío)
+        self.root: Optional[SplayNode] = None
+        # Contador de nodos en el árbol
+        self._count: int = 0
+        self.read_mostly = read_mostly
+        self._splay_depth = splay_depth
+        # Serializa las reorganizaciones (splay, inserción, vaciado)
+        self._lock = threading.Lock()
+        # Contador de secuencia: impar mientras se reorganiza el árbol
+        self._seq: int = 0
+        # Cantidad de splays hechos por búsquedas (los de inserción no cuentan)
+        self.search_splays: int = 0
+
+    def _find(self, child_id: int) -> Tuple[Optional[Child], int]:
+        """
+        Descenso de solo lectura desde la raíz.
+
+        Args:
+            child_id: ID buscado
+
+        Returns:
+            Tupla (niño o None, profundidad del último nodo visitado)
+        """
+        node = self.root
+        depth = 0
+        while node is not None:
+            if child_id == node.child.id:
+                return node.child, depth
+            node = node.left if child_id < node.child.id else node.right
+            depth += 1
+        return None, depth
+
+    def _splay_locked(self, child_id: int):
+        """
+        Hace splay sobre un ID. Se debe llamar con el candado tomado.
+
+        Args:
+            child_id: ID a subir a la raíz
+        """
+        if self.root is None:
+            return
+        self._seq += 1
+        self.root = _splay(self.root, child_id)
+        self._seq += 1
+
+    def insert(self, child: Child) -> bool:
+        """
+        Inserta un niño: hace splay sobre su ID y lo coloca como nueva raíz.
+
+        Args:
+            child: Objeto Child a insertar
+
+        Returns:
+            True si se insertó correctamente, False si el ID ya existe
+        """
+        with self._lock:
+            node = SplayNode(child)
+            if self.root is None:
+                self.root = node
+                self._count += 1
+                return True
+
+            self._seq += 1
+            root = _splay(self.root, child.id)
+            if child.id == root.child.id:
+                self.root = root
+                self._seq += 1
+                return False
+            # La raíz es el vecino más cercano: se reparte entre los dos lados
+            if child.id < root.child.id:
+                node.left = root.left
+                node.right = root
+                root.left = None
+            else:
+                node.right = root.right
+                node.left = root
+                root.right = None
+            self.root = node
+            self._count += 1
+            self._seq += 1
+            return True
+
+    def search(self, child_id: int) -> Optional[Child]:
+        """
+        Busca un niño por su ID y lo sube a la raíz.
+        En la variante read_mostly el splay solo ocurre para nodos profundos
+        y cuando ningún otro hilo está reorganizando el árbol.
+
+        Args:
+            child_id: ID del niño a buscar
+
+        Returns:
+            Objeto Child si se encuentra, None si no existe
+        """
+        if not self.read_mostly:
+            with self._lock:
+                self._splay_locked(child_id)
+                root = self.root
+                return root.child if root is not None and root.child.id == child_id else None
+
+        # Lectura optimista: válida si la secuencia no cambió ni era impar
+        seq = self._seq
+        child, depth = self._find(child_id)
+        if seq & 1 or self._seq != seq:
+            with self._lock:
+                child, depth = self._find(child_id)
+
+        if child is not None and depth > self._splay_threshold() and self._lock.acquire(blocking=False):
+            try:
+                self._splay_locked(child_id)
+                self.search_splays += 1
+            finally:
+                self._lock.release()
+        return child
+
+    def delete(self, child_id: int) -> Optional[Child]:
+        """
+        Elimina un niño: lo sube a la raíz con splay y une sus dos subárboles
+        subiendo el máximo del izquierdo, que queda sin hijo derecho.
+
+        Args:
+            child_id: ID del niño a eliminar
+
+        Returns:
+            Objeto Child eliminado, o None si el ID no existe
+        """
+        with self._lock:
+            if self.root is None:
+                return None
+            self._seq += 1
+            root = _splay(self.root, child_id)
+            if root.child.id != child_id:
+                self.root = root
+                self._seq += 1
+                return None
+            if root.left is None:
+                self.root = root.right
+            else:
+                # Todos los IDs del subárbol izquierdo son menores: sube su máximo
+                left = _splay(root.left, child_id)
+                left.right = root.right
+                self.root = left
+            self._count -= 1
+            self._seq += 1
+            return root.child
+
+    def update(self, child_id: int, changes: dict) -> Optional[Tuple[Child, Child]]:
+        """
+        Actualiza los datos de un niño en su mismo nodo, sin hacer splay:
+        la forma del árbol no cambia y los lectores sin candado ven el niño
+        anterior o el nuevo, nunca uno a medio actualizar.
+
+        Args:
+            child_id: ID del niño a actualizar
+            changes: Campos a cambiar
+
+        Returns:
+            Tupla (niño_anterior, niño_nuevo), o None si el ID no existe
+        """
+        with self._lock:
+            node = self.root
+            while node is not None and node.child.id != child_id:
+                node = node.left if child_id < node.child.id else node.right
+            if node is None:
+                return None
+            previous = node.child
+            node.child = previous.updated(changes)
+            return previous, node.child
+
+    def _splay_threshold(self) -> int:
+        """Profundidad a partir de la cual una búsqueda read_mostly hace splay."""
+        if self._splay_depth is not None:
+            return self._splay_depth
+        return self._count.bit_length()
+
+    def search_many(self, child_ids: List[int]) -> Tuple[List[Child], List[int]]:
+        """
+        Busca varios niños sin reorganizar el árbol: una búsqueda en lote no
+        indica qué IDs serán calientes y subirlos uno a uno desplazaría a los
+        que sí lo son.
+
+        Args:
+            child_ids: IDs de los niños a buscar (pueden venir repetidos o desordenados)
+
+        Returns:
+            Tupla (niños_encontrados, ids_no_encontrados), ambas en orden ascendente
+        """
+        found: List[Child] = []
+        missing: List[int] = []
+        with self._lock:
+            for child_id in sorted(set(child_ids)):
+                child, _depth = self._find(child_id)
+                if child is None:
+                    missing.append(child_id)
+                else:
+                    found.append(child)
+        return found, missing
+
+    def inorder_traversal(self) -> List[Child]:
+        """
+        Recorrido inorden (orden ascendente por ID).
+
+        Returns:
+            Lista de objetos Child en orden ascendente
+        """
+        result = []
+        with self._lock:
+            stack: List[SplayNode] = []
+            node = self.root
+            while stack or node is not None:
+                while node is not None:
+                    stack.append(node)
+                    node = node.left
+                node = stack.pop()
+                result.append(node.child)
+                node = node.right
+        return result
+
+    def iter_inorder(self, after_id: Optional[int] = None) -> Iterator[Child]:
+        """
+        Iterador perezoso del recorrido inorden.
+        Avanza un paso por vez con el candado tomado; si entre pasos otra
+        operación reorganizó el árbol, reconstruye la pila desde la raíz a
+        partir del último ID entregado, así que tolera búsquedas concurrentes.
+
+        Args:
+            after_id: Si se indica, solo se recorren los IDs estrictamente mayores
+
+        Yields:
+            Objetos Child en orden ascendente por ID
+        """
+        stack: List[SplayNode] = []
+        seq = None
+        last_id = after_id
+        while True:
+            with self._lock:
+                if seq != self._seq:
+                    # Primera llamada o árbol reorganizado: ubicar el sucesor de last_id
+                    stack = []
+                    node = self.root
+                    while node is not None:
+                        if last_id is None or node.child.id > last_id:
+                            stack.append(node)
+                            node = node.left
+                        else:
+                            node = node.right
+                    seq = self._seq
+                if not stack:
+                    return
+                node = stack.pop()
+                child = node.child
+                node = node.right
+                while node is not None:
+                    stack.append(node)
+                    node = node.left
+            last_id = child.id
+            yield child
+
+    def preorder_traversal(self) -> List[Child]:
+        """
+        Recorrido preorden (raíz - izquierda - derecha).
+
+        Returns:
+            Lista de objetos Child en orden preorden
+        """
+        result = []
+        with self._lock:
+            stack = [self.root] if self.root is not None else []
+            while stack:
+                node = stack.pop()
+                result.append(node.child)
+                if node.right is not None:
+                    stack.append(node.right)
+                if node.left is not None:
+                    stack.append(node.left)
+        return result
+
+    def postorder_traversal(self) -> List[Child]:
+        """
+        Recorrido postorden (izquierda - derecha - raíz).
+        Se obtiene invirtiendo un recorrido raíz - derecha - izquierda.
+
+        Returns:
+            Lista de objetos Child en orden postorden
+        """
+        result = []
+        with self._lock:
+            stack = [self.root] if self.root is not None else []
+            while stack:
+                node = stack.pop()
+                result.append(node.child)
+                if node.left is not None:
+                    stack.append(node.left)
+                if node.right is not None:
+                    stack.append(node.right)
+        result.reverse()
+        return result
+
+    def get_count(self) -> int:
+        """
+        Retorna la cantidad de nodos en el árbol.
+
+        Returns:
+            Número de niños almacenados
+        """
+        return self._count
+
+    def is_empty(self) -> bool:
+        """
+        Verifica si el árbol está vacío.
+
+        Returns:
+            True si no hay niños, False si hay al menos uno
+        """
+        return self.root is None
+
+    def clear(self):
+        """
+        Elimina todos los niños del árbol.
+        """
+        with self._lock:
+            self._seq += 1
+            self.root = None
+            self._count = 0
+            self._seq += 1
+
+    def _heights(self) -> List[Tuple[int, int]]:
+        """
+        Alturas de los subárboles izquierdo y derecho de cada nodo, calculadas
+        en postorden con una pila explícita (el árbol puede ser muy profundo).
+
+        Returns:
+            Lista de tuplas (altura_izquierda, altura_derecha), la última es la raíz
+        """
+        pairs: List[Tuple[int, int]] = []
+        heights = {}
+        with self._lock:
+            stack = [(self.root, False)] if self.root is not None else []
+            while stack:
+                node, expanded = stack.pop()
+                if expanded:
+                    left = heights.pop(id(node.left), 0)
+                    right = heights.pop(id(node.right), 0)
+                    heights[id(node)] = 1 + max(left, right)
+                    pairs.append((left, right))
+                    continue
+                stack.append((node, True))
+                if node.right is not None:
+                    stack.append((node.right, False))
+                if node.left is not None:
+                    stack.append((node.left, False))
+        return pairs
+
+    def get_tree_height(self) -> int:
+        """
+        Altura del árbol (cambia con cada acceso).
+        Recorre todo el árbol con el candado tomado: O(n), no se usa en el
+        camino de cada inserción.
+
+        Returns:
+            Altura del árbol (0 si está vacío)
+        """
+        pairs = self._heights()
+        return 1 + max(pairs[-1]) if pairs else 0
+
+    def is_balanced(self) -> bool:
+        """
+        Verifica si la forma actual cumple la propiedad AVL. Un árbol splay no
+        la garantiza: solo informa el estado en este momento. Cuesta O(n),
+        igual que get_tree_height.
+
+        Returns:
+            True si todos los nodos tienen factor de balance entre -1 y 1
+        """
+        return all(abs(left - right) <= 1 for left, right in self._heights())
+
+    def to_tree_schema(self) -> Optional[TreeNodeSchema]:
+        """
+        Convierte el árbol a un esquema TreeNode.
+
+        Returns:
+            TreeNodeSchema con la estructura completa, o None si está vacío
+        """
+        with self._lock:
+            if self.root is None:
+                return None
+            return self.root.to_tree_node_schema()
@@ -1,8 +1,31 @@
-from typing import List, Optional
+import threading
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+from app.config import settings
 from app.models.abb_model import BinarySearchTree, Child
+from app.utils.aggregation import GroupAggregator, parse_group_by, parse_metrics
+from app.utils.batch import DELETED, INSERTED, UPDATED, apply_operations
+from app.utils.bitmap_index import RowBitmaps
+from app.utils.columnar import ColumnarSnapshot, parse_percentiles, parse_stats_group_by
+from app.utils.cursor import encode_cursor
+from app.utils.export import iter_csv, iter_levels, iter_levels_ndjson, iter_ndjson
+from app.utils.fenwick import AgeHistogram
+from app.utils.lru_cache import LRUCache
+from app.utils.memory import measure_tree_memory
+from app.utils.name_index import NameTrie, normalize_name
+from app.utils.ngram_index import TrigramIndex
+from app.utils.query_planner import FilterPlanner
+from app.utils.slow_log import json_bytes, phase, search_depth
 from app.models.schemas import (
+    BatchItem,
     ChildCreate, 
+    ChildUpdate,
     ChildResponse, 
+    ChildLookupResponse,
+    FuzzyMatchResponse,
+    ChildPageResponse,
+    ChildQueryResponse,
+    ExportFormat,
     TreeResponse, 
     TraversalResponse
 )
@@ -21,7 +44,30 @@ class ABBService:
         Inicializa una instancia única del árbol binario de búsqueda.
         """
         # Instancia única del árbol que se mantiene en memoria
-        self._tree = BinarySearchTree()
+        self._tree = BinarySearchTree(scapegoat_alpha=settings.ABB_SCAPEGOAT_ALPHA)
+        # Caché LRU de respuestas ya serializadas de GET /children/{id}
+        self._payload_cache = LRUCache(settings.CHILD_PAYLOAD_CACHE_SIZE)
+        # Contadores por grupo mantenidos en cada mutación
+        # (ciudad × género siempre se mantiene: lo usa kids-by-city-and-gender)
+        self._aggregates = GroupAggregator(
+            [*settings.AGGREGATE_GROUP_BY, "city,gender"],
+            age_bucket_size=settings.AGE_BUCKET_SIZE
+        )
+        # Histograma de edades (árboles de Fenwick global y por ciudad)
+        self._age_histogram = AgeHistogram()
+        # Trie de nombres normalizados para la búsqueda por prefijo
+        self._name_index = NameTrie()
+        # Índice de trigramas de nombres para la búsqueda aproximada
+        self._ngram_index = TrigramIndex()
+        # Mapas de bits de ciudad, género y edad para las consultas con filtros
+        self._bitmaps = RowBitmaps()
+        # Versión de mutaciones: cambia en cada inserción o vaciado del árbol
+        self._version = 0
+        # Copia columnar para estadísticas, construida a pedido
+        self._snapshot: Optional[ColumnarSnapshot] = None
+        # Serializa a los escritores: cada operación pública que modifica el
+        # árbol o sus índices lo toma una sola vez (los auxiliares no lo toman)
+        self._write_lock = threading.Lock()
     
     def add_child(self, child_data: ChildCreate) -> dict:
         """
@@ -38,23 +84,27 @@ class ABBService:
             - child: Datos del niño insertado (si fue exitoso)
         """
         # Crear objeto Child desde los datos recibidos
-        child = Child(
-            id=child_data.id,
-            name=child_data.name,
-            age=child_data.age,
-            city=child_data.city,
-            gender=child_data.gender
-        )
+        with phase("pydantic"):
+            child = Child(
+                id=child_data.id,
+                name=child_data.name,
+                age=child_data.age,
+                city=child_data.city,
+                gender=child_data.gender
+            )
         
         # Intentar insertar el niño en el árbol
-        success = self._tree.insert(child)
+        with self._write_lock, phase("model"):
+            success = self._insert_child(child)
         
         # Si la inserción fue exitosa
         if success:
+            with phase("pydantic"):
+                response = child.to_response()
             return {
                 "success": True,
                 "message": f"Niño '{child.name}' con ID {child.id} agregado exitosamente al árbol",
-                "child": child.to_response()
+                "child": response
             }
         # Si el ID ya existe (inserción fallida)
         else:
@@ -64,6 +114,168 @@ class ABBService:
                 "child": None
             }
     
+    def _insert_child(self, child: Child) -> bool:
+        """
+        Inserta un niño en el árbol y actualiza las estructuras derivadas.
+        Todas las inserciones del servicio pasan por aquí.
+        
+        Args:
+            child: Objeto Child ya validado
+            
+        Returns:
+            True si se insertó, False si el ID ya existe
+        """
+        if not self._tree.insert(child):
+            return False
+        
+        self._index_child(child)
+        self._version += 1
+        return True
+    
+    def _index_child(self, child: Child):
+        """
+        Registra en las estructuras derivadas un niño que acaba de entrar al árbol.
+        La versión de mutaciones la aumenta quien llama, una vez por operación.
+        
+        Args:
+            child: Niño ya almacenado en el árbol
+        """
+        # Ninguna respuesta en caché puede quedar desactualizada para este ID
+        self._payload_cache.invalidate(child.id)
+        self._aggregates.add(child)
+        self._age_histogram.add(child)
+        self._name_index.add(child.id, child.name)
+        self._ngram_index.add(child.id, child.name)
+        self._bitmaps.add(child)
+    
+    def _unindex_child(self, child: Child):
+        """
+        Quita de las estructuras derivadas un niño que acaba de salir del árbol.
+        La versión de mutaciones la aumenta quien llama, una vez por operación.
+        
+        Args:
+            child: Niño ya eliminado del árbol
+        """
+        self._payload_cache.invalidate(child.id)
+        self._aggregates.remove(child)
+        self._age_histogram.remove(child)
+        self._name_index.remove(child.id, child.name)
+        self._ngram_index.remove(child.id, child.name)
+        self._bitmaps.remove(child)
+    
+    def update_child(self, child_id: int, changes: ChildUpdate) -> Optional[ChildResponse]:
+        """
+        Actualiza parcialmente un niño.
+        Ubica el nodo con una sola búsqueda y cambia sus datos en el lugar:
+        la clave no cambia, así que el árbol no se reorganiza. Los índices,
+        contadores y la caché reciben solo la diferencia.
+        
+        Args:
+            child_id: ID del niño a actualizar
+            changes: Campos a cambiar (ChildUpdate schema)
+            
+        Returns:
+            ChildResponse con los datos actualizados, None si el niño no existe
+            
+        Raises:
+            ValueError: Si no se indica ningún campo o algún valor no es válido
+        """
+        fields = {name: value for name, value in changes.dict(exclude_unset=True).items() if value is not None}
+        if not fields:
+            raise ValueError("Debe indicar al menos un campo para actualizar")
+        
+        with self._write_lock:
+            result = self._tree.update(child_id, fields)
+            if result is None:
+                return None
+            previous, child = result
+            self._reindex_child(previous, child)
+            self._version += 1
+        return child.to_response()
+    
+    def _reindex_child(self, previous: Child, child: Child):
+        """
+        Aplica a las estructuras derivadas solo la diferencia entre los datos
+        anteriores y los nuevos de un niño actualizado en su mismo nodo.
+        La versión de mutaciones la aumenta quien llama, una vez por operación.
+        
+        Args:
+            previous: Niño tal como estaba indexado
+            child: Niño con los datos nuevos (mismo ID)
+        """
+        self._payload_cache.invalidate(child.id)
+        if (previous.age, previous.city, previous.gender) != (child.age, child.city, child.gender):
+            self._aggregates.remove(previous)
+            self._aggregates.add(child)
+        if (previous.age, previous.city) != (child.age, child.city):
+            self._age_histogram.remove(previous)
+            self._age_histogram.add(child)
+        if previous.name != child.name:
+            self._name_index.remove(child.id, previous.name)
+            self._name_index.add(child.id, child.name)
+            self._ngram_index.remove(child.id, previous.name)
+            self._ngram_index.add(child.id, child.name)
+        self._bitmaps.update(previous, child)
+    
+    def apply_batch(self, items: List[BatchItem]) -> dict:
+        """
+        Aplica un lote de inserciones, actualizaciones, upserts y eliminaciones
+        como una unidad: o se aplica completo o el árbol queda como estaba.
+        
+        El lote llega validado por el esquema. Toma el candado de escritura una
+        sola vez, aplica las operaciones al árbol con un registro de deshacer
+        y, solo si todas tuvieron éxito, actualiza índices y caché con los
+        cambios y aumenta la versión de mutaciones una única vez.
+        
+        Args:
+            items: Operaciones del lote, en orden
+            
+        Returns:
+            Diccionario con insertados, actualizados, eliminados y total de niños
+            
+        Raises:
+            BatchConflictError: Si alguna operación falla (no se aplica nada)
+        """
+        counts = {INSERTED: 0, UPDATED: 0, DELETED: 0}
+        with self._write_lock:
+            changes = apply_operations(self._tree, items)
+            for kind, previous, child in changes:
+                if kind == INSERTED:
+                    self._index_child(child)
+                elif kind == UPDATED:
+                    self._reindex_child(previous, child)
+                else:
+                    self._unindex_child(previous)
+                counts[kind] += 1
+            self._version += 1
+        
+        return {**counts, "total_children": self._tree.get_count()}
+    
+    def import_children_chunk(self, children_data: List[ChildCreate]) -> Tuple[int, int]:
+        """
+        Inserta un bloque de niños ya validados durante una importación masiva.
+        A diferencia de add_child, no construye una respuesta por niño.
+        
+        Args:
+            children_data: Bloque de niños validados con ChildCreate
+            
+        Returns:
+            Tupla (insertados, duplicados)
+        """
+        children = [
+            Child(
+                id=child_data.id,
+                name=child_data.name,
+                age=child_data.age,
+                city=child_data.city,
+                gender=child_data.gender
+            )
+            for child_data in children_data
+        ]
+        with self._write_lock:
+            inserted = sum(1 for child in children if self._insert_child(child))
+        return inserted, len(children_data) - inserted
+    
     def search_child(self, child_id: int) -> Optional[ChildResponse]:
         """
         Busca un niño en el árbol por su ID.
@@ -84,6 +296,179 @@ class ABBService:
         # Si no se encontró, retornar None
         return None
     
+    def get_child_payload(self, child_id: int) -> Optional[bytes]:
+        """
+        Obtiene el JSON ya serializado de un niño, usando la caché de respuestas.
+        En un acierto se evita la búsqueda, la conversión a ChildResponse y
+        la codificación JSON de FastAPI.
+        
+        Args:
+            child_id: ID del niño a buscar
+            
+        Returns:
+            Bytes con el JSON del niño, o None si no existe
+        """
+        # Intentar responder desde la caché
+        with phase("model"):
+            payload = self._payload_cache.get(child_id)
+            if payload is not None:
+                return payload
+            
+            # Fallo de caché: buscar en el árbol y serializar una sola vez
+            child = self._tree.search(child_id)
+        if child is None:
+            return None
+        
+        with phase("pydantic"):
+            data = child.to_response().dict()
+        with phase("json"):
+            payload = json_bytes(data)
+        self._payload_cache.put(child_id, payload)
+        return payload
+    
+    def get_cache_stats(self) -> dict:
+        """
+        Obtiene las métricas de la caché de respuestas serializadas.
+        
+        Returns:
+            Diccionario con tamaño, aciertos, fallos y tasa de acierto
+        """
+        return self._payload_cache.stats()
+    
+    def get_memory_usage(self) -> dict:
+        """
+        Mide la huella de memoria del árbol separada en nodos, objetos Child,
+        textos, índices y cachés. Recorre todos los objetos alcanzables, así
+        que es O(n) y solo está pensado para depuración.
+        
+        Returns:
+            Diccionario con el motor y los bytes por categoría
+        """
+        usage = measure_tree_memory(
+            self._tree,
+            indexes={
+                "aggregates": self._aggregates,
+                "age_histogram": self._age_histogram,
+                "name_index": self._name_index,
+                "ngram_index": self._ngram_index,
+                "bitmaps": self._bitmaps,
+                "columnar_snapshot": self._snapshot,
+            },
+            caches={"payload_cache": self._payload_cache}
+        )
+        return {"engine": "abb", **usage}
+    
+    def get_rotation_count(self) -> Optional[int]:
+        """
+        Rotaciones acumuladas, para el registro de operaciones lentas.
+        
+        Returns:
+            None: el ABB no rota (el modo chivo expiatorio reconstruye subárboles)
+        """
+        return None
+    
+    def get_operation_shape(self, child_id: Optional[int] = None) -> dict:
+        """
+        Forma del árbol para una entrada del registro de operaciones lentas.
+        Calcula la altura en O(n): solo se usa con operaciones que ya
+        superaron el umbral. Una altura cercana a la cantidad de niños
+        indica un ABB degenerado.
+        
+        Args:
+            child_id: ID de la operación, para contar sus comparaciones
+            
+        Returns:
+            Diccionario con tree_type, engine, count, height, comparisons
+            (None si la operación no tiene ID) y rebuilds
+        """
+        return {
+            "tree_type": "abb",
+            "engine": "abb" if self._tree.scapegoat_alpha is None else "abb_scapegoat",
+            "count": self._tree.get_count(),
+            "height": self._tree.get_tree_height(),
+            "comparisons": None if child_id is None else search_depth(self._tree.root, child_id),
+            "rebuilds": self._tree.rebuilds,
+        }
+    
+    def search_by_name_prefix(self, name_prefix: str, limit: int) -> List[ChildResponse]:
+        """
+        Busca niños cuyo nombre empieza por un prefijo.
+        La comparación no distingue mayúsculas ni tildes ("jose" encuentra "José").
+        
+        Args:
+            name_prefix: Prefijo del nombre
+            limit: Cantidad máxima de resultados
+            
+        Returns:
+            Lista de ChildResponse ordenada por nombre y luego por ID
+            
+        Raises:
+            ValueError: Si el prefijo queda vacío después de normalizarlo
+        """
+        if not normalize_name(name_prefix):
+            raise ValueError("El prefijo del nombre no puede estar vacío")
+        
+        # IDs en orden alfabético según el trie
+        ids = self._name_index.search_prefix(name_prefix, limit)
+        
+        # Recuperar los niños con un solo descenso y respetar el orden del trie
+        found, _missing = self._tree.search_many(ids)
+        by_id = {child.id: child for child in found}
+        return [by_id[child_id].to_response() for child_id in ids if child_id in by_id]
+    
+    def fuzzy_search_by_name(self, query: str, k: int) -> List[FuzzyMatchResponse]:
+        """
+        Busca los k niños con el nombre más parecido a la consulta.
+        Tolera errores de escritura ("Lucaz" encuentra "Lucas") usando
+        un índice invertido de trigramas.
+        
+        Args:
+            query: Nombre a buscar
+            k: Cantidad máxima de resultados
+            
+        Returns:
+            Lista de FuzzyMatchResponse de mayor a menor similitud
+            
+        Raises:
+            ValueError: Si la consulta queda vacía después de normalizarla
+        """
+        if not normalize_name(query):
+            raise ValueError("La consulta no puede estar vacía")
+        
+        # Candidatos con su similitud, ya ordenados
+        matches = self._ngram_index.search(query, k)
+        
+        # Recuperar los niños con un solo descenso del árbol
+        found, _missing = self._tree.search_many([child_id for child_id, _score in matches])
+        by_id = {child.id: child for child in found}
+        return [
+            FuzzyMatchResponse(child=by_id[child_id].to_response(), score=score)
+            for child_id, score in matches
+            if child_id in by_id
+        ]
+    
+    def lookup_children(self, child_ids: List[int]) -> ChildLookupResponse:
+        """
+        Busca varios niños por ID con un solo descenso ordenado del árbol.
+        Es equivalente a llamar search_child por cada ID, pero comparte los
+        tramos comunes de los caminos de búsqueda.
+        
+        Args:
+            child_ids: IDs de los niños a buscar
+            
+        Returns:
+            ChildLookupResponse con los niños encontrados y los IDs faltantes
+        """
+        # Resolver todos los IDs en un solo recorrido del árbol
+        found, missing = self._tree.search_many(child_ids)
+        
+        return ChildLookupResponse(
+            found=[child.to_response() for child in found],
+            missing=missing,
+            total_found=len(found),
+            total_missing=len(missing)
+        )
+    
     def get_tree_structure(self) -> TreeResponse:
         """
         Obtiene la estructura completa del árbol.
@@ -93,13 +478,16 @@ class ABBService:
             TreeResponse con la estructura del árbol y el conteo total de nodos
         """
         # Obtener la representación del árbol en formato schema
-        tree_schema = self._tree.to_tree_schema()
+        # (los nodos se convierten directamente en esquemas pydantic)
+        with phase("pydantic"):
+            tree_schema = self._tree.to_tree_schema()
+            response = TreeResponse(
+                root=tree_schema,
+                total_children=self._tree.get_count()
+            )
         
         # Retornar la respuesta con el árbol y el total de niños
-        return TreeResponse(
-            root=tree_schema,
-            total_children=self._tree.get_count()
-        )
+        return response
     
     def get_inorder_traversal(self) -> TraversalResponse:
         """
@@ -110,16 +498,19 @@ class ABBService:
             TraversalResponse con el tipo de recorrido y la lista de niños ordenados
         """
         # Realizar el recorrido inorden
-        children = self._tree.inorder_traversal()
+        with phase("model"):
+            children = self._tree.inorder_traversal()
         
         # Convertir cada Child a ChildResponse
-        children_response = [child.to_response() for child in children]
+        with phase("pydantic"):
+            children_response = [child.to_response() for child in children]
+            response = TraversalResponse(
+                traversal_type="inorden (izquierda - raíz - derecha)",
+                children=children_response
+            )
         
         # Retornar la respuesta con el tipo y los datos
-        return TraversalResponse(
-            traversal_type="inorden (izquierda - raíz - derecha)",
-            children=children_response
-        )
+        return response
     
     def get_preorder_traversal(self) -> TraversalResponse:
         """
@@ -130,16 +521,19 @@ class ABBService:
             TraversalResponse con el tipo de recorrido y la lista de niños
         """
         # Realizar el recorrido preorden
-        children = self._tree.preorder_traversal()
+        with phase("model"):
+            children = self._tree.preorder_traversal()
         
         # Convertir cada Child a ChildResponse
-        children_response = [child.to_response() for child in children]
+        with phase("pydantic"):
+            children_response = [child.to_response() for child in children]
+            response = TraversalResponse(
+                traversal_type="preorden (raíz - izquierda - derecha)",
+                children=children_response
+            )
         
         # Retornar la respuesta con el tipo y los datos
-        return TraversalResponse(
-            traversal_type="preorden (raíz - izquierda - derecha)",
-            children=children_response
-        )
+        return response
     
     def get_postorder_traversal(self) -> TraversalResponse:
         """
@@ -150,16 +544,48 @@ class ABBService:
             TraversalResponse con el tipo de recorrido y la lista de niños
         """
         # Realizar el recorrido postorden
-        children = self._tree.postorder_traversal()
+        with phase("model"):
+            children = self._tree.postorder_traversal()
         
         # Convertir cada Child a ChildResponse
-        children_response = [child.to_response() for child in children]
+        with phase("pydantic"):
+            children_response = [child.to_response() for child in children]
+            response = TraversalResponse(
+                traversal_type="postorden (izquierda - derecha - raíz)",
+                children=children_response
+            )
         
         # Retornar la respuesta con el tipo y los datos
-        return TraversalResponse(
-            traversal_type="postorden (izquierda - derecha - raíz)",
-            children=children_response
-        )
+        return response
+    
+    def export_levelorder(self, max_level: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Recorrido por niveles (BFS) como un flujo NDJSON de un nivel por línea.
+        Los niveles (referencias a los niños) se toman aquí con el candado de
+        escritura; el flujo, que StreamingResponse consume en el threadpool,
+        solo los serializa y no recorre nodos que otra escritura reorganiza.
+        Con max_level el recorrido no visita los niveles siguientes.
+        
+        Args:
+            max_level: Último nivel a incluir (la raíz es el nivel 0); None para todos
+            
+        Returns:
+            Iterador de líneas NDJSON en bytes UTF-8
+        """
+        with self._write_lock:
+            levels = list(iter_levels(self._tree.root, max_level))
+        return iter_levels_ndjson(levels)
+    
+    def get_preorder_children(self) -> List[Child]:
+        """
+        Obtiene los niños en preorden sin convertirlos a ChildResponse.
+        Reinsertarlos en este orden en un ABB vacío reconstruye la misma forma;
+        lo usan las instantáneas de los espacios de nombres.
+        
+        Returns:
+            Lista de Child en preorden
+        """
+        return self._tree.preorder_traversal()
     
     def get_all_children(self) -> List[ChildResponse]:
         """
@@ -175,6 +601,92 @@ class ABBService:
         # Convertir cada Child a ChildResponse
         return [child.to_response() for child in children]
     
+    def get_children_page(self, after_id: Optional[int], limit: int) -> ChildPageResponse:
+        """
+        Obtiene una página de niños ordenada por ID (paginación por cursor).
+        Ubica el punto de partida con un descenso O(log n) y recorre en
+        inorden solo limit + 1 nodos, sin materializar el recorrido completo.
+        
+        Args:
+            after_id: Último ID de la página anterior (None para la primera página)
+            limit: Cantidad máxima de niños en la página
+            
+        Returns:
+            ChildPageResponse con los niños y el cursor de la página siguiente
+        """
+        # Pedir un niño extra para saber si existe una página siguiente
+        children = list(islice(self._tree.iter_inorder(after_id), limit + 1))
+        has_more = len(children) > limit
+        children = children[:limit]
+        
+        return ChildPageResponse(
+            children=[child.to_response() for child in children],
+            limit=limit,
+            next_cursor=encode_cursor(children[-1].id) if has_more else None
+        )
+    
+    def query_children(
+        self,
+        city: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_age: Optional[int] = None,
+        max_age: Optional[int] = None,
+        min_id: Optional[int] = None,
+        max_id: Optional[int] = None
+    ) -> ChildQueryResponse:
+        """
+        Obtiene los niños que cumplen todos los filtros indicados.
+        Un planificador combina los mapas de bits de ciudad, género y edad con
+        operaciones vectorizadas y solo recorre el árbol completo si ningún
+        plan es selectivo.
+        
+        Args:
+            city: Ciudad exacta
+            gender: Género
+            min_age: Edad mínima (incluida)
+            max_age: Edad máxima (incluida)
+            min_id: ID mínimo (incluido)
+            max_id: ID máximo (incluido)
+            
+        Returns:
+            ChildQueryResponse con los niños (ordenados por ID) y el plan usado
+            
+        Raises:
+            ValueError: Si algún rango tiene el mínimo mayor que el máximo
+        """
+        if min_age is not None and max_age is not None and min_age > max_age:
+            raise ValueError("min_age no puede ser mayor que max_age")
+        if min_id is not None and max_id is not None and min_id > max_id:
+            raise ValueError("min_id no puede ser mayor que max_id")
+        
+        planner = FilterPlanner(self._tree, self._bitmaps)
+        children, plan = planner.execute(city, gender, min_age, max_age, min_id, max_id)
+        return ChildQueryResponse(
+            children=[child.to_response() for child in children],
+            plan=plan
+        )
+    
+    def export_children(self, export_format: ExportFormat) -> Iterator[bytes]:
+        """
+        Exporta todos los niños en orden de ID como un flujo de bloques.
+        La lista ordenada de niños (solo referencias) se toma aquí con el
+        candado de escritura, así una inserción, rotación o rebalanceo
+        concurrente no omite ni repite filas; el flujo, que StreamingResponse
+        consume en el threadpool, la serializa por bloques sin construir la
+        representación JSON completa.
+        
+        Args:
+            export_format: Formato de salida (NDJSON o CSV)
+            
+        Returns:
+            Iterador de bloques de bytes UTF-8
+        """
+        with self._write_lock:
+            children = list(self._tree.iter_inorder())
+        if export_format == ExportFormat.CSV:
+            return iter_csv(children)
+        return iter_ndjson(children)
+    
     def get_tree_count(self) -> int:
         """
         Obtiene el número total de niños en el árbol.
@@ -198,7 +710,178 @@ class ABBService:
         Elimina todos los nodos del árbol.
         Reinicia el árbol a su estado inicial vacío.
         """
-        self._tree.clear()
+        with self._write_lock:
+            self._tree.clear()
+            self._payload_cache.clear()
+            self._aggregates.clear()
+            self._age_histogram.clear()
+            self._name_index.clear()
+            self._ngram_index.clear()
+            self._bitmaps.clear()
+            self._version += 1
+    
+    def aggregate(self, group_by: str, metrics: str) -> dict:
+        """
+        Obtiene métricas por grupo a partir de los contadores incrementales.
+        Cuesta O(grupos): no recorre el árbol.
+        
+        Args:
+            group_by: Dimensiones separadas por comas (city, gender, age_bucket)
+            metrics: Métricas separadas por comas (count, sum_age, avg_age, min_age, max_age)
+            
+        Returns:
+            Diccionario con la agrupación, las métricas y la lista de grupos
+            
+        Raises:
+            ValueError: Si una dimensión o métrica no existe, o la agrupación no está configurada
+        """
+        dimensions = parse_group_by(group_by)
+        metric_names = parse_metrics(metrics)
+        groups = self._aggregates.query(dimensions, metric_names)
+        return {
+            "group_by": list(dimensions),
+            "metrics": metric_names,
+            "total_children": self._tree.get_count(),
+            "total_groups": len(groups),
+            "groups": groups
+        }
+    
+    def get_available_groupings(self) -> List[str]:
+        """
+        Obtiene las agrupaciones que se mantienen de forma incremental.
+        
+        Returns:
+            Lista de agrupaciones como "dim1,dim2"
+        """
+        return self._aggregates.available_groupings()
+    
+    def count_by_age(self, min_age: int, max_age: int, city: Optional[str] = None) -> dict:
+        """
+        Cuenta los niños con edad en [min_age, max_age] en O(log 151).
+        
+        Args:
+            min_age: Edad mínima (incluida)
+            max_age: Edad máxima (incluida)
+            city: Si se indica, solo cuenta los niños de esa ciudad
+            
+        Returns:
+            Diccionario con el rango, la ciudad y la cantidad
+        """
+        return {
+            "min_age": min_age,
+            "max_age": max_age,
+            "city": city,
+            "count": self._age_histogram.count(min_age, max_age, city),
+            "total": self._age_histogram.total(city)
+        }
+    
+    def get_age_percentile(self, p: float, city: Optional[str] = None) -> dict:
+        """
+        Obtiene un percentil de edad (rango más cercano) en O(log 151).
+        
+        Args:
+            p: Percentil en (0, 100]
+            city: Si se indica, el percentil se calcula sobre esa ciudad
+            
+        Returns:
+            Diccionario con el percentil y la edad (None si no hay niños)
+        """
+        return {
+            "p": p,
+            "city": city,
+            "age": self._age_histogram.percentile(p, city),
+            "total": self._age_histogram.total(city)
+        }
+    
+    def get_age_median(self, city: Optional[str] = None) -> dict:
+        """
+        Obtiene la mediana de edad en O(log 151).
+        
+        Args:
+            city: Si se indica, la mediana se calcula sobre esa ciudad
+            
+        Returns:
+            Diccionario con la mediana (None si no hay niños)
+        """
+        return {
+            "city": city,
+            "median_age": self._age_histogram.median(city),
+            "total": self._age_histogram.total(city)
+        }
+    
+    def _get_snapshot(self) -> ColumnarSnapshot:
+        """
+        Devuelve la copia columnar del árbol, reconstruyéndola solo si hubo
+        mutaciones desde la última construcción.
+        
+        Returns:
+            ColumnarSnapshot vigente
+        """
+        if self._snapshot is None or self._snapshot.version != self._version:
+            self._snapshot = ColumnarSnapshot(self._tree.iter_inorder(), self._version)
+        return self._snapshot
+    
+    def get_age_stats(self, group_by: str, percentiles: str) -> dict:
+        """
+        Obtiene cantidad, media, mediana y percentiles de edad por grupo
+        con operaciones vectorizadas sobre la copia columnar.
+        
+        Args:
+            group_by: "city", "gender", "city,gender" o vacío para no agrupar
+            percentiles: Percentiles separados por comas (por ejemplo "25,50,90")
+            
+        Returns:
+            Diccionario con la agrupación, el total y los grupos
+            
+        Raises:
+            ValueError: Si la agrupación o algún percentil no es válido
+        """
+        dimensions = parse_stats_group_by(group_by)
+        values = parse_percentiles(percentiles)
+        snapshot = self._get_snapshot()
+        return {
+            "group_by": list(dimensions),
+            "total": len(snapshot),
+            "groups": snapshot.age_stats(dimensions, values)
+        }
+    
+    def get_age_distribution(self, bin_size: int, city: Optional[str] = None, gender: Optional[str] = None) -> dict:
+        """
+        Obtiene el histograma de edades a partir de la copia columnar.
+        
+        Args:
+            bin_size: Ancho de cada intervalo en años
+            city: Ciudad (opcional)
+            gender: Género (opcional)
+            
+        Returns:
+            Diccionario con los filtros, el total y los intervalos no vacíos
+        """
+        bins = self._get_snapshot().histogram(bin_size, city, gender)
+        return {
+            "bin_size": bin_size,
+            "city": city,
+            "gender": gender,
+            "total": sum(item["count"] for item in bins),
+            "bins": bins
+        }
+    
+    def rebalance_tree(self) -> dict:
+        """
+        Reorganiza el ABB en forma balanceada (Day–Stout–Warren, O(n)).
+        Los datos no cambian, solo la forma del árbol.
+        
+        Returns:
+            Diccionario con la altura antes y después y la altura mínima posible
+        """
+        with self._write_lock:
+            height_before, height_after = self._tree.rebalance()
+        return {
+            "total_children": self._tree.get_count(),
+            "height_before": height_before,
+            "height_after": height_after,
+            "optimal_height": self._tree.get_count().bit_length()
+        }
     
     def get_tree_stats(self) -> dict:
         """
@@ -220,12 +903,8 @@ class ABBService:
                 "max_id": None
             }
         
-        # Obtener todos los niños
-        all_children = self._tree.inorder_traversal()
-        
-        # El recorrido inorden está ordenado, el primero es el mínimo y el último el máximo
-        min_child = all_children[0] if all_children else None
-        max_child = all_children[-1] if all_children else None
+        # La copia columnar está en orden inorden: el primer ID es el mínimo y el último el máximo
+        ids = self._get_snapshot().ids
         
         # Obtener el niño en la raíz
         root_child = self._tree.root.child if self._tree.root else None
@@ -235,13 +914,14 @@ class ABBService:
             "total_children": self._tree.get_count(),
             "is_empty": False,
             "root_child": root_child.to_response() if root_child else None,
-            "min_id": min_child.id if min_child else None,
-            "max_id": max_child.id if max_child else None
+            "min_id": int(ids[0]),
+            "max_id": int(ids[-1])
         }
     
     def get_kids_by_city_and_gender(self) -> dict:
         """
         Obtiene estadísticas de niños agrupados por ciudad y género.
+        Usa los contadores incrementales, así que cuesta O(ciudades) y no O(n).
         Para cada ciudad muestra:
         - Cantidad de niños por género (male, female, other)
         - Total de niños en la ciudad
@@ -249,11 +929,11 @@ class ABBService:
         Returns:
             Diccionario con estadísticas por ciudad y género
         """
-        # Obtener todos los niños del árbol
-        all_children = self._tree.inorder_traversal()
+        # Contadores ciudad × género mantenidos en cada inserción
+        city_gender_counts = self._aggregates.group_counters(("city", "gender"))
         
         # Si no hay niños, retornar estructura vacía
-        if not all_children:
+        if not city_gender_counts:
             return {
                 "total_children": 0,
                 "cities": []
@@ -262,11 +942,8 @@ class ABBService:
         # Diccionario para agrupar por ciudad
         cities_data = {}
         
-        # Agrupar niños por ciudad y contar por género
-        for child in all_children:
-            city = child.city
-            gender = child.gender.value
-            
+        # Repartir los contadores de cada grupo (ciudad, género) por ciudad
+        for (city, gender), counters in city_gender_counts.items():
             # Si la ciudad no existe en el diccionario, crearla
             if city not in cities_data:
                 cities_data[city] = {
@@ -275,8 +952,8 @@ class ABBService:
                     "other": 0
                 }
             
-            # Incrementar el contador del género correspondiente
-            cities_data[city][gender] += 1
+            # Asignar el contador del género correspondiente
+            cities_data[city][gender] = counters.count
         
         # Construir la lista de respuesta con el formato solicitado
         cities_list = []
@@ -295,7 +972,7 @@ class ABBService:
         
         # Retornar respuesta completa
         return {
-            "total_children": len(all_children),
+            "total_children": self._tree.get_count(),
             "total_cities": len(cities_list),
             "cities": cities_list
         }
@@ -0,0 +1,334 @@
+import os
+import re
+import threading
+import time
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Union
+from app.config import settings
+from app.models.schemas import ChildCreate
+from app.services.abb_service import ABBService
+from app.services.avl_service import AVLService
+from app.utils.snapshot import read_snapshot, read_snapshot_header, write_snapshot
+
+# Motores disponibles para un espacio de nombres
+NAMESPACE_ENGINES = ("abb", *AVLService.ENGINES)
+
+# Nombres válidos: también son nombres de archivo de las instantáneas
+NAMESPACE_NAME_PATTERN = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
+
+# Extensión de las instantáneas en disco
+SNAPSHOT_SUFFIX = ".ndjson.gz"
+
+
+class NamespaceExistsError(ValueError):
+    """Se intentó crear un espacio de nombres que ya existe."""
+
+
+class Namespace:
+    """
+    Árbol independiente de un espacio de nombres (por ejemplo, un colegio)
+    con su propio servicio: índices, cachés y contadores no se comparten.
+    """
+
+    def __init__(self, name: str, engine: str, service: Union[ABBService, AVLService], now: float):
+        """
+        Args:
+            name: Nombre del espacio
+            engine: Motor del árbol ("abb" o un motor del AVL)
+            service: Servicio que contiene el árbol
+            now: Instante de creación o recarga (reloj monotónico)
+        """
+        self.name = name
+        self.engine = engine
+        self.service = service
+        self.last_access = now
+        self.reloads = 0
+
+
+class NamespaceRegistry:
+    """
+    Registro de los espacios de nombres de /trees/{name}.
+
+    Cada espacio se crea a pedido con el motor elegido. Los que pasan más
+    de idle_seconds sin accesos se escriben en una instantánea comprimida y
+    se descargan de la memoria; el siguiente acceso los recarga sin que el
+    cliente lo note. Los espacios descargados (también los de ejecuciones
+    anteriores del proceso) se reconocen por su archivo en snapshot_dir.
+
+    Los servicios son síncronos y los endpoints corren en el bucle de
+    eventos, así que un espacio no se descarga mientras una petición lo usa.
+    """
+
+    def __init__(self, snapshot_dir: str, idle_seconds: Optional[float], default_engine: str,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            snapshot_dir: Directorio de las instantáneas
+            idle_seconds: Segundos sin accesos antes de descargar un espacio (None nunca)
+            default_engine: Motor de los espacios creados sin indicar uno
+            clock: Reloj monotónico (reemplazable en las pruebas)
+        """
+        self.snapshot_dir = snapshot_dir
+        self.idle_seconds = idle_seconds
+        self.default_engine = default_engine
+        self._clock = clock
+        self._namespaces: Dict[str, Namespace] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _validate_name(name: str):
+        """
+        Raises:
+            ValueError: Si el nombre no es válido
+        """
+        if not NAMESPACE_NAME_PATTERN.match(name):
+            raise ValueError(
+                f"Nombre de espacio inválido: '{name}'. Use minúsculas, dígitos, '-' o '_' "
+                "(hasta 64 caracteres, comenzando con letra o dígito)"
+            )
+
+    def _snapshot_path(self, name: str) -> str:
+        """Ruta de la instantánea de un espacio."""
+        return os.path.join(self.snapshot_dir, f"{name}{SNAPSHOT_SUFFIX}")
+
+    @staticmethod
+    def _create_service(engine: str) -> Union[ABBService, AVLService]:
+        """
+        Crea el servicio de un motor.
+
+        Raises:
+            ValueError: Si el motor no existe
+        """
+        if engine == "abb":
+            return ABBService()
+        if engine not in AVLService.ENGINES:
+            raise ValueError(
+                f"Motor desconocido: '{engine}'. Opciones válidas: {', '.join(NAMESPACE_ENGINES)}"
+            )
+        return AVLService(engine=engine)
+
+    def _evict_idle(self, now: float, keep: Optional[str] = None) -> List[str]:
+        """
+        Descarga los espacios sin accesos por más de idle_seconds.
+        Se llama con el candado tomado.
+
+        Args:
+            now: Instante actual
+            keep: Espacio que no se descarga (el que se está accediendo)
+
+        Returns:
+            Nombres de los espacios descargados
+        """
+        if self.idle_seconds is None:
+            return []
+        idle = [
+            name for name, namespace in self._namespaces.items()
+            if name != keep and now - namespace.last_access > self.idle_seconds
+        ]
+        for name in idle:
+            self._unload(name)
+        return idle
+
+    def _unload(self, name: str):
+        """
+        Escribe la instantánea de un espacio cargado y lo saca de la memoria.
+        Los niños se guardan en preorden: reinsertarlos en ese orden
+        reconstruye exactamente la misma forma en un ABB.
+        """
+        namespace = self._namespaces[name]
+        write_snapshot(
+            self._snapshot_path(name),
+            {
+                "name": name,
+                "engine": namespace.engine,
+                "count": namespace.service.get_tree_count(),
+                "reloads": namespace.reloads,
+            },
+            namespace.service.get_preorder_children()
+        )
+        del self._namespaces[name]
+
+    def _load(self, name: str, now: float) -> Optional[Namespace]:
+        """
+        Recarga un espacio desde su instantánea (que se borra al terminar).
+
+        Returns:
+            Espacio recargado, o None si no hay instantánea
+        """
+        path = self._snapshot_path(name)
+        if not os.path.exists(path):
+            return None
+        header, rows = read_snapshot(path)
+        service = self._create_service(header["engine"])
+        while True:
+            chunk = [ChildCreate(**row) for row in islice(rows, settings.IMPORT_CHUNK_SIZE)]
+            if not chunk:
+                break
+            service.import_children_chunk(chunk)
+        namespace = Namespace(name, header["engine"], service, now)
+        namespace.reloads = header.get("reloads", 0) + 1
+        self._namespaces[name] = namespace
+        os.remove(path)
+        return namespace
+
+    def get(self, name: str) -> Optional[Namespace]:
+        """
+        Obtiene un espacio, recargándolo si estaba descargado, y registra el acceso.
+
+        Args:
+            name: Nombre del espacio
+
+        Returns:
+            Espacio, o None si no existe
+
+        Raises:
+            ValueError: Si el nombre no es válido
+        """
+        self._validate_name(name)
+        with self._lock:
+            now = self._clock()
+            self._evict_idle(now, keep=name)
+            namespace = self._namespaces.get(name) or self._load(name, now)
+            if namespace is not None:
+                namespace.last_access = now
+            return namespace
+
+    def create(self, name: str, engine: Optional[str] = None) -> Namespace:
+        """
+        Crea un espacio vacío.
+
+        Args:
+            name: Nombre del espacio
+            engine: Motor del árbol (None usa el motor por defecto)
+
+        Returns:
+            Espacio creado
+
+        Raises:
+            ValueError: Si el nombre o el motor no son válidos
+            NamespaceExistsError: Si el espacio ya existe
+        """
+        self._validate_name(name)
+        engine = engine or self.default_engine
+        with self._lock:
+            now = self._clock()
+            self._evict_idle(now)
+            if name in self._namespaces or os.path.exists(self._snapshot_path(name)):
+                raise NamespaceExistsError(f"El espacio '{name}' ya existe")
+            namespace = Namespace(name, engine, self._create_service(engine), now)
+            self._namespaces[name] = namespace
+            return namespace
+
+    def get_or_create(self, name: str, engine: Optional[str] = None) -> Namespace:
+        """
+        Obtiene un espacio o lo crea si no existe (escrituras a pedido).
+
+        Args:
+            name: Nombre del espacio
+            engine: Motor si hay que crearlo (None usa el motor por defecto)
+
+        Returns:
+            Espacio existente o recién creado
+        """
+        with self._lock:
+            return self.get(name) or self.create(name, engine)
+
+    def delete(self, name: str) -> bool:
+        """
+        Elimina un espacio, cargado o descargado, y su instantánea.
+
+        Args:
+            name: Nombre del espacio
+
+        Returns:
+            True si existía
+        """
+        self._validate_name(name)
+        with self._lock:
+            existed = self._namespaces.pop(name, None) is not None
+            path = self._snapshot_path(name)
+            if os.path.exists(path):
+                os.remove(path)
+                existed = True
+            return existed
+
+    def evict_idle(self) -> List[str]:
+        """
+        Descarga ahora los espacios inactivos (también ocurre en cada acceso).
+
+        Returns:
+            Nombres de los espacios descargados
+        """
+        with self._lock:
+            return self._evict_idle(self._clock())
+
+    def describe(self, namespace: Namespace, measure_memory: bool = False) -> dict:
+        """
+        Estado de un espacio cargado.
+
+        Args:
+            namespace: Espacio
+            measure_memory: Si True, mide la memoria del árbol (O(n))
+
+        Returns:
+            Diccionario con nombre, motor, estado, nodos, bytes e inactividad
+        """
+        info = {
+            "name": namespace.name,
+            "engine": namespace.engine,
+            "state": "loaded",
+            "nodes": namespace.service.get_tree_count(),
+            "memory_bytes": None,
+            "snapshot_bytes": None,
+            "idle_seconds": round(self._clock() - namespace.last_access, 3),
+            "reloads": namespace.reloads,
+        }
+        if measure_memory:
+            info["memory_bytes"] = namespace.service.get_memory_usage()["total_bytes"]
+        return info
+
+    def list(self) -> dict:
+        """
+        Lista los espacios cargados y descargados.
+        Para los cargados informa la cantidad de nodos (O(1)); la memoria
+        se mide por espacio en GET /trees/{name}. Para los descargados,
+        los nodos guardados y el tamaño de la instantánea.
+
+        Returns:
+            Diccionario con los espacios y los totales
+        """
+        with self._lock:
+            self._evict_idle(self._clock())
+            namespaces = [self.describe(namespace) for namespace in self._namespaces.values()]
+            if os.path.isdir(self.snapshot_dir):
+                for file_name in sorted(os.listdir(self.snapshot_dir)):
+                    if not file_name.endswith(SNAPSHOT_SUFFIX):
+                        continue
+                    path = os.path.join(self.snapshot_dir, file_name)
+                    header = read_snapshot_header(path)
+                    namespaces.append({
+                        "name": header["name"],
+                        "engine": header["engine"],
+                        "state": "evicted",
+                        "nodes": header["count"],
+                        "memory_bytes": 0,
+                        "snapshot_bytes": os.path.getsize(path),
+                        "idle_seconds": None,
+                        "reloads": header.get("reloads", 0),
+                    })
+        namespaces.sort(key=lambda info: info["name"])
+        return {
+            "total_namespaces": len(namespaces),
+            "loaded": sum(1 for info in namespaces if info["state"] == "loaded"),
+            "total_nodes": sum(info["nodes"] for info in namespaces),
+            "snapshot_bytes": sum(info["snapshot_bytes"] or 0 for info in namespaces),
+            "namespaces": namespaces,
+        }
+
+
+# Instancia única del registro de espacios de nombres
+namespace_registry = NamespaceRegistry(
+    settings.NAMESPACE_SNAPSHOT_DIR,
+    settings.NAMESPACE_IDLE_SECONDS,
+    settings.NAMESPACE_DEFAULT_ENGINE
+)
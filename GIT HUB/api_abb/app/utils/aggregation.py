@@ -0,0 +1,217 @@
+from typing import Dict, Iterable, List, Tuple
+
+# Dimensiones por las que se puede agrupar, en orden canónico
+GROUP_DIMENSIONS = ("city", "gender", "age_bucket")
+
+# Métricas disponibles por grupo
+METRICS = ("count", "sum_age", "avg_age", "min_age", "max_age")
+
+
+def parse_group_by(text: str) -> Tuple[str, ...]:
+    """
+    Convierte "gender,city" en una agrupación canónica ("city", "gender").
+
+    Args:
+        text: Dimensiones separadas por comas
+
+    Returns:
+        Tupla de dimensiones sin repetir, en el orden de GROUP_DIMENSIONS
+
+    Raises:
+        ValueError: Si la lista está vacía o incluye una dimensión desconocida
+    """
+    names = {name.strip() for name in text.split(",") if name.strip()}
+    if not names:
+        raise ValueError("Debe indicar al menos una dimensión en group_by")
+    unknown = names - set(GROUP_DIMENSIONS)
+    if unknown:
+        raise ValueError(
+            f"Dimensiones desconocidas: {', '.join(sorted(unknown))}. "
+            f"Opciones válidas: {', '.join(GROUP_DIMENSIONS)}"
+        )
+    return tuple(name for name in GROUP_DIMENSIONS if name in names)
+
+
+def parse_metrics(text: str) -> List[str]:
+    """
+    Convierte "count,avg_age" en la lista de métricas solicitadas.
+
+    Raises:
+        ValueError: Si la lista está vacía o incluye una métrica desconocida
+    """
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    if not names:
+        raise ValueError("Debe indicar al menos una métrica")
+    unknown = [name for name in names if name not in METRICS]
+    if unknown:
+        raise ValueError(
+            f"Métricas desconocidas: {', '.join(unknown)}. "
+            f"Opciones válidas: {', '.join(METRICS)}"
+        )
+    return list(dict.fromkeys(names))
+
+
+class GroupCounters:
+    """
+    Contadores de un grupo: cantidad, suma de edades y multiconjunto de edades.
+    El multiconjunto permite mantener mínimo y máximo también al eliminar;
+    como las edades están acotadas a 0–150 tiene a lo sumo 151 entradas.
+    """
+
+    __slots__ = ("count", "age_sum", "ages")
+
+    def __init__(self):
+        self.count = 0
+        self.age_sum = 0
+        self.ages: Dict[int, int] = {}
+
+    def add(self, age: int):
+        self.count += 1
+        self.age_sum += age
+        self.ages[age] = self.ages.get(age, 0) + 1
+
+    def remove(self, age: int):
+        self.count -= 1
+        self.age_sum -= age
+        remaining = self.ages[age] - 1
+        if remaining:
+            self.ages[age] = remaining
+        else:
+            del self.ages[age]
+
+    def metric(self, name: str):
+        """Valor de una métrica del grupo."""
+        if name == "count":
+            return self.count
+        if name == "sum_age":
+            return self.age_sum
+        if name == "avg_age":
+            return round(self.age_sum / self.count, 4)
+        if name == "min_age":
+            return min(self.ages)
+        return max(self.ages)
+
+
+class GroupAggregator:
+    """
+    Agregaciones por grupo mantenidas de forma incremental.
+
+    Para cada agrupación configurada (por ejemplo ("city",) o ("city", "gender"))
+    guarda los contadores de cada grupo y los actualiza en cada inserción o
+    eliminación. Consultar una agrupación cuesta O(grupos) en lugar de
+    recorrer todos los niños del árbol.
+    """
+
+    def __init__(self, group_specs: Iterable[str], age_bucket_size: int = 5):
+        """
+        Constructor del agregador.
+
+        Args:
+            group_specs: Agrupaciones a mantener, cada una como "dim1,dim2"
+            age_bucket_size: Ancho de los rangos de edad de la dimensión age_bucket
+        """
+        if age_bucket_size < 1:
+            raise ValueError("El ancho de los rangos de edad debe ser al menos 1")
+        self._age_bucket_size = age_bucket_size
+        self._groups: Dict[Tuple[str, ...], Dict[tuple, GroupCounters]] = {
+            parse_group_by(spec): {} for spec in group_specs
+        }
+
+    def _dimension_value(self, child, dimension: str):
+        """Valor de una dimensión para un niño."""
+        if dimension == "city":
+            return child.city
+        if dimension == "gender":
+            return child.gender.value
+        lower = child.age // self._age_bucket_size * self._age_bucket_size
+        return f"{lower}-{lower + self._age_bucket_size - 1}"
+
+    @staticmethod
+    def _sort_key(group_by: Tuple[str, ...], key: tuple) -> tuple:
+        """
+        Clave de orden de un grupo: los rangos de edad se ordenan por su
+        límite inferior numérico ("5-9" antes que "10-14").
+        """
+        return tuple(
+            int(value.split("-", 1)[0]) if dimension == "age_bucket" else value
+            for dimension, value in zip(group_by, key)
+        )
+
+    def add(self, child):
+        """
+        Registra un niño en todas las agrupaciones.
+
+        Args:
+            child: Objeto Child insertado en el árbol
+        """
+        for spec, groups in self._groups.items():
+            key = tuple(self._dimension_value(child, dimension) for dimension in spec)
+            counters = groups.get(key)
+            if counters is None:
+                counters = groups[key] = GroupCounters()
+            counters.add(child.age)
+
+    def remove(self, child):
+        """
+        Quita un niño de todas las agrupaciones.
+
+        Args:
+            child: Objeto Child eliminado del árbol (con los valores que tenía)
+        """
+        for spec, groups in self._groups.items():
+            key = tuple(self._dimension_value(child, dimension) for dimension in spec)
+            counters = groups[key]
+            counters.remove(child.age)
+            if counters.count == 0:
+                del groups[key]
+
+    def clear(self):
+        """Reinicia todos los contadores."""
+        for groups in self._groups.values():
+            groups.clear()
+
+    def available_groupings(self) -> List[str]:
+        """Agrupaciones mantenidas, como "dim1,dim2"."""
+        return [",".join(spec) for spec in self._groups]
+
+    def query(self, group_by: Tuple[str, ...], metrics: List[str]) -> List[dict]:
+        """
+        Obtiene las métricas de cada grupo de una agrupación.
+
+        Args:
+            group_by: Agrupación canónica (ver parse_group_by)
+            metrics: Métricas a calcular (ver parse_metrics)
+
+        Returns:
+            Lista de grupos ordenada por sus claves; cada grupo incluye
+            el valor de sus dimensiones y las métricas pedidas
+
+        Raises:
+            ValueError: Si la agrupación no se mantiene
+        """
+        groups = self._groups.get(group_by)
+        if groups is None:
+            raise ValueError(
+                f"La agrupación '{','.join(group_by)}' no está configurada. "
+                f"Disponibles: {'; '.join(self.available_groupings())}"
+            )
+        result = []
+        for key in sorted(groups, key=lambda key: self._sort_key(group_by, key)):
+            counters = groups[key]
+            row = dict(zip(group_by, key))
+            for name in metrics:
+                row[name] = counters.metric(name)
+            result.append(row)
+        return result
+
+    def group_counters(self, group_by: Tuple[str, ...]) -> Dict[tuple, GroupCounters]:
+        """
+        Acceso directo a los contadores de una agrupación mantenida.
+
+        Args:
+            group_by: Agrupación canónica
+
+        Returns:
+            Diccionario clave_de_grupo -> GroupCounters
+        """
+        return self._groups[group_by]
@@ -0,0 +1,138 @@
+from typing import List, Optional, Tuple
+
+from app.models.abb_model import Child
+from app.models.schemas import BatchItem, BatchOperationType
+
+# Tipos de cambio que devuelve apply_operations
+INSERTED, UPDATED, DELETED = "inserted", "updated", "deleted"
+
+
+class BatchConflictError(ValueError):
+    """
+    Una operación del lote no se pudo aplicar (ID repetido, inexistente o
+    datos inválidos). Cuando se lanza, el árbol ya quedó como antes del lote.
+    """
+
+    def __init__(self, index: int, item: BatchItem, reason: str):
+        """
+        Args:
+            index: Posición de la operación en el lote (desde 0)
+            item: Operación que falló
+            reason: Motivo del fallo
+        """
+        super().__init__(f"Operación {index} ({item.op.value} del ID {item.id}): {reason}")
+        self.index = index
+
+
+def _fields(item: BatchItem) -> dict:
+    """Campos de datos enviados en una operación."""
+    return item.dict(exclude={"op", "id"}, exclude_none=True)
+
+
+def apply_operations(tree, items: List[BatchItem]) -> List[Tuple[str, Optional[Child], Optional[Child]]]:
+    """
+    Aplica un lote de operaciones al árbol como una unidad.
+
+    Cada operación aplicada deja en un registro de deshacer la operación
+    inversa (eliminar lo insertado, restaurar los datos anteriores o volver a
+    insertar lo eliminado). Si alguna falla, el registro se recorre al revés
+    y el árbol vuelve a su contenido anterior antes de lanzar el error.
+    Solo toca el árbol: el llamador actualiza los índices con los cambios.
+
+    Los árboles con batch() (el AVL persistente) aplican el lote sobre una
+    raíz local que se publica una sola vez al final: los lectores sin
+    candado nunca ven un lote a medias, y ante un fallo la raíz local se
+    descarta en lugar de deshacer operación por operación.
+
+    Args:
+        tree: Árbol del servicio (cualquier motor con insert, update y delete)
+        items: Operaciones ya validadas, en orden
+
+    Returns:
+        Lista de cambios (tipo, niño_anterior, niño_nuevo) en el orden aplicado
+
+    Raises:
+        BatchConflictError: Si alguna operación falla (el árbol queda intacto)
+    """
+    if hasattr(tree, "batch"):
+        # Un BatchConflictError sale del bloque y la raíz local se descarta
+        with tree.batch() as draft:
+            return _apply_all(draft, items, rollback=False)
+    return _apply_all(tree, items, rollback=True)
+
+
+def _apply_all(tree, items: List[BatchItem], rollback: bool) -> List[Tuple[str, Optional[Child], Optional[Child]]]:
+    """
+    Aplica las operaciones en orden y se detiene en la primera que falla.
+
+    Args:
+        tree: Árbol (o lote) con insert, update y delete
+        items: Operaciones ya validadas, en orden
+        rollback: Si True, deshace los cambios aplicados antes de lanzar el error
+
+    Returns:
+        Lista de cambios (tipo, niño_anterior, niño_nuevo) en el orden aplicado
+
+    Raises:
+        BatchConflictError: Si alguna operación falla
+    """
+    changes: List[Tuple[str, Optional[Child], Optional[Child]]] = []
+    for index, item in enumerate(items):
+        try:
+            change = _apply_item(tree, item)
+        except ValueError as exc:
+            if rollback:
+                _rollback(tree, changes)
+            raise BatchConflictError(index, item, str(exc))
+        if change is None:
+            if rollback:
+                _rollback(tree, changes)
+            reason = "el ID ya existe" if item.op == BatchOperationType.INSERT else "el ID no existe"
+            raise BatchConflictError(index, item, reason)
+        changes.append(change)
+    return changes
+
+
+def _apply_item(tree, item: BatchItem) -> Optional[Tuple[str, Optional[Child], Optional[Child]]]:
+    """
+    Aplica una operación.
+
+    Returns:
+        El cambio aplicado, o None si la operación no corresponde al estado del árbol
+
+    Raises:
+        ValueError: Si los datos no forman un niño válido
+    """
+    if item.op == BatchOperationType.DELETE:
+        removed = tree.delete(item.id)
+        return None if removed is None else (DELETED, removed, None)
+
+    if item.op == BatchOperationType.UPDATE:
+        result = tree.update(item.id, _fields(item))
+        return None if result is None else (UPDATED, *result)
+
+    child = Child(id=item.id, **_fields(item))
+    if tree.insert(child):
+        return INSERTED, None, child
+    if item.op == BatchOperationType.INSERT:
+        return None
+    # upsert de un ID existente: reemplazar todos sus datos
+    result = tree.update(item.id, _fields(item))
+    return UPDATED, *result
+
+
+def _rollback(tree, changes: List[Tuple[str, Optional[Child], Optional[Child]]]):
+    """
+    Deshace los cambios aplicados, del último al primero.
+
+    Args:
+        tree: Árbol del servicio
+        changes: Cambios aplicados hasta el fallo
+    """
+    for kind, previous, child in reversed(changes):
+        if kind == INSERTED:
+            tree.delete(child.id)
+        elif kind == UPDATED:
+            tree.update(previous.id, previous.dict())
+        else:
+            tree.insert(previous)
@@ -0,0 +1,253 @@
+from typing import Dict, Hashable, Iterable, Optional
+
+import numpy as np
+
+# Bits por palabra de los mapas de bits
+WORD_BITS = 64
+# Capacidad inicial en palabras (se duplica al llenarse)
+INITIAL_WORDS = 16
+
+
+def popcount(words: np.ndarray) -> int:
+    """
+    Cantidad de bits encendidos en un mapa de bits.
+
+    Args:
+        words: Arreglo uint64 del mapa de bits
+
+    Returns:
+        Número de bits en 1
+    """
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(words).sum())
+    # NumPy < 2.0: contar sobre la vista en bytes
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+
+class BitmapIndex:
+    """
+    Índice de igualdad de un campo con un mapa de bits por valor.
+    El bit r del mapa de un valor está encendido si la fila r tiene ese valor.
+    Todos los mapas de un índice comparten la misma capacidad, así que se
+    combinan directamente con operaciones vectorizadas de NumPy (&, |).
+    """
+
+    def __init__(self):
+        """Constructor del índice vacío."""
+        self._words = INITIAL_WORDS
+        self._bitmaps: Dict[Hashable, np.ndarray] = {}
+        # Cantidad de filas por valor, mantenida en cada cambio
+        self._counts: Dict[Hashable, int] = {}
+
+    def _grow(self, words: int):
+        """
+        Amplía todos los mapas a al menos `words` palabras.
+
+        Args:
+            words: Capacidad mínima en palabras
+        """
+        new_words = self._words
+        while new_words < words:
+            new_words *= 2
+        for value, bitmap in self._bitmaps.items():
+            grown = np.zeros(new_words, dtype=np.uint64)
+            grown[:len(bitmap)] = bitmap
+            self._bitmaps[value] = grown
+        self._words = new_words
+
+    def add(self, value: Hashable, row: int):
+        """
+        Marca la fila con un valor.
+
+        Args:
+            value: Valor del campo
+            row: Número de fila denso
+        """
+        word = row >> 6
+        if word >= self._words:
+            self._grow(word + 1)
+        bitmap = self._bitmaps.get(value)
+        if bitmap is None:
+            bitmap = self._bitmaps[value] = np.zeros(self._words, dtype=np.uint64)
+        bitmap[word] |= np.uint64(1 << (row & 63))
+        self._counts[value] = self._counts.get(value, 0) + 1
+
+    def remove(self, value: Hashable, row: int):
+        """
+        Desmarca la fila para un valor.
+
+        Args:
+            value: Valor con el que fue marcada
+            row: Número de fila denso
+        """
+        bitmap = self._bitmaps.get(value)
+        if bitmap is None:
+            return
+        bitmap[row >> 6] &= ~np.uint64(1 << (row & 63))
+        self._counts[value] -= 1
+        if not self._counts[value]:
+            del self._counts[value]
+            del self._bitmaps[value]
+
+    def clear(self):
+        """Elimina todos los mapas."""
+        self._words = INITIAL_WORDS
+        self._bitmaps.clear()
+        self._counts.clear()
+
+    def count(self, value: Hashable) -> int:
+        """
+        Cantidad de filas con un valor (sin recorrer el mapa).
+
+        Args:
+            value: Valor buscado
+
+        Returns:
+            Número de filas
+        """
+        return self._counts.get(value, 0)
+
+    def bitmap(self, value: Hashable, words: int) -> np.ndarray:
+        """
+        Mapa de bits de un valor con `words` palabras.
+
+        Args:
+            value: Valor buscado
+            words: Longitud del resultado (capacidad común de la consulta)
+
+        Returns:
+            Arreglo uint64 (todo ceros si el valor no existe); no se debe modificar
+        """
+        bitmap = self._bitmaps.get(value)
+        if bitmap is None:
+            return np.zeros(words, dtype=np.uint64)
+        return bitmap[:words] if len(bitmap) >= words else np.pad(bitmap, (0, words - len(bitmap)))
+
+    def union(self, values: Iterable[Hashable], words: int) -> np.ndarray:
+        """
+        Unión (OR) de los mapas de varios valores, por ejemplo un rango de edades.
+
+        Args:
+            values: Valores a unir
+            words: Longitud del resultado
+
+        Returns:
+            Arreglo uint64 nuevo
+        """
+        result = np.zeros(words, dtype=np.uint64)
+        for value in values:
+            if value in self._bitmaps:
+                np.bitwise_or(result, self.bitmap(value, words), out=result)
+        return result
+
+
+class RowBitmaps:
+    """
+    Mapas de bits de ciudad, género y edad sobre números de fila densos.
+
+    Cada niño recibe un número de fila consecutivo al insertarse; un arreglo
+    fila -> ID permite traducir el resultado de una intersección a IDs.
+    Las filas de niños eliminados quedan sin bits encendidos y no se reutilizan.
+    """
+
+    FIELDS = ("city", "gender", "age")
+
+    def __init__(self):
+        """Constructor de los índices vacíos."""
+        self._indexes = {field: BitmapIndex() for field in self.FIELDS}
+        self._row_of: Dict[int, int] = {}
+        self._row_ids = np.zeros(INITIAL_WORDS * WORD_BITS, dtype=np.int64)
+        self._next_row = 0
+
+    @property
+    def words(self) -> int:
+        """Palabras necesarias para cubrir todas las filas asignadas."""
+        return (self._next_row + WORD_BITS - 1) // WORD_BITS
+
+    def index(self, field: str) -> BitmapIndex:
+        """
+        Índice de un campo.
+
+        Args:
+            field: "city", "gender" o "age"
+
+        Returns:
+            BitmapIndex del campo
+        """
+        return self._indexes[field]
+
+    def add(self, child):
+        """
+        Asigna una fila al niño y marca sus valores.
+
+        Args:
+            child: Objeto Child recién insertado
+        """
+        row = self._next_row
+        self._next_row += 1
+        if row >= len(self._row_ids):
+            self._row_ids = np.concatenate([self._row_ids, np.zeros(len(self._row_ids), dtype=np.int64)])
+        self._row_ids[row] = child.id
+        self._row_of[child.id] = row
+        for field in self.FIELDS:
+            self._indexes[field].add(getattr(child, field), row)
+
+    def remove(self, child):
+        """
+        Desmarca los valores del niño y libera su fila.
+
+        Args:
+            child: Objeto Child tal como fue indexado
+        """
+        row = self._row_of.pop(child.id, None)
+        if row is None:
+            return
+        for field in self.FIELDS:
+            self._indexes[field].remove(getattr(child, field), row)
+
+    def update(self, previous, child):
+        """
+        Mueve la fila de un niño actualizado a sus valores nuevos.
+        Conserva el número de fila y solo toca los campos que cambiaron.
+
+        Args:
+            previous: Niño tal como fue indexado
+            child: Niño con los datos nuevos (mismo ID)
+        """
+        row = self._row_of.get(child.id)
+        if row is None:
+            return
+        for field in self.FIELDS:
+            old_value, new_value = getattr(previous, field), getattr(child, field)
+            if old_value != new_value:
+                self._indexes[field].remove(old_value, row)
+                self._indexes[field].add(new_value, row)
+
+    def clear(self):
+        """Elimina todas las filas y mapas."""
+        for index in self._indexes.values():
+            index.clear()
+        self._row_of.clear()
+        self._row_ids = np.zeros(INITIAL_WORDS * WORD_BITS, dtype=np.int64)
+        self._next_row = 0
+
+    def ids(self, bitmap: np.ndarray, min_id: Optional[int] = None, max_id: Optional[int] = None) -> np.ndarray:
+        """
+        IDs ordenados de las filas encendidas en un mapa, opcionalmente
+        recortados a un rango de IDs.
+
+        Args:
+            bitmap: Mapa de bits con `words` palabras
+            min_id: ID mínimo (incluido)
+            max_id: ID máximo (incluido)
+
+        Returns:
+            Arreglo int64 de IDs en orden ascendente
+        """
+        # Los bits de la palabra w corresponden a las filas 64·w .. 64·w + 63
+        bits = np.unpackbits(bitmap.astype("<u8", copy=False).view(np.uint8), bitorder="little")
+        rows = np.flatnonzero(bits[:self._next_row])
+        ids = np.sort(self._row_ids[rows])
+        lo = 0 if min_id is None else np.searchsorted(ids, min_id, side="left")
+        hi = len(ids) if max_id is None else np.searchsorted(ids, max_id, side="right")
+        return ids[lo:hi]
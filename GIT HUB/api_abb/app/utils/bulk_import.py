@@ -0,0 +1,219 @@
+import asyncio
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+from pydantic import ValidationError
+from starlette.datastructures import UploadFile
+from starlette.requests import Request
+
+from app.models.schemas import ChildCreate, ExportFormat, ImportResultResponse, ImportRowError
+from app.utils.export import EXPORT_FIELDS
+
+# Tamaño de lectura de archivos subidos
+UPLOAD_READ_SIZE = 64 * 1024
+
+# Máximo de filas inválidas detalladas en la respuesta
+MAX_REPORTED_ERRORS = 100
+
+
+async def _read_upload(upload: UploadFile) -> AsyncIterator[bytes]:
+    """Lee un archivo subido en bloques sin cargarlo completo en memoria."""
+    while True:
+        chunk = await upload.read(UPLOAD_READ_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _format_from_hint(hint: Optional[str]) -> ExportFormat:
+    """Deduce el formato a partir de un Content-Type o de un nombre de archivo."""
+    if hint and ("csv" in hint.lower()):
+        return ExportFormat.CSV
+    return ExportFormat.NDJSON
+
+
+async def open_import_source(
+    request: Request,
+    import_format: Optional[ExportFormat] = None
+) -> Tuple[AsyncIterator[bytes], ExportFormat]:
+    """
+    Obtiene el flujo de bytes a importar desde la petición.
+    Acepta un archivo multipart (campo "file") o el cuerpo crudo.
+
+    Args:
+        request: Petición HTTP entrante
+        import_format: Formato explícito; si es None se deduce del
+                       nombre del archivo o del Content-Type
+
+    Returns:
+        Tupla (flujo_de_bytes, formato)
+
+    Raises:
+        ValueError: Si la petición multipart no trae el campo "file"
+    """
+    content_type = request.headers.get("content-type", "")
+
+    # Archivo subido como multipart/form-data
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if not isinstance(upload, UploadFile):
+            raise ValueError("La petición multipart debe incluir un archivo en el campo 'file'")
+        return _read_upload(upload), import_format or _format_from_hint(upload.filename)
+
+    # Cuerpo crudo (NDJSON o CSV)
+    return request.stream(), import_format or _format_from_hint(content_type)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[int, str]]:
+    """
+    Divide un flujo de bytes en líneas de texto, numeradas desde 1.
+    Decodifica UTF-8 de forma incremental (una letra puede quedar partida
+    entre dos bloques) y descarta un BOM inicial.
+
+    Args:
+        chunks: Flujo de bloques de bytes
+
+    Yields:
+        Tuplas (número_de_línea, texto_sin_salto_de_línea)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    line_number = 0
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.split("\n")
+        pending = lines.pop()
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield line_number + 1, pending.rstrip("\r")
+
+
+def _parse_rows(
+    lines: List[Tuple[int, str]],
+    import_format: ExportFormat,
+    header: Optional[List[str]]
+) -> Tuple[List[Tuple[int, dict]], List[ImportRowError]]:
+    """
+    Convierte líneas de texto en diccionarios según el formato.
+
+    Returns:
+        Tupla (filas_parseadas, errores_de_formato)
+    """
+    rows = []
+    errors = []
+    for line_number, line in lines:
+        try:
+            if import_format == ExportFormat.CSV:
+                values = next(csv.reader([line]))
+                if len(values) != len(header):
+                    raise ValueError(f"se esperaban {len(header)} columnas y hay {len(values)}")
+                row = dict(zip(header, values))
+            else:
+                row = json.loads(line)
+                if not isinstance(row, dict):
+                    raise ValueError("cada línea debe ser un objeto JSON")
+            rows.append((line_number, row))
+        except (ValueError, csv.Error) as error:
+            errors.append(ImportRowError(line=line_number, error=str(error)))
+    return rows, errors
+
+
+async def import_children_stream(
+    chunks: AsyncIterator[bytes],
+    import_format: ExportFormat,
+    insert_chunk: Callable[[List[ChildCreate]], Tuple[int, int]],
+    chunk_size: int
+) -> ImportResultResponse:
+    """
+    Importa niños desde un flujo NDJSON o CSV validando e insertando por bloques.
+
+    Las líneas se leen de forma incremental; cada bloque de chunk_size filas
+    se valida con ChildCreate y se inserta con insert_chunk. Entre bloques
+    se cede el control al event loop para que otras peticiones (por ejemplo
+    /health) sigan atendiéndose durante importaciones grandes.
+
+    Args:
+        chunks: Flujo de bytes del archivo o cuerpo
+        import_format: Formato de las filas (NDJSON o CSV)
+        insert_chunk: Función del servicio que inserta un bloque validado
+                      y retorna (insertados, duplicados)
+        chunk_size: Cantidad de filas por bloque
+
+    Returns:
+        ImportResultResponse con los contadores y las filas inválidas
+    """
+    total_rows = inserted = duplicates = invalid = 0
+    errors: List[ImportRowError] = []
+    header: Optional[List[str]] = None
+    batch: List[Tuple[int, str]] = []
+
+    def record_errors(new_errors: List[ImportRowError]):
+        nonlocal invalid
+        invalid += len(new_errors)
+        errors.extend(new_errors[:MAX_REPORTED_ERRORS - len(errors)])
+
+    async def flush():
+        nonlocal inserted, duplicates, total_rows
+        rows, parse_errors = _parse_rows(batch, import_format, header)
+        record_errors(parse_errors)
+
+        # Validar el bloque completo antes de insertarlo
+        valid = []
+        for line_number, row in rows:
+            try:
+                valid.append(ChildCreate(**row))
+            except ValidationError as error:
+                record_errors([ImportRowError(line=line_number, error=_describe(error))])
+
+        added, repeated = insert_chunk(valid)
+        inserted += added
+        duplicates += repeated
+        total_rows += len(batch)
+        batch.clear()
+
+        # Ceder el event loop entre bloques
+        await asyncio.sleep(0)
+
+    async for line_number, line in iter_lines(chunks):
+        if not line.strip():
+            continue
+        # La primera línea no vacía de un CSV es el encabezado
+        if import_format == ExportFormat.CSV and header is None:
+            try:
+                header = [column.strip() for column in next(csv.reader([line]))]
+            except csv.Error as error:
+                raise ValueError(f"Encabezado CSV inválido: {error}")
+            missing = [field for field in EXPORT_FIELDS if field not in header]
+            if missing:
+                raise ValueError(f"Faltan columnas en el encabezado CSV: {', '.join(missing)}")
+            continue
+        batch.append((line_number, line))
+        if len(batch) >= chunk_size:
+            await flush()
+
+    if batch:
+        await flush()
+
+    return ImportResultResponse(
+        format=import_format,
+        total_rows=total_rows,
+        inserted=inserted,
+        duplicates=duplicates,
+        invalid=invalid,
+        invalid_rows=errors,
+        invalid_rows_truncated=invalid > len(errors)
+    )
+
+
+def _describe(error: ValidationError) -> str:
+    """Resume un ValidationError de Pydantic en una sola línea."""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in item['loc'])}: {item['msg']}"
+        for item in error.errors()
+    )
@@ -0,0 +1,208 @@
+import math
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.models.schemas import Gender
+from app.utils.aggregation import parse_group_by
+from app.utils.fenwick import MAX_AGE
+
+# Orden fijo de los códigos de género
+GENDER_CODES = [gender.value for gender in Gender]
+
+
+def parse_percentiles(text: str) -> List[float]:
+    """
+    Convierte "25,50,90" en una lista de percentiles.
+
+    Args:
+        text: Percentiles separados por comas (0 excluido, 100 incluido)
+
+    Returns:
+        Lista de percentiles en el orden recibido
+
+    Raises:
+        ValueError: Si algún valor no es un número entre 0 (excluido) y 100
+    """
+    values = []
+    for part in text.split(","):
+        part = part.strip()
+        try:
+            value = float(part)
+        except ValueError:
+            raise ValueError(f"Percentil inválido: '{part}'")
+        if not 0 < value <= 100:
+            raise ValueError(f"El percentil debe estar entre 0 (excluido) y 100: {part}")
+        values.append(value)
+    return values
+
+
+class ColumnarSnapshot:
+    """
+    Copia columnar e inmutable de los niños de un árbol para estadísticas.
+
+    Guarda una columna NumPy por campo (id, edad, código de ciudad, código de
+    género) en el orden inorden del árbol, de modo que las agregaciones se
+    calculan con operaciones vectorizadas en vez de ciclos sobre objetos Child.
+    El servicio la reconstruye solo cuando cambia su versión de mutaciones.
+    """
+
+    def __init__(self, children: Iterable, version: int):
+        """
+        Construye las columnas a partir de los niños.
+
+        Args:
+            children: Niños en orden ascendente por ID
+            version: Versión de mutaciones del servicio al construirla
+        """
+        children = list(children)
+        count = len(children)
+        self.version = version
+        self.cities: List[str] = sorted({child.city for child in children})
+        city_codes = {city: code for code, city in enumerate(self.cities)}
+        gender_codes = {gender: code for code, gender in enumerate(GENDER_CODES)}
+
+        self.ids = np.fromiter((child.id for child in children), dtype=np.int64, count=count)
+        self.ages = np.fromiter((child.age for child in children), dtype=np.int16, count=count)
+        self.city_codes = np.fromiter(
+            (city_codes[child.city] for child in children), dtype=np.int32, count=count
+        )
+        self.gender_codes = np.fromiter(
+            (gender_codes[child.gender] for child in children), dtype=np.int8, count=count
+        )
+
+    def __len__(self) -> int:
+        """Cantidad de filas."""
+        return len(self.ids)
+
+    def _mask(self, city: Optional[str], gender: Optional[str]) -> Optional[np.ndarray]:
+        """
+        Máscara booleana de las filas con la ciudad y el género indicados.
+
+        Returns:
+            Máscara, o None si no hay filtros
+        """
+        mask = None
+        if city is not None:
+            code = self.cities.index(city) if city in self.cities else -1
+            mask = self.city_codes == code
+        if gender is not None:
+            gender_mask = self.gender_codes == GENDER_CODES.index(gender)
+            mask = gender_mask if mask is None else mask & gender_mask
+        return mask
+
+    def _group_keys(self, group_by: Tuple[str, ...]) -> Tuple[np.ndarray, List[tuple]]:
+        """
+        Código entero por fila para la agrupación y la etiqueta de cada código.
+
+        Args:
+            group_by: Dimensiones ("city", "gender" o ambas)
+
+        Returns:
+            Tupla (códigos por fila, etiquetas indexadas por código)
+        """
+        keys = np.zeros(len(self), dtype=np.int64)
+        labels: List[tuple] = [()]
+        for dimension in group_by:
+            if dimension == "city":
+                column, values = self.city_codes, self.cities
+            else:
+                column, values = self.gender_codes, GENDER_CODES
+            keys = keys * len(values) + column
+            labels = [label + (value,) for label in labels for value in values]
+        return keys, labels
+
+    def age_stats(self, group_by: Tuple[str, ...], percentiles: List[float]) -> List[dict]:
+        """
+        Cantidad, media, mediana y percentiles de edad por grupo.
+
+        Las edades son enteros pequeños (0..MAX_AGE), así que un solo
+        np.bincount sobre (grupo, edad) da el histograma de cada grupo; las
+        sumas acumuladas permiten ubicar cualquier posición (mediana,
+        percentiles, mínimo y máximo) con searchsorted, sin ordenar.
+
+        Args:
+            group_by: Dimensiones ("city", "gender", ambas o ninguna)
+            percentiles: Percentiles a calcular (rango más cercano)
+
+        Returns:
+            Lista de grupos no vacíos con sus estadísticas, ordenada por grupo
+        """
+        if not len(self):
+            return []
+        keys, labels = self._group_keys(group_by)
+        slots = MAX_AGE + 1
+        histograms = np.bincount(
+            keys * slots + self.ages, minlength=len(labels) * slots
+        ).reshape(len(labels), slots)
+        cumulative = histograms.cumsum(axis=1)
+        sums = histograms @ np.arange(slots)
+
+        groups = []
+        for code in np.flatnonzero(cumulative[:, -1]).tolist():
+            cum = cumulative[code]
+            count = int(cum[-1])
+
+            def kth(rank: int) -> int:
+                # Edad en la posición rank (desde 1) del grupo ordenado
+                return int(np.searchsorted(cum, rank, side="left"))
+
+            if count % 2:
+                median = float(kth(count // 2 + 1))
+            else:
+                median = (kth(count // 2) + kth(count // 2 + 1)) / 2
+            group = dict(zip(group_by, labels[code]))
+            group.update({
+                "count": count,
+                "mean_age": round(float(sums[code]) / count, 2),
+                "median_age": median,
+                "min_age": kth(1),
+                "max_age": kth(count),
+                "percentiles": {
+                    f"p{p:g}": kth(max(1, math.ceil(p * count / 100))) for p in percentiles
+                },
+            })
+            groups.append(group)
+        return groups
+
+    def histogram(self, bin_size: int, city: Optional[str] = None, gender: Optional[str] = None) -> List[dict]:
+        """
+        Histograma de edades en intervalos de bin_size años.
+
+        Args:
+            bin_size: Ancho de cada intervalo en años
+            city: Ciudad (opcional)
+            gender: Género (opcional)
+
+        Returns:
+            Lista de intervalos no vacíos con min_age, max_age y count
+        """
+        mask = self._mask(city, gender)
+        ages = self.ages if mask is None else self.ages[mask]
+        counts = np.bincount(ages // bin_size)
+        return [
+            {"min_age": index * bin_size, "max_age": index * bin_size + bin_size - 1, "count": int(count)}
+            for index, count in enumerate(counts.tolist())
+            if count
+        ]
+
+
+def parse_stats_group_by(text: str) -> Tuple[str, ...]:
+    """
+    Valida la agrupación de las estadísticas columnar (sin age_bucket).
+
+    Args:
+        text: Dimensiones separadas por comas; vacío para no agrupar
+
+    Returns:
+        Dimensiones en orden canónico
+
+    Raises:
+        ValueError: Si alguna dimensión no es city ni gender
+    """
+    if not text.strip():
+        return ()
+    group_by = parse_group_by(text)
+    if "age_bucket" in group_by:
+        raise ValueError("Las estadísticas de edad solo se agrupan por city y gender")
+    return group_by
@@ -0,0 +1,43 @@
+import base64
+import binascii
+import json
+
+
+def encode_cursor(after_id: int) -> str:
+    """
+    Codifica la posición de una página como un cursor opaco.
+    El cursor guarda el último ID entregado, así que sigue siendo válido
+    aunque se inserten niños entre una página y la siguiente.
+
+    Args:
+        after_id: Último ID entregado en la página actual
+
+    Returns:
+        Cursor en base64 apto para URLs
+    """
+    raw = json.dumps({"after_id": after_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """
+    Decodifica un cursor generado por encode_cursor.
+
+    Args:
+        cursor: Cursor opaco recibido del cliente
+
+    Returns:
+        El último ID entregado en la página anterior
+
+    Raises:
+        ValueError: Si el cursor no es válido
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        after_id = data["after_id"]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise ValueError("Cursor de paginación inválido")
+    if not isinstance(after_id, int) or isinstance(after_id, bool):
+        raise ValueError("Cursor de paginación inválido")
+    return after_id
@@ -0,0 +1,167 @@
+import csv
+import io
+import json
+import zlib
+from collections import deque
+from typing import Iterable, Iterator, List, Optional
+
+# Columnas exportadas, en el mismo orden que ChildResponse
+EXPORT_FIELDS = ("id", "name", "age", "city", "gender")
+
+# Cantidad de niños serializados por bloque enviado al cliente
+EXPORT_BATCH_SIZE = 500
+
+
+def _row(child) -> tuple:
+    """Valores de un niño en el orden de EXPORT_FIELDS."""
+    return (child.id, child.name, child.age, child.city, child.gender.value)
+
+
+def iter_ndjson(children: Iterable, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Serializa niños como NDJSON (un objeto JSON por línea) en bloques.
+    Consume el iterable de forma perezosa, así que la memoria usada
+    depende del tamaño del bloque y no de la cantidad total de niños.
+
+    Args:
+        children: Iterable de objetos Child (por ejemplo tree.iter_inorder())
+        batch_size: Cantidad de líneas por bloque
+
+    Yields:
+        Bloques de bytes UTF-8 con líneas NDJSON
+    """
+    lines = []
+    for child in children:
+        lines.append(json.dumps(dict(zip(EXPORT_FIELDS, _row(child))), ensure_ascii=False))
+        if len(lines) >= batch_size:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def iter_csv(children: Iterable, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Serializa niños como CSV con encabezado, en bloques.
+
+    Args:
+        children: Iterable de objetos Child (por ejemplo tree.iter_inorder())
+        batch_size: Cantidad de filas por bloque
+
+    Yields:
+        Bloques de bytes UTF-8 con filas CSV
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_FIELDS)
+    rows = 0
+    for child in children:
+        writer.writerow(_row(child))
+        rows += 1
+        if rows >= batch_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+            rows = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_levels(root, max_level: Optional[int] = None) -> Iterator[List]:
+    """
+    Recorrido por niveles (BFS) con una cola deque, un nivel por vez.
+    Funciona con la raíz de cualquier motor (nodos con child, left y right).
+    Solo se encolan los hijos de un nivel cuando ese nivel se va a producir,
+    así que con max_level se visitan únicamente los nodos mostrados.
+
+    Args:
+        root: Raíz del árbol (None si está vacío)
+        max_level: Último nivel a producir (la raíz es el nivel 0); None para todos
+
+    Yields:
+        Lista de objetos Child de cada nivel, de izquierda a derecha
+    """
+    queue = deque([root] if root is not None else [])
+    level = 0
+    while queue and (max_level is None or level <= max_level):
+        children = []
+        expand = max_level is None or level < max_level
+        for _ in range(len(queue)):
+            node = queue.popleft()
+            children.append(node.child)
+            if expand:
+                left, right = node.left, node.right
+                if left is not None:
+                    queue.append(left)
+                if right is not None:
+                    queue.append(right)
+        yield children
+        level += 1
+
+
+def iter_levels_ndjson(levels: Iterable[List]) -> Iterator[bytes]:
+    """
+    Serializa un recorrido por niveles como NDJSON: una línea por nivel
+    con la forma {"level": n, "children": [...]}, enviada apenas se produce.
+
+    Args:
+        levels: Iterable de listas de Child (por ejemplo iter_levels(tree.root))
+
+    Yields:
+        Una línea NDJSON en bytes UTF-8 por nivel
+    """
+    for level, children in enumerate(levels):
+        line = {
+            "level": level,
+            "children": [dict(zip(EXPORT_FIELDS, _row(child))) for child in children],
+        }
+        yield (json.dumps(line, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """
+    Comprime en formato gzip un flujo de bloques a medida que se producen.
+
+    Args:
+        chunks: Iterable de bloques de bytes sin comprimir
+        level: Nivel de compresión (1 = rápido, 9 = máximo)
+
+    Yields:
+        Bloques de bytes comprimidos
+    """
+    # wbits = 16 + MAX_WBITS produce encabezado y cola gzip
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """
+    Indica si el encabezado Accept-Encoding del cliente admite gzip.
+
+    Args:
+        accept_encoding: Valor del encabezado (puede ser None)
+
+    Returns:
+        True si gzip (o *) está aceptado con q > 0
+    """
+    if not accept_encoding:
+        return False
+    for token in accept_encoding.split(","):
+        parts = [part.strip() for part in token.split(";")]
+        coding = parts[0].lower()
+        if coding not in ("gzip", "*"):
+            continue
+        quality = 1.0
+        for param in parts[1:]:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            return True
+    return False
@@ -0,0 +1,210 @@
+import math
+from typing import Dict, Optional
+
+# Edad máxima permitida por los validadores de Child
+MAX_AGE = 150
+
+
+class FenwickTree:
+    """
+    Árbol de Fenwick (Binary Indexed Tree) sobre los índices 0..size-1.
+    Permite sumar a una posición, consultar sumas de prefijos y buscar
+    el k-ésimo elemento en O(log size).
+    """
+
+    def __init__(self, size: int):
+        """
+        Constructor del árbol de Fenwick.
+
+        Args:
+            size: Cantidad de posiciones (índices 0..size-1)
+        """
+        self._size = size
+        # El arreglo interno usa índices 1..size
+        self._tree = [0] * (size + 1)
+        # Mayor potencia de 2 <= size, para la búsqueda del k-ésimo
+        self._top_bit = 1 << (size.bit_length() - 1) if size else 0
+
+    def add(self, index: int, delta: int):
+        """
+        Suma delta a la posición index.
+
+        Args:
+            index: Posición (0..size-1)
+            delta: Valor a sumar (negativo para restar)
+        """
+        i = index + 1
+        while i <= self._size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, index: int) -> int:
+        """
+        Suma de las posiciones 0..index (incluida).
+
+        Args:
+            index: Última posición de la suma (menor que 0 da 0)
+
+        Returns:
+            Suma del prefijo
+        """
+        i = min(index, self._size - 1) + 1
+        total = 0
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def range_sum(self, lo: int, hi: int) -> int:
+        """
+        Suma de las posiciones lo..hi (ambas incluidas).
+
+        Returns:
+            Suma del rango (0 si el rango está vacío)
+        """
+        if lo > hi:
+            return 0
+        return self.prefix_sum(hi) - self.prefix_sum(lo - 1)
+
+    def find_kth(self, k: int) -> int:
+        """
+        Busca la menor posición cuyo prefijo acumula al menos k.
+        Con conteos por edad, es la edad del k-ésimo niño ordenado por edad.
+
+        Args:
+            k: Rango buscado (1..total)
+
+        Returns:
+            Posición encontrada (0..size-1)
+        """
+        position = 0
+        remaining = k
+        step = self._top_bit
+        while step:
+            nxt = position + step
+            if nxt <= self._size and self._tree[nxt] < remaining:
+                position = nxt
+                remaining -= self._tree[nxt]
+            step >>= 1
+        return position
+
+
+class AgeHistogram:
+    """
+    Histograma de edades sobre árboles de Fenwick, global y por ciudad.
+    Responde conteos por rango de edad, percentiles y mediana en O(log 151)
+    y se actualiza en O(log 151) en cada inserción o eliminación.
+    """
+
+    def __init__(self, max_age: int = MAX_AGE):
+        """
+        Constructor del histograma.
+
+        Args:
+            max_age: Edad máxima representable
+        """
+        self._size = max_age + 1
+        self._global = FenwickTree(self._size)
+        self._by_city: Dict[str, FenwickTree] = {}
+        self._count = 0
+        self._city_counts: Dict[str, int] = {}
+
+    def add(self, child):
+        """Registra la edad de un niño (global y en su ciudad)."""
+        self._global.add(child.age, 1)
+        self._count += 1
+        tree = self._by_city.get(child.city)
+        if tree is None:
+            tree = self._by_city[child.city] = FenwickTree(self._size)
+        tree.add(child.age, 1)
+        self._city_counts[child.city] = self._city_counts.get(child.city, 0) + 1
+
+    def remove(self, child):
+        """Quita la edad de un niño (global y de su ciudad)."""
+        self._global.add(child.age, -1)
+        self._count -= 1
+        self._by_city[child.city].add(child.age, -1)
+        remaining = self._city_counts[child.city] - 1
+        if remaining:
+            self._city_counts[child.city] = remaining
+        else:
+            del self._city_counts[child.city]
+            del self._by_city[child.city]
+
+    def clear(self):
+        """Reinicia el histograma."""
+        self._global = FenwickTree(self._size)
+        self._by_city.clear()
+        self._city_counts.clear()
+        self._count = 0
+
+    def _select(self, city: Optional[str]):
+        """Árbol de Fenwick y total del histograma global o de una ciudad."""
+        if city is None:
+            return self._global, self._count
+        return self._by_city.get(city), self._city_counts.get(city, 0)
+
+    def count(self, min_age: int = 0, max_age: int = MAX_AGE, city: Optional[str] = None) -> int:
+        """
+        Cantidad de niños con edad en [min_age, max_age].
+
+        Args:
+            min_age: Edad mínima (incluida)
+            max_age: Edad máxima (incluida)
+            city: Si se indica, solo cuenta los niños de esa ciudad
+
+        Returns:
+            Cantidad de niños en el rango
+        """
+        tree, total = self._select(city)
+        if not total:
+            return 0
+        return tree.range_sum(max(min_age, 0), min(max_age, self._size - 1))
+
+    def total(self, city: Optional[str] = None) -> int:
+        """Cantidad de niños registrados (global o de una ciudad)."""
+        return self._select(city)[1]
+
+    def kth_age(self, k: int, city: Optional[str] = None) -> int:
+        """
+        Edad del k-ésimo niño en orden de edad (k desde 1).
+
+        Raises:
+            ValueError: Si k está fuera de 1..total
+        """
+        tree, total = self._select(city)
+        if not 1 <= k <= total:
+            raise ValueError(f"k debe estar entre 1 y {total}")
+        return tree.find_kth(k)
+
+    def percentile(self, p: float, city: Optional[str] = None) -> Optional[int]:
+        """
+        Percentil de edad por el método del rango más cercano.
+
+        Args:
+            p: Percentil en (0, 100]
+            city: Si se indica, el percentil se calcula sobre esa ciudad
+
+        Returns:
+            Edad del percentil, o None si no hay niños
+        """
+        total = self.total(city)
+        if not total:
+            return None
+        # Rango más cercano: el menor k con k >= p/100 * total
+        k = max(1, math.ceil(p * total / 100))
+        return self.kth_age(min(k, total), city)
+
+    def median(self, city: Optional[str] = None) -> Optional[float]:
+        """
+        Mediana de edad (promedio de los dos centrales si la cantidad es par).
+
+        Returns:
+            Mediana, o None si no hay niños
+        """
+        total = self.total(city)
+        if not total:
+            return None
+        if total % 2:
+            return float(self.kth_age(total // 2 + 1, city))
+        return (self.kth_age(total // 2, city) + self.kth_age(total // 2 + 1, city)) / 2
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Caché acotada con política de reemplazo LRU (menos usado recientemente).
+    Lleva métricas de aciertos, fallos, desalojos e invalidaciones para
+    poder medir su efectividad desde los endpoints de estadísticas.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        Constructor de la caché.
+
+        Args:
+            max_size: Cantidad máxima de entradas (0 desactiva la caché)
+        """
+        if max_size < 0:
+            raise ValueError("El tamaño máximo de la caché no puede ser negativo")
+        self._max_size = max_size
+        # Las entradas más recientes quedan al final del OrderedDict
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Obtiene un valor y lo marca como usado recientemente.
+
+        Args:
+            key: Clave a buscar
+
+        Returns:
+            El valor almacenado, o None si la clave no está en la caché
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Guarda un valor, desalojando la entrada menos usada si la caché está llena.
+
+        Args:
+            key: Clave de la entrada
+            value: Valor a guardar (no puede ser None)
+        """
+        if self._max_size == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, key: Hashable):
+        """
+        Elimina una entrada si existe.
+
+        Args:
+            key: Clave de la entrada a invalidar
+        """
+        if self._entries.pop(key, None) is not None:
+            self._invalidations += 1
+
+    def clear(self):
+        """
+        Elimina todas las entradas. Las métricas acumuladas se conservan.
+        """
+        self._invalidations += len(self._entries)
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Cantidad de entradas almacenadas"""
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """
+        Métricas de uso de la caché.
+
+        Returns:
+            Diccionario con tamaño, aciertos, fallos, tasa de acierto,
+            desalojos e invalidaciones
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations
+        }
@@ -0,0 +1,217 @@
+import gc
+import sys
+import tracemalloc
+import types
+from enum import Enum
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+# Objetos compartidos por todo el proceso: no se atribuyen a ninguna estructura
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, Enum)
+
+
+def deep_sizeof(obj, seen: Set[int]) -> Tuple[int, int]:
+    """
+    Tamaño profundo de un objeto: él y todo lo que alcanza, con una pila
+    explícita (los árboles degenerados superan el límite de recursión).
+
+    Los objetos cuyo id ya está en `seen` no se cuentan, así que medir varias
+    estructuras con el mismo conjunto reparte los objetos compartidos sin
+    contarlos dos veces: cada uno queda en la primera estructura medida.
+
+    Args:
+        obj: Objeto a medir
+        seen: IDs de los objetos ya contados (se actualiza)
+
+    Returns:
+        Tupla (bytes, cantidad de objetos)
+    """
+    size = count = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SHARED_TYPES):
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        count += 1
+        stack.extend(gc.get_referents(current))
+    return size, count
+
+
+def _string_usage(children: Iterable, seen: Set[int]) -> dict:
+    """
+    Memoria de los textos (nombre y ciudad) de los niños.
+    duplicate_bytes son los bytes de objetos str con un texto repetido en
+    otro objeto: lo que se recuperaría internándolos con sys.intern.
+
+    Args:
+        children: Niños del árbol
+        seen: IDs de los objetos ya contados (se actualiza)
+
+    Returns:
+        Diccionario con bytes, objetos, referencias y bytes duplicados
+    """
+    size = objects = references = duplicate_bytes = 0
+    texts: Set[str] = set()
+    for child in children:
+        for value in (child.name, child.city):
+            references += 1
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            value_size = sys.getsizeof(value)
+            size += value_size
+            objects += 1
+            if value in texts:
+                duplicate_bytes += value_size
+            else:
+                texts.add(value)
+    return {
+        "bytes": size,
+        "objects": objects,
+        "references": references,
+        "duplicate_bytes": duplicate_bytes,
+    }
+
+
+def measure_tree_memory(tree, indexes: Dict[str, object], caches: Dict[str, object]) -> dict:
+    """
+    Huella de memoria de un servicio de árbol, separada por categorías.
+
+    Se mide en este orden, con un único conjunto de objetos vistos:
+    1. Textos de los niños (nombre y ciudad)
+    2. Objetos Child (sin sus textos)
+    3. Nodos y demás estructura del motor (todo lo que el árbol alcanza y
+       no es un niño: nodos, arreglos, búferes)
+    4. Cada índice y cada caché (solo lo que no pertenece a lo anterior)
+
+    Args:
+        tree: Árbol del servicio (cualquier motor)
+        indexes: Estructuras derivadas por nombre
+        caches: Cachés por nombre
+
+    Returns:
+        Diccionario con los bytes por categoría y los promedios por niño
+    """
+    children = list(tree.iter_inorder())
+    count = len(children)
+    seen: Set[int] = {id(children)}
+
+    strings = _string_usage(children, seen)
+    child_bytes = child_objects = 0
+    for child in children:
+        size, objects = deep_sizeof(child, seen)
+        child_bytes += size
+        child_objects += objects
+    node_bytes, node_objects = deep_sizeof(tree, seen)
+
+    index_bytes = {name: deep_sizeof(index, seen)[0] for name, index in indexes.items()}
+    cache_bytes = {name: deep_sizeof(cache, seen)[0] for name, cache in caches.items()}
+
+    def per_child(size: int) -> Optional[float]:
+        return round(size / count, 1) if count else None
+
+    return {
+        "total_children": count,
+        "total_bytes": strings["bytes"] + child_bytes + node_bytes + sum(index_bytes.values()) + sum(cache_bytes.values()),
+        "nodes": {"bytes": node_bytes, "objects": node_objects, "bytes_per_node": per_child(node_bytes)},
+        "children": {"bytes": child_bytes, "objects": child_objects, "bytes_per_child": per_child(child_bytes)},
+        "strings": strings,
+        "indexes": index_bytes,
+        "caches": cache_bytes,
+    }
+
+
+class AllocationTracker:
+    """
+    Rastreo de asignaciones con tracemalloc, activado a pedido.
+    reset() inicia el rastreo (si no estaba activo) y toma una foto de
+    referencia; top() informa las líneas que más memoria asignaron desde
+    esa foto. Mientras no se inicia, no agrega costo al proceso.
+    """
+
+    def __init__(self, frames: int = 1):
+        """
+        Args:
+            frames: Cuadros de pila guardados por asignación
+        """
+        self._frames = frames
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        """Foto de las asignaciones sin las del propio tracemalloc."""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def reset(self) -> dict:
+        """
+        Inicia el rastreo si hace falta y toma una nueva foto de referencia.
+
+        Returns:
+            Estado del rastreo
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+        tracemalloc.reset_peak()
+        self._baseline = self._snapshot()
+        return self.status()
+
+    def stop(self) -> dict:
+        """
+        Detiene el rastreo y descarta la foto de referencia.
+
+        Returns:
+            Estado del rastreo
+        """
+        tracemalloc.stop()
+        self._baseline = None
+        return self.status()
+
+    def status(self) -> dict:
+        """
+        Estado del rastreo y memoria rastreada actual y máxima.
+
+        Returns:
+            Diccionario con tracing, current_bytes y peak_bytes
+        """
+        if not tracemalloc.is_tracing():
+            return {"tracing": False, "current_bytes": None, "peak_bytes": None}
+        current, peak = tracemalloc.get_traced_memory()
+        return {"tracing": True, "current_bytes": current, "peak_bytes": peak}
+
+    def top(self, limit: int) -> dict:
+        """
+        Líneas de código que más memoria asignaron desde el último reset.
+
+        Args:
+            limit: Cantidad de líneas a informar
+
+        Returns:
+            Estado del rastreo con la lista top_allocators (vacía si no está activo)
+        """
+        result = self.status()
+        result["top_allocators"] = []
+        if not result["tracing"]:
+            return result
+        snapshot = self._snapshot()
+        if self._baseline is None:
+            stats = snapshot.statistics("lineno")
+        else:
+            stats = snapshot.compare_to(self._baseline, "lineno")
+        for stat in stats[:limit]:
+            frame = stat.traceback[0]
+            result["top_allocators"].append({
+                "location": f"{frame.filename}:{frame.lineno}",
+                "size_bytes": stat.size,
+                "size_diff_bytes": getattr(stat, "size_diff", stat.size),
+                "count": stat.count,
+                "count_diff": getattr(stat, "count_diff", stat.count),
+            })
+        return result
+
+
+# Instancia única del rastreador, compartida por los endpoints de depuración
+allocation_tracker = AllocationTracker()
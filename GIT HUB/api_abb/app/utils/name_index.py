@@ -0,0 +1,118 @@
+import unicodedata
+from typing import Dict, List, Set
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normaliza un nombre para búsquedas: sin tildes, sin distinguir
+    mayúsculas y con los espacios colapsados ("  José  María" -> "jose maria").
+
+    Args:
+        name: Nombre original
+
+    Returns:
+        Nombre normalizado
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    without_marks = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(without_marks.casefold().split())
+
+
+class TrieNode:
+    """
+    Nodo del trie de nombres.
+    Guarda los hijos por carácter y los IDs de los niños cuyo nombre
+    normalizado termina exactamente en este nodo.
+    """
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "TrieNode"] = {}
+        self.ids: Set[int] = set()
+
+
+class NameTrie:
+    """
+    Trie de prefijos sobre los nombres normalizados de los niños.
+
+    Una búsqueda por prefijo cuesta O(largo del prefijo) para ubicar el
+    subárbol y luego O(resultados) para recorrerlo, porque todo nodo del
+    trie conduce al menos a un nombre almacenado.
+    """
+
+    def __init__(self):
+        """Constructor del trie vacío."""
+        self._root = TrieNode()
+
+    def add(self, child_id: int, name: str):
+        """
+        Registra el nombre de un niño.
+
+        Args:
+            child_id: ID del niño
+            name: Nombre del niño (sin normalizar)
+        """
+        node = self._root
+        for char in normalize_name(name):
+            nxt = node.children.get(char)
+            if nxt is None:
+                nxt = node.children[char] = TrieNode()
+            node = nxt
+        node.ids.add(child_id)
+
+    def remove(self, child_id: int, name: str):
+        """
+        Quita el nombre de un niño y poda las ramas que quedan vacías.
+
+        Args:
+            child_id: ID del niño
+            name: Nombre con el que fue registrado
+        """
+        key = normalize_name(name)
+        path = [self._root]
+        for char in key:
+            nxt = path[-1].children.get(char)
+            if nxt is None:
+                return
+            path.append(nxt)
+        path[-1].ids.discard(child_id)
+
+        # Podar desde la hoja mientras el nodo quede sin IDs ni hijos
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.ids or node.children:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+
+    def clear(self):
+        """Elimina todos los nombres."""
+        self._root = TrieNode()
+
+    def search_prefix(self, prefix: str, limit: int) -> List[int]:
+        """
+        Busca los IDs de los niños cuyo nombre empieza por prefix.
+
+        Args:
+            prefix: Prefijo a buscar (se normaliza igual que los nombres)
+            limit: Cantidad máxima de resultados
+
+        Returns:
+            IDs ordenados por nombre normalizado y luego por ID
+        """
+        node = self._root
+        for char in normalize_name(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        # Recorrido en profundidad en orden alfabético con pila explícita
+        result: List[int] = []
+        stack = [node]
+        while stack and len(result) < limit:
+            current = stack.pop()
+            if current.ids:
+                result.extend(sorted(current.ids)[:limit - len(result)])
+            for char in sorted(current.children, reverse=True):
+                stack.append(current.children[char])
+        return result
@@ -0,0 +1,153 @@
+import heapq
+import math
+from collections import Counter
+from typing import Dict, List, Set, Tuple
+
+from app.utils.name_index import normalize_name
+
+
+def trigrams(normalized: str) -> Set[str]:
+    """
+    Trigramas de un nombre ya normalizado, con relleno de espacios para que
+    el inicio y el final del nombre también cuenten ("ana" -> "  a", " an", "ana", "na ").
+
+    Args:
+        normalized: Nombre normalizado con normalize_name
+
+    Returns:
+        Conjunto de trigramas
+    """
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Índice invertido de trigramas para búsqueda aproximada de nombres.
+
+    El índice se construye sobre los nombres normalizados distintos (muchos
+    niños comparten nombre) y cada nombre apunta a los IDs que lo usan.
+    La similitud es el coeficiente de Dice entre conjuntos de trigramas:
+    2·compartidos / (|consulta| + |candidato|).
+
+    Para no recorrer las listas de trigramas muy frecuentes, se aplica un
+    filtro de prefijo: un nombre con similitud >= min_similarity debe
+    compartir al menos m trigramas con la consulta, así que aparece en alguna
+    de las |consulta| - m + 1 listas más cortas. Solo esas listas generan
+    candidatos; el resto se usa para completar el conteo por pertenencia.
+    """
+
+    def __init__(self):
+        """Constructor del índice vacío."""
+        # trigrama -> nombres normalizados que lo contienen
+        self._postings: Dict[str, Set[str]] = {}
+        # nombre normalizado -> IDs de los niños con ese nombre
+        self._name_ids: Dict[str, Set[int]] = {}
+        # nombre normalizado -> cantidad de trigramas (denominador de Dice)
+        self._gram_counts: Dict[str, int] = {}
+
+    def add(self, child_id: int, name: str):
+        """
+        Registra el nombre de un niño.
+
+        Args:
+            child_id: ID del niño
+            name: Nombre del niño (sin normalizar)
+        """
+        key = normalize_name(name)
+        ids = self._name_ids.get(key)
+        if ids is None:
+            ids = self._name_ids[key] = set()
+            grams = trigrams(key)
+            self._gram_counts[key] = len(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(key)
+        ids.add(child_id)
+
+    def remove(self, child_id: int, name: str):
+        """
+        Quita el nombre de un niño; el nombre sale del índice cuando nadie lo usa.
+
+        Args:
+            child_id: ID del niño
+            name: Nombre con el que fue registrado
+        """
+        key = normalize_name(name)
+        ids = self._name_ids.get(key)
+        if ids is None:
+            return
+        ids.discard(child_id)
+        if ids:
+            return
+        del self._name_ids[key]
+        del self._gram_counts[key]
+        for gram in trigrams(key):
+            names = self._postings[gram]
+            names.discard(key)
+            if not names:
+                del self._postings[gram]
+
+    def clear(self):
+        """Elimina todos los nombres."""
+        self._postings.clear()
+        self._name_ids.clear()
+        self._gram_counts.clear()
+
+    def search(self, query: str, k: int, min_similarity: float = 0.3) -> List[Tuple[int, float]]:
+        """
+        Busca los k niños con el nombre más parecido a la consulta.
+
+        Args:
+            query: Texto a buscar (con errores de escritura o sin tildes)
+            k: Cantidad máxima de resultados
+            min_similarity: Similitud de Dice mínima (0 a 1) para ser candidato
+
+        Returns:
+            Lista de tuplas (id, similitud), de mayor a menor similitud;
+            los empates se ordenan por nombre y luego por ID
+        """
+        key = normalize_name(query)
+        query_grams = trigrams(key) if key else set()
+        if not query_grams:
+            return []
+        size = len(query_grams)
+
+        # Mínimo de trigramas compartidos para alcanzar min_similarity
+        # (cota con el candidato más favorable, |candidato| = compartidos)
+        min_shared = max(1, math.ceil(min_similarity * size / (2 - min_similarity)))
+
+        # Listas de la consulta ordenadas de la más corta a la más larga
+        lists = sorted(
+            (self._postings.get(gram, set()) for gram in query_grams),
+            key=len
+        )
+        probe_count = size - min_shared + 1
+
+        # Candidatos: nombres en alguna de las listas más cortas
+        shared = Counter()
+        for names in lists[:probe_count]:
+            shared.update(names)
+
+        # Completar el conteo con las listas largas por pertenencia
+        for names in lists[probe_count:]:
+            for name in shared:
+                if name in names:
+                    shared[name] += 1
+
+        gram_counts = self._gram_counts
+        scored = []
+        for name, common in shared.items():
+            score = 2 * common / (size + gram_counts[name])
+            if score >= min_similarity:
+                scored.append((score, name))
+
+        # Los k mejores nombres alcanzan para llenar k resultados
+        best = heapq.nsmallest(k, scored, key=lambda item: (-item[0], item[1]))
+
+        result: List[Tuple[int, float]] = []
+        for score, name in best:
+            for child_id in sorted(self._name_ids[name]):
+                result.append((child_id, round(score, 4)))
+                if len(result) >= k:
+                    return result
+        return result
@@ -0,0 +1,224 @@
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from time import perf_counter
+from typing import Deque, Dict, List, Optional
+
+from app.config import settings
+
+
+def _frame_label(code, cache: Dict[object, str]) -> str:
+    """
+    Etiqueta de un cuadro para el formato de pilas colapsadas
+    ("función (archivo:línea)"), sin ';' porque es el separador.
+    """
+    label = cache.get(code)
+    if label is None:
+        name = getattr(code, "co_qualname", code.co_name)
+        label = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+        cache[code] = label
+    return label
+
+
+class StackSampler:
+    """
+    Perfilador por muestreo de un solo hilo.
+
+    Un hilo auxiliar lee cada `interval` segundos la pila actual del hilo
+    observado (sys._current_frames) y cuenta cuántas veces aparece cada pila.
+    El hilo observado no se instrumenta: no paga ningún costo por llamada,
+    a diferencia de cProfile.
+    """
+
+    def __init__(self, thread_id: int, interval: float):
+        """
+        Args:
+            thread_id: Identificador del hilo a muestrear
+            interval: Segundos entre muestras
+        """
+        self._thread_id = thread_id
+        self._interval = interval
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self.stacks: Counter = Counter()
+
+    def _run(self):
+        """Toma muestras hasta que se detiene el perfilador."""
+        while not self._stop.wait(self._interval):
+            frame = sys._current_frames().get(self._thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame.f_code, self._labels))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def __enter__(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        """
+        Pilas en formato colapsado ("raíz;...;hoja cantidad" por línea),
+        la entrada de flamegraph.pl, speedscope e inferno.
+        """
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.stacks.items()))
+
+
+class ProfileStore:
+    """
+    Perfiles recientes: las pilas colapsadas se escriben en un directorio
+    local y los metadatos quedan en memoria. Al superar max_profiles se
+    borra el archivo del perfil más antiguo.
+    """
+
+    def __init__(self, directory: str, max_profiles: int):
+        """
+        Args:
+            directory: Directorio donde se escriben los archivos .collapsed
+            max_profiles: Cantidad de perfiles conservados
+        """
+        self.directory = directory
+        self._max_profiles = max_profiles
+        self._profiles: Deque[dict] = deque()
+        self._lock = threading.Lock()
+
+    def _path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.collapsed")
+
+    def save(self, profile_id: str, record: dict, collapsed: str):
+        """
+        Escribe un perfil y registra sus metadatos.
+
+        Args:
+            profile_id: Identificador del perfil
+            record: Metadatos (método, ruta, duración, muestras...)
+            collapsed: Pilas en formato colapsado
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(profile_id), "w", encoding="utf-8") as file:
+            file.write(collapsed)
+        with self._lock:
+            self._profiles.append({"id": profile_id, "file": self._path(profile_id), **record})
+            while len(self._profiles) > self._max_profiles:
+                expired = self._profiles.popleft()
+                try:
+                    os.remove(expired["file"])
+                except FileNotFoundError:
+                    pass
+
+    def list(self) -> List[dict]:
+        """
+        Returns:
+            Metadatos de los perfiles, del más reciente al más antiguo
+        """
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def read(self, profile_id: str) -> Optional[str]:
+        """
+        Pilas colapsadas de un perfil registrado.
+
+        Args:
+            profile_id: Identificador del perfil
+
+        Returns:
+            Contenido del archivo, o None si el perfil no existe o fue borrado
+        """
+        with self._lock:
+            known = any(profile["id"] == profile_id for profile in self._profiles)
+        if not known:
+            return None
+        try:
+            with open(self._path(profile_id), encoding="utf-8") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def clear(self):
+        """Borra todos los perfiles registrados y sus archivos."""
+        with self._lock:
+            while self._profiles:
+                try:
+                    os.remove(self._profiles.popleft()["file"])
+                except FileNotFoundError:
+                    pass
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI que perfila por muestreo las peticiones que traen el
+    header de depuración o que caen en la tasa de muestreo.
+
+    Es un middleware ASGI puro (no BaseHTTPMiddleware): una petición no
+    perfilada solo paga la búsqueda del header y un número aleatorio antes
+    de pasar directo a la aplicación. La respuesta de una petición perfilada
+    lleva el header X-Profile-Id con el identificador del perfil.
+    """
+
+    def __init__(self, app, store: ProfileStore, header: Optional[str], sample_rate: float, interval: float):
+        """
+        Args:
+            app: Aplicación ASGI envuelta
+            store: Destino de los perfiles
+            header: Header que activa el perfilado (None lo desactiva)
+            sample_rate: Fracción de peticiones perfiladas al azar (0 a 1)
+            interval: Segundos entre muestras de la pila
+        """
+        self.app = app
+        self._store = store
+        self._header = header.lower().encode("latin-1") if header else None
+        self._sample_rate = sample_rate
+        self._interval = interval
+
+    def _should_profile(self, scope) -> bool:
+        """Indica si la petición trae el header o cae en la muestra."""
+        if self._header is not None and any(name == self._header for name, _ in scope["headers"]):
+            return True
+        return self._sample_rate > 0 and random.random() < self._sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{int(time.time() * 1000)}-{uuid.uuid4().hex[:8]}"
+        status_code = None
+
+        async def send_with_profile_id(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-id", profile_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        # Los endpoints async corren en el hilo del bucle de eventos: este mismo
+        sampler = StackSampler(threading.get_ident(), self._interval)
+        start = perf_counter()
+        try:
+            with sampler:
+                await self.app(scope, receive, send_with_profile_id)
+        finally:
+            self._store.save(profile_id, {
+                "method": scope["method"],
+                "path": scope["path"],
+                "status_code": status_code,
+                "duration_ms": round((perf_counter() - start) * 1000, 3),
+                "samples": sum(sampler.stacks.values()),
+                "created_at": time.time(),
+            }, sampler.collapsed())
+
+
+# Instancia única del almacén, compartida por el middleware y /debug/profiles
+profile_store = ProfileStore(settings.PROFILE_DIR, settings.PROFILE_MAX_FILES)
@@ -0,0 +1,191 @@
+from itertools import takewhile
+from typing import List, Optional, Tuple
+
+from app.utils.bitmap_index import RowBitmaps, popcount
+from app.utils.fenwick import MAX_AGE
+
+# Un plan es selectivo si estima menos de esta fracción de los niños;
+# si ninguno lo es, conviene recorrer el árbol completo
+SELECTIVITY_THRESHOLD = 0.5
+
+
+def _age_bounds(min_age: Optional[int], max_age: Optional[int]) -> Tuple[int, int]:
+    """
+    Completa un rango de edad abierto con los límites válidos.
+
+    Args:
+        min_age: Edad mínima o None
+        max_age: Edad máxima o None
+
+    Returns:
+        Tupla (mínima, máxima) con ambos extremos incluidos
+    """
+    return (
+        min_age if min_age is not None else 0,
+        max_age if max_age is not None else MAX_AGE
+    )
+
+
+class FilterPlanner:
+    """
+    Planificador de consultas con varios predicados (ciudad, género, rango
+    de edad y rango de ID) sobre los índices de mapas de bits de un servicio.
+
+    1. Estima cuántos niños cumple cada predicado con los contadores de su índice.
+    2. Combina los predicados de ciudad, género y edad con AND/OR vectorizados
+       sobre los mapas de bits; el conteo de bits da el resultado exacto.
+    3. Elige el plan más barato: la intersección de mapas de bits, el recorrido
+       del rango de ID o, si ninguno es selectivo, el árbol completo.
+    4. En la intersección, traduce las filas a IDs ordenados, recorta el rango
+       de ID con searchsorted y solo entonces busca los niños en el árbol.
+    """
+
+    def __init__(self, tree, bitmaps: RowBitmaps):
+        """
+        Constructor del planificador.
+
+        Args:
+            tree: Árbol del servicio (motor con search_many e iter_inorder)
+            bitmaps: Mapas de bits de ciudad, género y edad del servicio
+        """
+        self._tree = tree
+        self._bitmaps = bitmaps
+
+    def _estimates(self, city, gender, min_age, max_age, min_id, max_id) -> List[Tuple[str, str, int]]:
+        """
+        Estima la cantidad de niños que cumple cada predicado presente.
+
+        Returns:
+            Lista de tuplas (nombre, descripción, filas_estimadas)
+        """
+        total = self._tree.get_count()
+        estimates = []
+        if city is not None:
+            estimates.append(("city", f"city = {city}", self._bitmaps.index("city").count(city)))
+        if gender is not None:
+            estimates.append(("gender", f"gender = {gender}", self._bitmaps.index("gender").count(gender)))
+        if min_age is not None or max_age is not None:
+            lo, hi = _age_bounds(min_age, max_age)
+            # Un mapa por edad: la suma de sus contadores es exacta
+            age_index = self._bitmaps.index("age")
+            rows = sum(age_index.count(age) for age in range(lo, hi + 1))
+            estimates.append(("age", f"age BETWEEN {lo} AND {hi}", rows))
+        if min_id is not None or max_id is not None:
+            # Los IDs son enteros únicos: el ancho del rango acota el resultado
+            width = (max_id if max_id is not None else float("inf")) - (min_id or 0) + 1
+            rows = int(min(total, max(width, 0)))
+            label = f"id BETWEEN {min_id if min_id is not None else '-∞'} AND {max_id if max_id is not None else '∞'}"
+            estimates.append(("id", label, rows))
+        return estimates
+
+    def _combined_bitmap(self, city, gender, min_age, max_age):
+        """
+        Intersección de los mapas de bits de ciudad, género y rango de edad.
+
+        Returns:
+            Arreglo uint64 con las filas que cumplen los tres predicados
+        """
+        words = self._bitmaps.words
+        parts = []
+        if city is not None:
+            parts.append(self._bitmaps.index("city").bitmap(city, words))
+        if gender is not None:
+            parts.append(self._bitmaps.index("gender").bitmap(gender, words))
+        if min_age is not None or max_age is not None:
+            lo, hi = _age_bounds(min_age, max_age)
+            parts.append(self._bitmaps.index("age").union(range(lo, hi + 1), words))
+
+        combined = parts[0].copy()
+        for part in parts[1:]:
+            combined &= part
+        return combined
+
+    def execute(
+        self,
+        city: Optional[str] = None,
+        gender: Optional[str] = None,
+        min_age: Optional[int] = None,
+        max_age: Optional[int] = None,
+        min_id: Optional[int] = None,
+        max_id: Optional[int] = None
+    ) -> Tuple[list, dict]:
+        """
+        Planifica y ejecuta la consulta.
+
+        Args:
+            city: Ciudad exacta
+            gender: Género exacto
+            min_age: Edad mínima (incluida)
+            max_age: Edad máxima (incluida)
+            min_id: ID mínimo (incluido)
+            max_id: ID máximo (incluido)
+
+        Returns:
+            Tupla (niños ordenados por ID, plan) donde el plan describe la
+            estrategia elegida, las estimaciones y las filas examinadas
+        """
+        total = self._tree.get_count()
+        estimates = self._estimates(city, gender, min_age, max_age, min_id, max_id)
+        bitmap_predicates = [item for item in estimates if item[0] != "id"]
+        id_estimate = next((item for item in estimates if item[0] == "id"), None)
+
+        def matches(child) -> bool:
+            return (
+                (city is None or child.city == city)
+                and (gender is None or child.gender == gender)
+                and (min_age is None or child.age >= min_age)
+                and (max_age is None or child.age <= max_age)
+                and (min_id is None or child.id >= min_id)
+                and (max_id is None or child.id <= max_id)
+            )
+
+        plan = {
+            "strategy": None,
+            "driver": None,
+            "predicates": [
+                {"predicate": label, "estimated_rows": rows} for _name, label, rows in estimates
+            ],
+            "intersected": [],
+            "residual": [],
+            "bitmap_rows": None,
+            "total_rows": total,
+            "rows_examined": 0,
+            "rows_returned": 0,
+        }
+
+        # Costo de cada plan en niños a leer del árbol
+        combined = None
+        bitmap_cost = id_cost = total
+        if bitmap_predicates:
+            combined = self._combined_bitmap(city, gender, min_age, max_age)
+            bitmap_cost = plan["bitmap_rows"] = popcount(combined)
+        if id_estimate is not None:
+            id_cost = id_estimate[2]
+
+        if not total or min(bitmap_cost, id_cost) >= total * SELECTIVITY_THRESHOLD:
+            # Ningún plan es selectivo: recorrer todo el árbol
+            candidates = self._tree.inorder_traversal()
+            plan["strategy"] = "full_scan"
+            plan["residual"] = [label for _name, label, _rows in estimates]
+        elif id_cost < bitmap_cost:
+            # Recorrer en inorden solo el rango de IDs
+            start = None if min_id is None else min_id - 1
+            candidates = self._tree.iter_inorder(start)
+            if max_id is not None:
+                candidates = takewhile(lambda child: child.id <= max_id, candidates)
+            candidates = list(candidates)
+            plan["strategy"] = "id_range_scan"
+            plan["driver"] = id_estimate[1]
+            plan["residual"] = [label for _name, label, _rows in bitmap_predicates]
+        else:
+            # Intersección de mapas de bits y recorte del rango de ID
+            plan["strategy"] = "bitmap_intersection"
+            plan["driver"] = min(bitmap_predicates, key=lambda item: item[2])[1]
+            plan["intersected"] = [label for _name, label, _rows in estimates]
+            ids = self._bitmaps.ids(combined, min_id, max_id)
+            candidates, _missing = self._tree.search_many(ids.tolist())
+
+        children = [child for child in candidates if matches(child)]
+        plan["rows_examined"] = len(candidates)
+        plan["rows_returned"] = len(children)
+        return children, plan
@@ -0,0 +1,238 @@
+import json
+import logging
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Optional
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Fases en que se reparte el tiempo de una operación
+PHASES = ("model", "pydantic", "json")
+
+
+class OperationTimer:
+    """
+    Tiempo de una operación en curso, repartido por fases.
+    El tiempo que no cae en ninguna fase queda como "other" (validación de
+    FastAPI, índices derivados, etc.).
+    """
+
+    __slots__ = ("op", "service", "child_id", "phases", "rotations", "start")
+
+    def __init__(self, op: str, service, child_id: Optional[int]):
+        """
+        Args:
+            op: Operación (insert, search, traversal o serialize)
+            service: Servicio del árbol (para describir su forma al final)
+            child_id: ID involucrado, si la operación tiene uno
+        """
+        self.op = op
+        self.service = service
+        self.child_id = child_id
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.rotations = service.get_rotation_count()
+        self.start = perf_counter()
+
+
+class _Phase:
+    """Acumula en el temporizador el tiempo del bloque."""
+
+    __slots__ = ("timer", "name", "start")
+
+    def __init__(self, timer: OperationTimer, name: str):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.timer.phases[self.name] += perf_counter() - self.start
+
+
+class _NullContext:
+    """Bloque sin medición (no hay una operación registrada en curso)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc_info):
+        return None
+
+
+_NULL_CONTEXT = _NullContext()
+
+# Operación registrada de la petición actual (cada tarea asyncio tiene la suya)
+_current_operation: ContextVar[Optional[OperationTimer]] = ContextVar("slow_operation", default=None)
+
+
+def phase(name: str):
+    """
+    Bloque cuyo tiempo se suma a una fase de la operación en curso.
+    Sin operación en curso (registro desactivado o llamada fuera de un
+    endpoint medido) solo cuesta la lectura de una ContextVar.
+
+    Args:
+        name: Fase ("model", "pydantic" o "json")
+
+    Returns:
+        Administrador de contexto
+    """
+    timer = _current_operation.get()
+    return _NULL_CONTEXT if timer is None else _Phase(timer, name)
+
+
+def search_depth(root, child_id: int) -> int:
+    """
+    Comparaciones de clave que hace una búsqueda de child_id en un árbol de
+    nodos con child/left/right (la profundidad del nodo, o del último nodo
+    visitado si el ID no existe).
+
+    Args:
+        root: Raíz del árbol
+        child_id: ID buscado
+
+    Returns:
+        Cantidad de nodos comparados
+    """
+    comparisons = 0
+    node = root
+    while node is not None:
+        comparisons += 1
+        if child_id == node.child.id:
+            break
+        node = node.left if child_id < node.child.id else node.right
+    return comparisons
+
+
+def _encode_default(value):
+    """Convierte los modelos pydantic anidados en un diccionario."""
+    if isinstance(value, BaseModel):
+        return value.dict()
+    raise TypeError(f"{type(value).__name__} no es serializable a JSON")
+
+
+def json_bytes(data) -> bytes:
+    """
+    Codifica datos ya convertidos a tipos básicos como JSON compacto UTF-8,
+    con el mismo formato que JSONResponse.
+
+    Args:
+        data: Diccionario o lista (los modelos pydantic anidados también se aceptan)
+
+    Returns:
+        Bytes del JSON
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_encode_default).encode("utf-8")
+
+
+def json_response(content, status_code: int = 200) -> Response:
+    """
+    Serializa la respuesta de un endpoint midiendo por separado la
+    conversión pydantic (.dict()) y la codificación JSON. Se devuelve un
+    Response ya codificado, así FastAPI no vuelve a validar el modelo ni a
+    pasarlo por jsonable_encoder.
+
+    Args:
+        content: Modelo pydantic o diccionario
+        status_code: Código HTTP de la respuesta
+
+    Returns:
+        Response con el JSON
+    """
+    with phase("pydantic"):
+        data = content.dict() if isinstance(content, BaseModel) else content
+    with phase("json"):
+        body = json_bytes(data)
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+class _TrackedOperation:
+    """Registra la operación al salir del bloque si superó el umbral."""
+
+    __slots__ = ("log", "timer", "token")
+
+    def __init__(self, log: "SlowOperationLog", timer: OperationTimer):
+        self.log = log
+        self.timer = timer
+
+    def __enter__(self) -> OperationTimer:
+        self.token = _current_operation.set(self.timer)
+        return self.timer
+
+    def __exit__(self, *exc_info):
+        _current_operation.reset(self.token)
+        elapsed = perf_counter() - self.timer.start
+        if elapsed * 1000 >= self.log.threshold_ms:
+            self.log.record(self.timer, elapsed)
+
+
+class SlowOperationLog:
+    """
+    Registro JSON de las operaciones sobre árboles que superan un umbral de
+    latencia. Cada entrada incluye la forma del árbol (cantidad, altura,
+    comparaciones y rotaciones) y el reparto del tiempo entre el modelo,
+    la conversión pydantic y la codificación JSON, para distinguir un ABB
+    degenerado de respuestas grandes o de la serialización.
+
+    La forma del árbol solo se calcula para las operaciones lentas.
+    """
+
+    def __init__(self, threshold_ms: Optional[float]):
+        """
+        Args:
+            threshold_ms: Latencia mínima registrada en milisegundos (None lo desactiva)
+        """
+        self.threshold_ms = threshold_ms
+
+    def track(self, op: str, service, child_id: Optional[int] = None):
+        """
+        Mide una operación: las fases marcadas con phase() dentro del bloque
+        se acumulan en ella.
+
+        Args:
+            op: Operación (insert, search, traversal o serialize)
+            service: Servicio del árbol
+            child_id: ID involucrado, si la operación tiene uno
+
+        Returns:
+            Administrador de contexto
+        """
+        if self.threshold_ms is None:
+            return _NULL_CONTEXT
+        return _TrackedOperation(self, OperationTimer(op, service, child_id))
+
+    def record(self, timer: OperationTimer, elapsed: float):
+        """
+        Escribe la entrada JSON de una operación lenta.
+
+        Args:
+            timer: Temporizador de la operación
+            elapsed: Duración total en segundos
+        """
+        shape = timer.service.get_operation_shape(timer.child_id)
+        rotations = timer.service.get_rotation_count()
+        timings = {name: round(seconds * 1000, 3) for name, seconds in timer.phases.items()}
+        timings["other"] = round(max(elapsed - sum(timer.phases.values()), 0) * 1000, 3)
+        timings["total"] = round(elapsed * 1000, 3)
+        entry = {
+            "event": "slow_operation",
+            "op": timer.op,
+            "child_id": timer.child_id,
+            **shape,
+            "rotations": None if rotations is None else rotations - timer.rotations,
+            "threshold_ms": self.threshold_ms,
+            "timings_ms": timings,
+        }
+        logger.warning(json.dumps(entry, ensure_ascii=False))
+
+
+# Instancia única del registro, compartida por los controladores
+slow_operation_log = SlowOperationLog(settings.SLOW_OPERATION_THRESHOLD_MS)
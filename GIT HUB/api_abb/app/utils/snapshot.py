@@ -0,0 +1,98 @@
+import gzip
+import json
+import os
+from typing import Iterable, Iterator, List, Tuple
+
+from app.utils.export import EXPORT_FIELDS
+
+# Versión del formato de las instantáneas en disco
+SNAPSHOT_FORMAT = 1
+
+
+def write_snapshot(path: str, header: dict, children: Iterable) -> int:
+    """
+    Escribe una instantánea compacta: NDJSON comprimido con gzip cuya primera
+    línea son los metadatos y cada línea siguiente un niño como arreglo
+    [id, nombre, edad, ciudad, género] (sin repetir los nombres de campo).
+    Se escribe en un archivo temporal y se renombra, así una instantánea a
+    medio escribir nunca reemplaza a la anterior.
+
+    Args:
+        path: Ruta del archivo .ndjson.gz
+        header: Metadatos (se agregan format y fields)
+        children: Niños en el orden en que se deben reinsertar
+
+    Returns:
+        Tamaño del archivo en bytes
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with gzip.open(temp_path, "wt", encoding="utf-8") as file:
+        file.write(json.dumps({**header, "format": SNAPSHOT_FORMAT, "fields": EXPORT_FIELDS}, ensure_ascii=False))
+        file.write("\n")
+        for child in children:
+            row = (child.id, child.name, child.age, child.city, child.gender.value)
+            file.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+            file.write("\n")
+    os.replace(temp_path, path)
+    return os.path.getsize(path)
+
+
+def _read_header(file, path: str) -> dict:
+    """
+    Lee y valida la línea de metadatos.
+
+    Raises:
+        ValueError: Si el archivo no tiene un formato de instantánea conocido
+    """
+    header = json.loads(file.readline() or "null")
+    if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Instantánea con formato desconocido: {path}")
+    return header
+
+
+def read_snapshot_header(path: str) -> dict:
+    """
+    Lee solo los metadatos de una instantánea (sin descomprimir los niños).
+
+    Args:
+        path: Ruta del archivo .ndjson.gz
+
+    Returns:
+        Metadatos escritos por write_snapshot
+
+    Raises:
+        ValueError: Si el archivo no tiene un formato de instantánea conocido
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return _read_header(file, path)
+
+
+def read_snapshot(path: str) -> Tuple[dict, Iterator[dict]]:
+    """
+    Lee una instantánea escrita por write_snapshot.
+
+    Args:
+        path: Ruta del archivo .ndjson.gz
+
+    Returns:
+        Tupla (metadatos, iterador de niños como diccionarios de EXPORT_FIELDS);
+        el archivo queda abierto hasta consumir el iterador
+
+    Raises:
+        ValueError: Si el archivo no tiene un formato de instantánea conocido
+    """
+    file = gzip.open(path, "rt", encoding="utf-8")
+    try:
+        header = _read_header(file, path)
+    except ValueError:
+        file.close()
+        raise
+    fields: List[str] = header["fields"]
+
+    def rows() -> Iterator[dict]:
+        with file:
+            for line in file:
+                yield dict(zip(fields, json.loads(line)))
+
+    return header, rows()
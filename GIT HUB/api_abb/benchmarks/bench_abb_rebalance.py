@@ -0,0 +1,67 @@
+"""
+Benchmark del rebalanceo Day–Stout–Warren sobre un ABB degenerado.
+
+Construye un ABB con IDs secuenciales (una lista enlazada por la derecha) y mide:
+- Latencia de búsqueda antes del rebalanceo (O(n) por búsqueda)
+- Tiempo de BinarySearchTree.rebalance() (O(n))
+- Latencia de búsqueda después (O(log n))
+
+La vara se enlaza directamente: es la misma forma que produce insert() con
+IDs crecientes, sin pagar sus O(n²) pasos de construcción.
+
+Uso:
+    python -m benchmarks.bench_abb_rebalance [cantidad_de_niños]
+"""
+
+import random
+import sys
+import time
+
+from app.models.abb_model import BinarySearchTree, Child, Node
+
+
+def timed(func, repeat: int) -> float:
+    """Tiempo promedio por llamada en microsegundos."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(n: int = 100_000):
+    print("=" * 70)
+    print(f"  REBALANCEO DSW DE UN ABB DEGENERADO ({n} IDs secuenciales)")
+    print("=" * 70)
+
+    tree = BinarySearchTree()
+    previous = None
+    for child_id in range(1, n + 1):
+        node = Node(Child(id=child_id, name=f"Niño{child_id}", age=child_id % 18, city="Cali", gender="male"))
+        if previous is None:
+            tree.root = node
+        else:
+            previous.right = node
+        previous = node
+    tree._count = n
+
+    rng = random.Random(41)
+    queries = [rng.randint(1, n) for _ in range(200)]
+
+    def search_all():
+        for child_id in queries:
+            tree.search(child_id)
+
+    before_us = timed(search_all, repeat=1) / len(queries)
+    start = time.perf_counter()
+    height_before, height_after = tree.rebalance()
+    rebalance_ms = (time.perf_counter() - start) * 1e3
+    after_us = timed(search_all, repeat=50) / len(queries)
+
+    print(f"Altura: {height_before} -> {height_after}")
+    print(f"Rebalanceo: {rebalance_ms:.0f} ms")
+    print(f"{'Búsqueda':<20}{'Antes (µs)':>14}{'Después (µs)':>16}{'Mejora':>10}")
+    print(f"{'Promedio':<20}{before_us:>14.1f}{after_us:>16.2f}{before_us / after_us:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
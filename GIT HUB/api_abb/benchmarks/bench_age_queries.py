@@ -0,0 +1,80 @@
+"""
+Benchmark de consultas de edad: histograma de Fenwick frente a recorrido completo.
+
+Compara, sobre un ABB con n niños:
+- Conteo por rango de edad, percentil 90 y mediana con AgeHistogram
+- Las mismas respuestas calculadas con inorder_traversal() y un recorrido lineal
+
+Uso:
+    python -m benchmarks.bench_age_queries [cantidad_de_niños]
+"""
+
+import math
+import random
+import sys
+import time
+
+from app.models.abb_model import BinarySearchTree, Child
+from app.utils.fenwick import AgeHistogram
+
+CITIES = ["Bogotá", "Medellín", "Cali"]
+GENDERS = ["male", "female", "other"]
+
+
+def timed(func, repeat: int = 20) -> float:
+    """Tiempo promedio por llamada en microsegundos."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main(n: int = 100_000):
+    print("=" * 70)
+    print(f"  CONSULTAS DE EDAD: Fenwick frente a recorrido ({n} niños)")
+    print("=" * 70)
+
+    rng = random.Random(4)
+    ids = list(range(1, n + 1))
+    rng.shuffle(ids)
+    tree = BinarySearchTree()
+    histogram = AgeHistogram()
+    for child_id in ids:
+        child = Child(
+            id=child_id,
+            name=f"Niño{child_id}",
+            age=rng.randint(0, 17),
+            city=CITIES[child_id % len(CITIES)],
+            gender=GENDERS[child_id % len(GENDERS)],
+        )
+        tree.insert(child)
+        histogram.add(child)
+
+    def scan_count():
+        return sum(1 for c in tree.inorder_traversal() if 5 <= c.age <= 8)
+
+    def scan_percentile():
+        ages = sorted(c.age for c in tree.inorder_traversal())
+        return ages[max(1, math.ceil(90 * len(ages) / 100)) - 1]
+
+    def scan_median():
+        ages = sorted(c.age for c in tree.inorder_traversal())
+        middle = len(ages) // 2
+        return ages[middle] if len(ages) % 2 else (ages[middle - 1] + ages[middle]) / 2
+
+    cases = [
+        ("Conteo 5–8 años", scan_count, lambda: histogram.count(5, 8)),
+        ("Percentil 90", scan_percentile, lambda: histogram.percentile(90)),
+        ("Mediana", scan_median, histogram.median),
+    ]
+
+    print(f"{'Consulta':<20}{'Recorrido (µs)':>18}{'Fenwick (µs)':>16}{'Mejora':>12}")
+    for name, scan, fenwick in cases:
+        assert scan() == fenwick()
+        scan_us = timed(scan, repeat=3)
+        fenwick_us = timed(fenwick, repeat=10_000)
+        print(f"{name:<20}{scan_us:>18.1f}{fenwick_us:>16.2f}{scan_us / fenwick_us:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,78 @@
+"""
+Benchmark de la búsqueda múltiple frente a búsquedas individuales.
+
+Compara, para k IDs:
+- k llamadas a GET /avl/children/{id} contra una llamada a POST /avl/children/lookup
+- k llamadas a AVLService.search_child contra una llamada a AVLService.lookup_children
+
+Las peticiones HTTP se hacen en proceso con TestClient, así que la
+diferencia medida es solo el costo de aplicación por petición (sin red).
+
+Uso:
+    python -m benchmarks.bench_batch_lookup [cantidad_de_niños] [k]
+"""
+
+import random
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.schemas import ChildCreate
+from app.services.avl_service import avl_service
+
+CITIES = ["Bogotá", "Medellín", "Cali"]
+GENDERS = ["male", "female", "other"]
+
+
+def populate(n: int):
+    """Carga n niños en el servicio AVL."""
+    avl_service.clear_tree()
+    for child_id in range(1, n + 1):
+        avl_service.add_child(ChildCreate(
+            id=child_id,
+            name=f"Niño{child_id}",
+            age=child_id % 15,
+            city=CITIES[child_id % len(CITIES)],
+            gender=GENDERS[child_id % len(GENDERS)],
+        ))
+
+
+def timed(func, repeat: int = 5) -> float:
+    """Mejor tiempo (en segundos) de varias repeticiones."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(n: int = 20_000, k: int = 500):
+    print("=" * 70)
+    print(f"  BÚSQUEDA MÚLTIPLE: {k} IDs sobre {n} niños")
+    print("=" * 70)
+
+    populate(n)
+    client = TestClient(app)
+    ids = random.Random(5).sample(range(1, n + n // 10), k)
+
+    service_single = timed(lambda: [avl_service.search_child(i) for i in ids])
+    service_batch = timed(lambda: avl_service.lookup_children(ids))
+    http_single = timed(lambda: [client.get(f"/avl/children/{i}") for i in ids], repeat=1)
+    http_batch = timed(lambda: client.post("/avl/children/lookup", json={"ids": ids}))
+
+    print(f"{'Escenario':<32}{'Individual (ms)':>18}{'Lote (ms)':>12}{'Mejora':>10}")
+    for name, single, batch in (
+        ("Servicio (sin HTTP)", service_single, service_batch),
+        ("HTTP en proceso", http_single, http_batch),
+    ):
+        print(f"{name:<32}{single * 1e3:>18.2f}{batch * 1e3:>12.2f}{single / batch:>9.1f}x")
+
+    avl_service.clear_tree()
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:3]]
+    main(*args)
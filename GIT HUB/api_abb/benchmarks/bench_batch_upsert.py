@@ -0,0 +1,85 @@
+"""
+Benchmark de los lotes atómicos frente a llamadas individuales.
+
+Carga de sincronización nocturna: upserts de niños nuevos y existentes.
+Compara, sobre el motor AVL configurado:
+- k llamadas a POST /avl/children contra una llamada a POST /avl/children/batch
+- k llamadas a AVLService.add_child contra una llamada a AVLService.apply_batch
+  (incluye la validación de los esquemas en ambos casos)
+
+Las peticiones HTTP se hacen en proceso con TestClient, así que la
+diferencia medida es solo el costo de aplicación por petición (sin red).
+
+Uso:
+    python -m benchmarks.bench_batch_upsert [niños_por_lote]
+"""
+
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.schemas import BatchItem, ChildCreate
+from app.services.avl_service import avl_service
+
+CITIES = ["Bogotá", "Medellín", "Cali"]
+GENDERS = ["male", "female", "other"]
+
+
+def record(child_id: int) -> dict:
+    """Datos de un niño derivados del ID."""
+    return {
+        "id": child_id,
+        "name": f"Niño{child_id}",
+        "age": child_id % 15,
+        "city": CITIES[child_id % len(CITIES)],
+        "gender": GENDERS[child_id % len(GENDERS)],
+    }
+
+
+def timed(func) -> float:
+    """Tiempo de una llamada en milisegundos."""
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main(k: int = 5_000):
+    client = TestClient(app)
+    records = [record(child_id) for child_id in range(1, k + 1)]
+
+    def service_individual():
+        for data in records:
+            avl_service.add_child(ChildCreate(**data))
+
+    def service_batch():
+        avl_service.apply_batch([BatchItem(op="upsert", **data) for data in records])
+
+    http_records = records[:k // 10]
+
+    def http_individual():
+        for data in http_records:
+            client.post("/avl/children", json=data)
+
+    def http_batch():
+        client.post("/avl/children/batch", json={"items": [{"op": "upsert", **data} for data in http_records]})
+
+    print("=" * 70)
+    print(f"  LOTES ATÓMICOS VS LLAMADAS INDIVIDUALES (motor {avl_service.get_tree_stats()['storage_engine']})")
+    print("=" * 70)
+    print(f"{'Camino':<28}{'Niños':>8}{'Individual (ms)':>17}{'Lote (ms)':>12}{'Mejora':>9}")
+    for label, count, individual, batch in (
+        ("AVLService", k, service_individual, service_batch),
+        ("HTTP /avl/children", len(http_records), http_individual, http_batch),
+    ):
+        avl_service.clear_tree()
+        individual_ms = timed(individual)
+        avl_service.clear_tree()
+        batch_ms = timed(batch)
+        print(f"{label:<28}{count:>8}{individual_ms:>17.0f}{batch_ms:>12.0f}{individual_ms / batch_ms:>8.1f}x")
+    avl_service.clear_tree()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000)
@@ -0,0 +1,81 @@
+"""
+Benchmark de filtros con mapas de bits frente a un recorrido por niño.
+
+Consulta "female en Bogotá con 5 a 8 años" sobre n niños:
+- Recorrido: un ciclo de Python que evalúa cada Child
+- Mapas de bits: AND/OR vectorizados de NumPy y traducción de filas a IDs
+
+Uso:
+    python -m benchmarks.bench_bitmap_filters [cantidad_de_niños]
+"""
+
+import random
+import sys
+import time
+
+from app.models.abb_model import Child
+from app.utils.bitmap_index import RowBitmaps, popcount
+
+CITIES = ["Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena", "Pereira"]
+GENDERS = ["male", "female", "other"]
+
+
+def timed(func, repeat: int) -> float:
+    """Tiempo promedio por llamada en milisegundos."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main(n: int = 1_000_000):
+    print("=" * 70)
+    print(f"  FILTROS: mapas de bits frente a recorrido ({n} niños)")
+    print("=" * 70)
+
+    rng = random.Random(37)
+    children = []
+    bitmaps = RowBitmaps()
+    for child_id in range(1, n + 1):
+        child = Child(
+            id=child_id,
+            name=f"Niño{child_id}",
+            age=rng.randint(0, 17),
+            city=rng.choice(CITIES),
+            gender=rng.choice(GENDERS),
+        )
+        children.append(child)
+        bitmaps.add(child)
+
+    def scan_ids():
+        return [
+            c.id for c in children
+            if c.gender == "female" and c.city == "Bogotá" and 5 <= c.age <= 8
+        ]
+
+    def bitmap_combined():
+        words = bitmaps.words
+        combined = bitmaps.index("gender").bitmap("female", words) & bitmaps.index("city").bitmap("Bogotá", words)
+        combined &= bitmaps.index("age").union(range(5, 9), words)
+        return combined
+
+    def bitmap_count():
+        return popcount(bitmap_combined())
+
+    def bitmap_ids():
+        return bitmaps.ids(bitmap_combined()).tolist()
+
+    assert scan_ids() == bitmap_ids()
+    assert len(scan_ids()) == bitmap_count()
+
+    scan_ms = timed(scan_ids, repeat=3)
+    count_ms = timed(bitmap_count, repeat=50)
+    ids_ms = timed(bitmap_ids, repeat=20)
+    print(f"{'Operación':<32}{'Tiempo (ms)':>14}{'Mejora':>12}")
+    print(f"{'Recorrido por niño':<32}{scan_ms:>14.2f}{'':>12}")
+    print(f"{'Mapas de bits: conteo':<32}{count_ms:>14.2f}{scan_ms / count_ms:>11.0f}x")
+    print(f"{'Mapas de bits: IDs ordenados':<32}{ids_ms:>14.2f}{scan_ms / ids_ms:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,94 @@
+"""
+Benchmark de la caché de respuestas de GET /children/{id} con carga Zipf.
+
+Compara el camino de la respuesta por petición:
+- Sin caché: search + to_response() + codificación JSON de FastAPI
+  (jsonable_encoder + JSONResponse), como hacía el endpoint originalmente
+- Con caché: AVLService.get_child_payload + Response con bytes ya serializados
+
+Uso:
+    python -m benchmarks.bench_child_cache [cantidad_de_niños] [peticiones] [exponente_zipf]
+"""
+
+import itertools
+import random
+import sys
+import time
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from app.models.schemas import ChildCreate
+from app.services.avl_service import AVLService
+
+CITIES = ["Bogotá", "Medellín", "Cali"]
+GENDERS = ["male", "female", "other"]
+
+
+def zipf_ids(n: int, requests: int, exponent: float, seed: int = 11) -> list:
+    """Genera IDs con distribución Zipf sobre 1..n (el rango 1 es el más popular)."""
+    rng = random.Random(seed)
+    weights = [1.0 / (rank ** exponent) for rank in range(1, n + 1)]
+    cum_weights = list(itertools.accumulate(weights))
+    ranked_ids = list(range(1, n + 1))
+    rng.shuffle(ranked_ids)
+    return rng.choices(ranked_ids, cum_weights=cum_weights, k=requests)
+
+
+def percentiles(samples: list) -> dict:
+    """Percentiles 50, 99 y 99.9 en microsegundos."""
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(len(samples) * q))] * 1e6
+    return {"p50": pick(0.50), "p99": pick(0.99), "p999": pick(0.999)}
+
+
+def run(handler, ids: list) -> dict:
+    """Ejecuta el manejador por cada ID y devuelve sus percentiles de latencia."""
+    samples = []
+    for child_id in ids:
+        start = time.perf_counter()
+        handler(child_id)
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def main(n: int = 100_000, requests: int = 200_000, exponent: float = 1.1):
+    print("=" * 70)
+    print(f"  CACHÉ DE RESPUESTAS: {requests} peticiones Zipf(s={exponent}) sobre {n} niños")
+    print("=" * 70)
+
+    service = AVLService(engine="sorted_array")
+    for child_id in range(1, n + 1):
+        service.add_child(ChildCreate(
+            id=child_id,
+            name=f"Niño{child_id}",
+            age=child_id % 15,
+            city=CITIES[child_id % len(CITIES)],
+            gender=GENDERS[child_id % len(GENDERS)],
+        ))
+    ids = zipf_ids(n, requests, exponent)
+
+    def uncached(child_id: int):
+        child = service.search_child(child_id)
+        return JSONResponse(content=jsonable_encoder(child)).body
+
+    def cached(child_id: int):
+        return Response(content=service.get_child_payload(child_id), media_type="application/json").body
+
+    print(f"{'Camino':<14}{'p50 (µs)':>12}{'p99 (µs)':>12}{'p99.9 (µs)':>14}")
+    for name, handler in (("Sin caché", uncached), ("Con caché", cached)):
+        result = run(handler, ids)
+        print(f"{name:<14}{result['p50']:>12.2f}{result['p99']:>12.2f}{result['p999']:>14.2f}")
+
+    stats = service.get_cache_stats()
+    print(f"\nTasa de acierto: {stats['hit_rate']:.1%} "
+          f"({stats['hits']} aciertos, {stats['misses']} fallos, {stats['evictions']} desalojos)")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(
+        int(args[0]) if len(args) > 0 else 100_000,
+        int(args[1]) if len(args) > 1 else 200_000,
+        float(args[2]) if len(args) > 2 else 1.1,
+    )
@@ -0,0 +1,95 @@
+"""
+Benchmark de estadísticas: copia columnar NumPy frente a ciclos sobre Child.
+
+Sobre n niños compara:
+- Estadísticas de edad por ciudad y género (cantidad, media, mediana, p90)
+- Histograma de edades
+- Conteo por ciudad y género
+calculados con ciclos de Python sobre la lista de objetos Child (como hacían
+get_tree_stats y get_kids_by_city_and_gender) y con ColumnarSnapshot.
+El costo de construir la copia se informa aparte: se paga una vez por versión.
+
+Uso:
+    python -m benchmarks.bench_columnar_stats [cantidad_de_niños]
+"""
+
+import math
+import random
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+
+from app.models.abb_model import Child
+from app.utils.columnar import ColumnarSnapshot
+
+CITIES = ["Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena", "Pereira"]
+GENDERS = ["male", "female", "other"]
+
+
+def timed(func, repeat: int) -> float:
+    """Tiempo promedio por llamada en milisegundos."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main(n: int = 1_000_000):
+    print("=" * 70)
+    print(f"  ESTADÍSTICAS: copia columnar frente a ciclos ({n} niños)")
+    print("=" * 70)
+
+    rng = random.Random(38)
+    children = [
+        Child(
+            id=child_id,
+            name=f"Niño{child_id}",
+            age=rng.randint(0, 17),
+            city=rng.choice(CITIES),
+            gender=rng.choice(GENDERS),
+        )
+        for child_id in range(1, n + 1)
+    ]
+
+    def loop_age_stats():
+        groups = defaultdict(list)
+        for child in children:
+            groups[(child.city, child.gender)].append(child.age)
+        result = {}
+        for key, ages in groups.items():
+            ages.sort()
+            result[key] = (
+                len(ages),
+                sum(ages) / len(ages),
+                statistics.median(ages),
+                ages[max(1, math.ceil(90 * len(ages) / 100)) - 1],
+            )
+        return result
+
+    def loop_histogram():
+        return Counter(child.age for child in children)
+
+    def loop_counts():
+        return Counter((child.city, child.gender) for child in children)
+
+    build_ms = timed(lambda: ColumnarSnapshot(children, version=1), repeat=1)
+    snapshot = ColumnarSnapshot(children, version=1)
+    print(f"Construcción de la copia columnar: {build_ms:.0f} ms (una vez por versión)\n")
+
+    cases = [
+        ("Edad por ciudad y género", loop_age_stats,
+         lambda: snapshot.age_stats(("city", "gender"), [90])),
+        ("Histograma de edades", loop_histogram, lambda: snapshot.histogram(1)),
+        ("Conteo por ciudad y género", loop_counts,
+         lambda: snapshot.age_stats(("city", "gender"), [])),
+    ]
+    print(f"{'Consulta':<30}{'Ciclos (ms)':>14}{'Columnar (ms)':>16}{'Mejora':>10}")
+    for name, loop, columnar in cases:
+        loop_ms = timed(loop, repeat=2)
+        columnar_ms = timed(columnar, repeat=10)
+        print(f"{name:<30}{loop_ms:>14.1f}{columnar_ms:>16.2f}{loop_ms / columnar_ms:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
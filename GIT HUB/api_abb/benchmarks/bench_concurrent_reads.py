@@ -0,0 +1,116 @@
+"""
+Benchmark de lecturas con escritores concurrentes.
+
+Compara el rendimiento de los lectores mientras otros hilos insertan:
+- AVLTree protegido por un candado global (lectores y escritores lo toman)
+- PersistentAVLTree: los lectores toman una versión sin candado
+
+Cada lector alterna búsquedas puntuales con páginas de 100 niños
+(iter_inorder), como GET /children/{id} y GET /children?limit=100.
+
+Uso:
+    python -m benchmarks.bench_concurrent_reads [niños_iniciales] [segundos]
+"""
+
+import random
+import sys
+import threading
+import time
+from itertools import islice
+
+from app.models.abb_model import Child
+from app.models.avl_model import AVLTree
+from app.models.persistent_avl_model import PersistentAVLTree
+
+READERS = 4
+WRITERS = 2
+
+
+def make_child(child_id: int) -> Child:
+    """Crea un Child con datos derivados del ID."""
+    return Child(id=child_id, name=f"Niño{child_id}", age=child_id % 18, city="Bogotá", gender="female")
+
+
+class LockedAVL:
+    """AVLTree con un candado global, la alternativa sin versiones."""
+
+    def __init__(self):
+        self.tree = AVLTree()
+        self.lock = threading.Lock()
+
+    def insert(self, child):
+        with self.lock:
+            return self.tree.insert(child)
+
+    def read(self, child_id):
+        with self.lock:
+            self.tree.search(child_id)
+            return list(islice(self.tree.iter_inorder(child_id), 100))
+
+
+class PersistentReader:
+    """PersistentAVLTree: el lector toma una versión y no bloquea a nadie."""
+
+    def __init__(self):
+        self.tree = PersistentAVLTree()
+
+    def insert(self, child):
+        return self.tree.insert(child)
+
+    def read(self, child_id):
+        snapshot = self.tree.snapshot()
+        snapshot.search(child_id)
+        return list(islice(snapshot.iter_inorder(child_id), 100))
+
+
+def run(store, n: int, seconds: float) -> dict:
+    """Ejecuta lectores y escritores durante `seconds` y cuenta operaciones."""
+    ids = list(range(1, 2 * n, 2))
+    random.Random(39).shuffle(ids)
+    for child_id in ids:
+        store.insert(make_child(child_id))
+
+    stop = threading.Event()
+    reads = [0] * READERS
+    writes = [0] * WRITERS
+
+    def reader(slot):
+        rng = random.Random(slot)
+        while not stop.is_set():
+            store.read(rng.randrange(2 * n))
+            reads[slot] += 1
+
+    def writer(slot):
+        # Los escritores insertan IDs pares nuevos
+        child_id = 2 * slot + 2
+        while not stop.is_set():
+            store.insert(make_child(child_id))
+            child_id += 2 * WRITERS
+            writes[slot] += 1
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(READERS)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(WRITERS)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return {"reads": sum(reads) / seconds, "writes": sum(writes) / seconds}
+
+
+def main(n: int = 50_000, seconds: float = 5.0):
+    print("=" * 70)
+    print(f"  LECTURAS CON ESCRITORES CONCURRENTES ({n} niños, {READERS} lectores, {WRITERS} escritores)")
+    print("=" * 70)
+    print(f"{'Motor':<28}{'Lecturas/s':>16}{'Inserciones/s':>18}")
+    for name, store in [("AVLTree + candado global", LockedAVL()), ("PersistentAVLTree", PersistentReader())]:
+        result = run(store, n, seconds)
+        print(f"{name:<28}{result['reads']:>16.0f}{result['writes']:>18.0f}")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 50_000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    )
@@ -0,0 +1,73 @@
+"""
+Benchmark de memoria pico: exportación en streaming frente a GET /children.
+
+Para varios tamaños de árbol mide, con tracemalloc, la memoria pico de:
+- GET /children: lista de ChildResponse + codificación JSON completa en memoria
+- GET /export: consumo del flujo NDJSON bloque a bloque (con y sin gzip)
+
+Uso:
+    python -m benchmarks.bench_export
+"""
+
+import gc
+import json
+import tracemalloc
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models.schemas import ChildCreate, ExportFormat
+from app.services.abb_service import ABBService
+from app.utils.export import gzip_chunks
+
+CITIES = ["Bogotá", "Medellín", "Cali"]
+GENDERS = ["male", "female", "other"]
+
+
+def build_service(n: int) -> ABBService:
+    """Crea un servicio ABB con n niños (IDs intercalados para no degenerar el árbol)."""
+    service = ABBService()
+    for i in range(n):
+        child_id = (i * 7919) % n + 1
+        service.add_child(ChildCreate(
+            id=child_id,
+            name=f"Niño{child_id}",
+            age=child_id % 15,
+            city=CITIES[child_id % len(CITIES)],
+            gender=GENDERS[child_id % len(GENDERS)],
+        ))
+    return service
+
+
+def peak_memory(func) -> float:
+    """Memoria pico (MB) asignada durante la ejecución de func."""
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def consume(chunks) -> int:
+    """Consume un flujo de bloques como lo haría el servidor al enviarlo."""
+    total = 0
+    for chunk in chunks:
+        total += len(chunk)
+    return total
+
+
+def main(sizes=(10_000, 40_000, 160_000)):
+    print("=" * 70)
+    print("  MEMORIA PICO: GET /children frente a GET /export")
+    print("=" * 70)
+    print(f"{'Niños':>10}{'/children (MB)':>18}{'/export (MB)':>16}{'/export gzip (MB)':>20}")
+    for n in sizes:
+        service = build_service(n)
+        full = peak_memory(lambda: json.dumps(jsonable_encoder(service.get_all_children())))
+        stream = peak_memory(lambda: consume(service.export_children(ExportFormat.NDJSON)))
+        gz = peak_memory(lambda: consume(gzip_chunks(service.export_children(ExportFormat.NDJSON))))
+        print(f"{n:>10}{full:>18.2f}{stream:>16.2f}{gz:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
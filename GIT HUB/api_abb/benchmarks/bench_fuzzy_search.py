@@ -0,0 +1,85 @@
+"""
+Benchmark de búsqueda aproximada: índice de trigramas frente a recorrido con
+distancia de edición.
+
+Genera n nombres compuestos (nombre + apellido) y compara, para consultas con
+errores de escritura:
+- TrigramIndex.search (top-k por similitud de Dice)
+- Un recorrido lineal que calcula la distancia de Levenshtein contra cada nombre
+
+Uso:
+    python -m benchmarks.bench_fuzzy_search [cantidad_de_niños]
+"""
+
+import heapq
+import random
+import sys
+import time
+
+from app.utils.name_index import normalize_name
+from app.utils.ngram_index import TrigramIndex
+
+FIRST_NAMES = [
+    "Lucas", "Lucía", "Mateo", "Valentina", "Santiago", "Sofía", "Samuel", "Isabella",
+    "Emiliano", "Mariana", "Tomás", "Salomé", "Martín", "Gabriela", "Jerónimo", "Antonella",
+    "Daniel", "Sara", "Nicolás", "Juliana", "Sebastián", "Manuela", "Alejandro", "Luciana",
+]
+SURNAMES = [
+    "García", "Rodríguez", "Martínez", "Hernández", "López", "González", "Pérez", "Sánchez",
+    "Ramírez", "Torres", "Flórez", "Rivera", "Gómez", "Díaz", "Moreno", "Muñoz", "Rojas",
+    "Vargas", "Castro", "Ortiz", "Ocampo", "Restrepo", "Jaramillo", "Giraldo", "Cardona",
+]
+QUERIES = ["Lucaz Garsia", "Valentna Ocampo", "Santigo Restrepo", "Isabela Jaramilo"]
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Distancia de edición clásica con dos filas."""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def timed(func, repeat: int) -> float:
+    """Tiempo promedio por llamada en milisegundos."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main(n: int = 1_000_000):
+    print("=" * 70)
+    print(f"  BÚSQUEDA APROXIMADA: trigramas frente a Levenshtein ({n} niños)")
+    print("=" * 70)
+
+    rng = random.Random(35)
+    index = TrigramIndex()
+    names = []
+    start = time.perf_counter()
+    for child_id in range(1, n + 1):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(SURNAMES)} {rng.choice(SURNAMES)}"
+        names.append((child_id, normalize_name(name)))
+        index.add(child_id, name)
+    print(f"Construcción del índice: {time.perf_counter() - start:.1f} s")
+
+    # El recorrido es demasiado lento para n grande: se mide sobre una muestra
+    # y se extrapola linealmente
+    sample = names[:min(n, 20_000)]
+
+    def scan(query):
+        key = normalize_name(query)
+        return heapq.nsmallest(10, sample, key=lambda item: levenshtein(key, item[1]))
+
+    print(f"{'Consulta':<22}{'Levenshtein (ms)':>20}{'Trigramas (ms)':>18}{'Mejora':>12}")
+    for query in QUERIES:
+        scan_ms = timed(lambda: scan(query), repeat=1) * n / len(sample)
+        index_ms = timed(lambda: index.search(query, 10), repeat=20)
+        print(f"{query:<22}{scan_ms:>20.0f}{index_ms:>18.2f}{scan_ms / index_ms:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,78 @@
+"""
+Benchmark del modo chivo expiatorio del ABB frente al ABB clásico y al AVL.
+
+Para IDs aleatorios y secuenciales mide:
+- Tiempo de inserción de todos los niños
+- Latencia promedio de búsqueda
+- Altura final del árbol
+
+El ABB clásico con IDs secuenciales degenera en una lista (O(n²) para
+construirlo), así que en ese caso se limita a una muestra más pequeña.
+
+Uso:
+    python -m benchmarks.bench_scapegoat [cantidad_de_niños]
+"""
+
+import random
+import sys
+import time
+
+from app.models.abb_model import BinarySearchTree, Child
+from app.models.avl_model import AVLTree
+
+# Niños máximos del ABB clásico con IDs secuenciales
+PLAIN_SEQUENTIAL_LIMIT = 5_000
+
+
+def run(factory, ids, queries):
+    """
+    Inserta los IDs y busca las consultas.
+
+    Returns:
+        Tupla (ms de inserción, µs por búsqueda, altura)
+    """
+    tree = factory()
+    children = [Child(id=i, name=f"Niño{i}", age=i % 18, city="Cali", gender="male") for i in ids]
+    start = time.perf_counter()
+    for child in children:
+        tree.insert(child)
+    insert_ms = (time.perf_counter() - start) * 1e3
+
+    start = time.perf_counter()
+    for child_id in queries:
+        tree.search(child_id)
+    search_us = (time.perf_counter() - start) / len(queries) * 1e6
+    return insert_ms, search_us, tree.get_tree_height()
+
+
+def main(n: int = 100_000):
+    rng = random.Random(42)
+    engines = [
+        ("ABB clásico", BinarySearchTree),
+        ("ABB chivo α=0.6", lambda: BinarySearchTree(scapegoat_alpha=0.6)),
+        ("ABB chivo α=0.75", lambda: BinarySearchTree(scapegoat_alpha=0.75)),
+        ("AVL", AVLTree),
+    ]
+    workloads = [
+        ("aleatorio", rng.sample(range(1, n * 10), n)),
+        ("secuencial", list(range(1, n + 1))),
+    ]
+
+    print("=" * 70)
+    print(f"  ABB CHIVO EXPIATORIO VS ABB CLÁSICO VS AVL ({n} niños)")
+    print("=" * 70)
+    print(f"{'Motor':<20}{'Carga':<12}{'Inserción (ms)':>16}{'Búsqueda (µs)':>15}{'Altura':>8}")
+    for workload, ids in workloads:
+        for name, factory in engines:
+            sample = ids
+            if name == "ABB clásico" and workload == "secuencial":
+                sample = ids[:PLAIN_SEQUENTIAL_LIMIT]
+            queries = [rng.choice(sample) for _ in range(20_000)]
+            insert_ms, search_us, height = run(factory, sample, queries)
+            label = workload if len(sample) == n else f"{workload}*"
+            print(f"{name:<20}{label:<12}{insert_ms:>16.0f}{search_us:>15.2f}{height:>8}")
+    print(f"* ABB clásico secuencial limitado a {PLAIN_SEQUENTIAL_LIMIT} niños")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,86 @@
+"""
+Benchmark del motor splay con accesos sesgados frente a AVLTree.search.
+
+Cargas de búsqueda sobre los mismos niños:
+- uniforme: todos los IDs con la misma probabilidad (control)
+- zipf: el ID de rango r se consulta con probabilidad proporcional a 1/r^s
+- ventana: un conjunto caliente de pocos cientos de IDs recibe todas las
+  consultas y cambia por completo cada cierto número de búsquedas
+
+Se comparan AVLTree, SplayTree y SplayTree(read_mostly=True).
+
+Uso:
+    python -m benchmarks.bench_splay [cantidad_de_niños] [búsquedas]
+"""
+
+import random
+import sys
+import time
+from itertools import accumulate
+
+from app.models.abb_model import Child
+from app.models.avl_model import AVLTree
+from app.models.splay_model import SplayTree
+
+ZIPF_EXPONENT = 1.1
+HOT_SET_SIZE = 300
+PHASE_LENGTH = 20_000
+
+
+def zipf_queries(ids, count, rng):
+    """Consultas con distribución de Zipf sobre un orden aleatorio de los IDs."""
+    ranked = ids[:]
+    rng.shuffle(ranked)
+    weights = list(accumulate(1 / rank ** ZIPF_EXPONENT for rank in range(1, len(ranked) + 1)))
+    return rng.choices(ranked, cum_weights=weights, k=count)
+
+
+def window_queries(ids, count, rng):
+    """Consultas sobre un conjunto caliente que cambia cada PHASE_LENGTH búsquedas."""
+    queries = []
+    while len(queries) < count:
+        hot = rng.sample(ids, HOT_SET_SIZE)
+        queries.extend(rng.choice(hot) for _ in range(min(PHASE_LENGTH, count - len(queries))))
+    return queries
+
+
+def timed_searches(tree, queries) -> float:
+    """Latencia promedio por búsqueda en microsegundos."""
+    start = time.perf_counter()
+    for child_id in queries:
+        tree.search(child_id)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main(n: int = 100_000, searches: int = 200_000):
+    rng = random.Random(43)
+    ids = rng.sample(range(1, n * 10), n)
+    children = [Child(id=i, name=f"Niño{i}", age=i % 18, city="Cali", gender="male") for i in ids]
+    workloads = [
+        ("uniforme", [rng.choice(ids) for _ in range(searches)]),
+        (f"zipf s={ZIPF_EXPONENT}", zipf_queries(ids, searches, rng)),
+        (f"ventana {HOT_SET_SIZE}", window_queries(ids, searches, rng)),
+    ]
+
+    print("=" * 70)
+    print(f"  SPLAY VS AVL CON ACCESOS SESGADOS ({n} niños, {searches} búsquedas)")
+    print("=" * 70)
+    print(f"{'Carga':<16}{'AVL (µs)':>12}{'Splay (µs)':>14}{'Read-mostly (µs)':>18}{'Splays RM':>11}")
+    avl = AVLTree.from_sorted(sorted(children, key=lambda c: c.id))
+    for name, queries in workloads:
+        # Árboles nuevos por carga: el splay no arrastra el sesgo de la anterior
+        splay, read_mostly = SplayTree(), SplayTree(read_mostly=True)
+        for child in children:
+            splay.insert(child)
+            read_mostly.insert(child)
+        avl_us = timed_searches(avl, queries)
+        splay_us = timed_searches(splay, queries)
+        read_mostly_us = timed_searches(read_mostly, queries)
+        print(f"{name:<16}{avl_us:>12.2f}{splay_us:>14.2f}{read_mostly_us:>18.2f}{read_mostly.search_splays:>11}")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    )
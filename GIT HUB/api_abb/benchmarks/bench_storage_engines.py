@@ -0,0 +1,107 @@
+"""
+Benchmark de los motores de almacenamiento de niños.
+
+Compara la latencia de búsqueda y la memoria ocupada por:
+- BinarySearchTree (ABB de punteros, insertado en orden aleatorio)
+- AVLTree (AVL de punteros)
+- SortedArrayTree (arreglo ordenado + búfer AVL)
+
+Uso:
+    python -m benchmarks.bench_storage_engines [cantidad_de_niños]
+"""
+
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+from app.models.abb_model import BinarySearchTree, Child
+from app.models.avl_model import AVLTree
+from app.models.sorted_array_model import SortedArrayTree
+
+CITIES = ["Bogotá", "Medellín", "Cali", "Barranquilla", "Cartagena"]
+GENDERS = ["male", "female", "other"]
+
+
+def build_children(n: int, seed: int = 42) -> list:
+    """Genera n niños con IDs únicos en orden aleatorio."""
+    rng = random.Random(seed)
+    ids = list(range(1, n + 1))
+    rng.shuffle(ids)
+    return [
+        Child(
+            id=child_id,
+            name=f"Niño{child_id}",
+            age=child_id % 15,
+            city=CITIES[child_id % len(CITIES)],
+            gender=GENDERS[child_id % len(GENDERS)],
+        )
+        for child_id in ids
+    ]
+
+
+def measure_structure_memory(factory, children: list):
+    """
+    Construye la estructura y mide la memoria que agrega sobre los niños ya creados.
+
+    Returns:
+        Tupla (estructura, bytes_asignados, segundos_de_construcción)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    tree = factory()
+    for child in children:
+        tree.insert(child)
+    if hasattr(tree, "flush"):
+        tree.flush()
+    elapsed = time.perf_counter() - start
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tree, current, elapsed
+
+
+def measure_lookups(tree, ids: list) -> dict:
+    """Mide la latencia por búsqueda (promedio, p50 y p99 en microsegundos)."""
+    samples = []
+    search = tree.search
+    for child_id in ids:
+        start = time.perf_counter()
+        search(child_id)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "mean_us": sum(samples) / len(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+def main(n: int = 50_000, lookups: int = 20_000):
+    print("=" * 78)
+    print(f"  BENCHMARK DE MOTORES DE ALMACENAMIENTO ({n} niños, {lookups} búsquedas)")
+    print("=" * 78)
+
+    children = build_children(n)
+    rng = random.Random(1)
+    lookup_ids = [rng.randint(1, n) for _ in range(lookups)]
+
+    engines = {
+        "ABB (punteros)": BinarySearchTree,
+        "AVL (punteros)": AVLTree,
+        "Arreglo ordenado": lambda: SortedArrayTree(buffer_size=512),
+    }
+
+    print(f"{'Motor':<20}{'Construcción (s)':>18}{'Memoria (MB)':>15}"
+          f"{'Media (µs)':>12}{'p50 (µs)':>10}{'p99 (µs)':>10}")
+    for name, factory in engines.items():
+        tree, memory, build_time = measure_structure_memory(factory, children)
+        latency = measure_lookups(tree, lookup_ids)
+        print(f"{name:<20}{build_time:>18.2f}{memory / 1e6:>15.2f}"
+              f"{latency['mean_us']:>12.2f}{latency['p50_us']:>10.2f}{latency['p99_us']:>10.2f}")
+        del tree
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,41 @@
+"""
+Fixtures compartidas por las pruebas de los árboles y servicios.
+"""
+
+import pytest
+
+from app.models.abb_model import Child
+from app.models.schemas import ChildCreate
+
+CITIES = ["Bogotá", "Medellín", "Cali"]
+GENDERS = ["male", "female", "other"]
+
+
+def build_child(child_id: int, **overrides) -> Child:
+    """Crea un Child válido con datos derivados del ID."""
+    data = {
+        "id": child_id,
+        "name": f"Niño{child_id}",
+        "age": child_id % 15,
+        "city": CITIES[child_id % len(CITIES)],
+        "gender": GENDERS[child_id % len(GENDERS)],
+    }
+    data.update(overrides)
+    return Child(**data)
+
+
+def build_child_create(child_id: int, **overrides) -> ChildCreate:
+    """Crea un ChildCreate válido con datos derivados del ID."""
+    return ChildCreate(**build_child(child_id, **overrides).dict())
+
+
+@pytest.fixture
+def make_child():
+    """Fábrica de objetos Child para las pruebas de los modelos."""
+    return build_child
+
+
+@pytest.fixture
+def make_child_create():
+    """Fábrica de esquemas ChildCreate para las pruebas de los servicios."""
+    return build_child_create
@@ -0,0 +1,79 @@
+"""
+Pruebas del rebalanceo Day–Stout–Warren del ABB y de POST /abb/rebalance.
+"""
+
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.abb_model import BinarySearchTree
+from app.services.abb_service import abb_service
+
+client = TestClient(app)
+
+
+def _is_complete(tree):
+    """Todos los niveles llenos salvo el último, que se llena de izquierda a derecha."""
+    level, seen_gap = [tree.root], False
+    while level:
+        next_level = []
+        for node in level:
+            for child in (node.left, node.right):
+                if child is None:
+                    seen_gap = True
+                elif seen_gap:
+                    return False
+                else:
+                    next_level.append(child)
+        level = next_level
+    return True
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 8, 100, 1023, 1024])
+def test_rebalance_sequential_tree(size, make_child):
+    tree = BinarySearchTree()
+    for child_id in range(1, size + 1):
+        tree.insert(make_child(child_id))
+
+    before, after = tree.rebalance()
+    assert before == size
+    assert after == size.bit_length()
+    assert _is_complete(tree)
+    assert [c.id for c in tree.inorder_traversal()] == list(range(1, size + 1))
+    assert all(tree.search(i).id == i for i in range(1, size + 1))
+
+
+def test_rebalance_random_and_empty_tree(make_child):
+    assert BinarySearchTree().rebalance() == (0, 0)
+
+    ids = random.Random(41).sample(range(1, 10_000), 500)
+    tree = BinarySearchTree()
+    for child_id in ids:
+        tree.insert(make_child(child_id))
+    tree.rebalance()
+    assert tree.get_tree_height() == 9
+    assert [c.id for c in tree.preorder_traversal()][0] == sorted(ids)[255]
+    found, missing = tree.search_many(ids[:10] + [0])
+    assert len(found) == 10 and missing == [0]
+
+
+def test_degenerate_tree_beyond_recursion_limit(make_child):
+    tree = BinarySearchTree()
+    for child_id in range(1, 3001):
+        tree.insert(make_child(child_id))
+    assert tree.search(3000).id == 3000
+    assert len(tree.postorder_traversal()) == 3000
+    assert tree.search_many([1, 3000, 5000])[1] == [5000]
+
+
+def test_rebalance_endpoint(make_child_create):
+    abb_service.clear_tree()
+    for child_id in range(1, 16):
+        abb_service.add_child(make_child_create(child_id))
+
+    details = client.post("/abb/rebalance").json()["details"]
+    assert details == {"total_children": 15, "height_before": 15, "height_after": 4, "optimal_height": 4}
+    assert client.get("/abb/stats").json()["root_child"]["id"] == 8
+    abb_service.clear_tree()
@@ -0,0 +1,56 @@
+"""
+Pruebas del modo chivo expiatorio (scapegoat) del ABB.
+"""
+
+import math
+import random
+
+import pytest
+
+from app.models.abb_model import BinarySearchTree
+
+
+def _depth_bound(count, alpha):
+    """Profundidad máxima (en aristas) que garantiza el modo chivo expiatorio."""
+    return math.floor(math.log(count, 1 / alpha)) if count > 1 else 0
+
+
+@pytest.mark.parametrize("alpha", [0.55, 0.7, 0.9])
+def test_sequential_inserts_stay_logarithmic(alpha, make_child):
+    tree = BinarySearchTree(scapegoat_alpha=alpha)
+    for child_id in range(1, 2001):
+        assert tree.insert(make_child(child_id))
+        assert tree.get_tree_height() - 1 <= _depth_bound(child_id, alpha)
+
+    assert tree.rebuilds > 0
+    assert tree.get_count() == 2000
+    assert [c.id for c in tree.inorder_traversal()] == list(range(1, 2001))
+    assert tree.search(1234).id == 1234
+    assert not tree.insert(make_child(1000))
+
+
+def test_random_and_descending_inserts(make_child):
+    rng = random.Random(42)
+    ids = rng.sample(range(1, 100_000), 3000) + list(range(200_000, 199_000, -1))
+    tree = BinarySearchTree(scapegoat_alpha=0.6)
+    for child_id in ids:
+        tree.insert(make_child(child_id))
+
+    assert tree.get_tree_height() - 1 <= _depth_bound(len(ids), 0.6)
+    assert [c.id for c in tree.inorder_traversal()] == sorted(ids)
+    found, missing = tree.search_many(ids[:20] + [0])
+    assert len(found) == 20 and missing == [0]
+
+
+def test_default_tree_is_not_rebuilt(make_child):
+    tree = BinarySearchTree()
+    for child_id in range(1, 101):
+        tree.insert(make_child(child_id))
+    assert tree.get_tree_height() == 100
+    assert tree.rebuilds == 0
+
+
+@pytest.mark.parametrize("alpha", [0.5, 1, 0.2, 1.5])
+def test_invalid_alpha(alpha):
+    with pytest.raises(ValueError):
+        BinarySearchTree(scapegoat_alpha=alpha)
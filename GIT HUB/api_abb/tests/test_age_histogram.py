@@ -0,0 +1,81 @@
+"""
+Pruebas del histograma de edades con árboles de Fenwick.
+"""
+
+import math
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+from app.utils.fenwick import AgeHistogram, FenwickTree
+
+client = TestClient(app)
+
+
+def test_fenwick_prefix_sums_and_kth():
+    values = [3, 0, 2, 5, 0, 1]
+    tree = FenwickTree(len(values))
+    for index, value in enumerate(values):
+        tree.add(index, value)
+
+    for index in range(len(values)):
+        assert tree.prefix_sum(index) == sum(values[:index + 1])
+    assert tree.range_sum(2, 4) == 7
+    assert tree.range_sum(4, 2) == 0
+    assert [tree.find_kth(k) for k in (1, 3, 4, 6, 11)] == [0, 0, 2, 3, 5]
+
+
+def _nearest_rank(ages, p):
+    ages = sorted(ages)
+    return ages[max(1, math.ceil(p * len(ages) / 100)) - 1]
+
+
+def test_histogram_matches_scan(make_child):
+    rng = random.Random(21)
+    histogram = AgeHistogram()
+    children = [make_child(i, age=rng.randint(0, 150)) for i in range(1, 400)]
+    for child in children:
+        histogram.add(child)
+    for child in children[::4]:
+        histogram.remove(child)
+    alive = [c for i, c in enumerate(children) if i % 4]
+
+    for lo, hi in [(0, 150), (5, 8), (100, 20), (149, 150)]:
+        assert histogram.count(lo, hi) == sum(1 for c in alive if lo <= c.age <= hi)
+    for p in [1, 10, 25, 50, 90, 99.5, 100]:
+        assert histogram.percentile(p) == _nearest_rank([c.age for c in alive], p)
+
+    ages = sorted(c.age for c in alive)
+    middle = len(ages) // 2
+    expected = ages[middle] if len(ages) % 2 else (ages[middle - 1] + ages[middle]) / 2
+    assert histogram.median() == expected
+
+    city = alive[0].city
+    city_ages = [c.age for c in alive if c.city == city]
+    assert histogram.count(0, 150, city) == len(city_ages)
+    assert histogram.percentile(50, city) == _nearest_rank(city_ages, 50)
+
+
+def test_empty_histogram():
+    histogram = AgeHistogram()
+    assert histogram.count(0, 150) == 0
+    assert histogram.percentile(50) is None
+    assert histogram.median("Cali") is None
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_age_endpoints(prefix, service, make_child_create):
+    service.clear_tree()
+    for child_id, age in [(1, 3), (2, 5), (3, 7), (4, 9)]:
+        service.add_child(make_child_create(child_id, age=age, city="Cali"))
+
+    assert client.get(f"{prefix}/ages/count", params={"min": 4, "max": 8}).json()["count"] == 2
+    assert client.get(f"{prefix}/ages/percentile", params={"p": 75}).json()["age"] == 7
+    assert client.get(f"{prefix}/ages/median", params={"city": "Cali"}).json()["median_age"] == 6.0
+    assert client.get(f"{prefix}/ages/count", params={"city": "Lima"}).json()["count"] == 0
+    assert client.get(f"{prefix}/ages/percentile", params={"p": 0}).status_code == 422
+    service.clear_tree()
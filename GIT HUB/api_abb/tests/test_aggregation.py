@@ -0,0 +1,85 @@
+"""
+Pruebas del agregador incremental por grupos (GET /aggregate).
+"""
+
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.abb_service import ABBService, abb_service
+from app.services.avl_service import avl_service
+from app.utils.aggregation import GroupAggregator, parse_group_by, parse_metrics
+
+client = TestClient(app)
+
+
+def test_parse_group_by_is_canonical_and_validated():
+    assert parse_group_by("gender, city") == ("city", "gender")
+    with pytest.raises(ValueError):
+        parse_group_by("school")
+    with pytest.raises(ValueError):
+        parse_metrics("count,median")
+
+
+def test_counters_match_full_scan_after_adds_and_removes(make_child):
+    aggregator = GroupAggregator(["city,gender", "age_bucket"], age_bucket_size=5)
+    children = [make_child(i, age=random.Random(i).randint(0, 14)) for i in range(1, 200)]
+    for child in children:
+        aggregator.add(child)
+    for child in children[::3]:
+        aggregator.remove(child)
+    alive = [c for i, c in enumerate(children) if i % 3]
+
+    rows = aggregator.query(("city", "gender"), ["count", "avg_age", "min_age", "max_age"])
+    for row in rows:
+        members = [c.age for c in alive if c.city == row["city"] and c.gender.value == row["gender"]]
+        assert row["count"] == len(members)
+        assert row["avg_age"] == round(sum(members) / len(members), 4)
+        assert (row["min_age"], row["max_age"]) == (min(members), max(members))
+    assert sum(row["count"] for row in rows) == len(alive)
+
+    buckets = {row["age_bucket"]: row["count"] for row in aggregator.query(("age_bucket",), ["count"])}
+    assert buckets["0-4"] == sum(1 for c in alive if c.age < 5)
+
+
+def test_age_buckets_are_ordered_numerically(make_child):
+    aggregator = GroupAggregator(["age_bucket", "age_bucket,city"], age_bucket_size=5)
+    for child_id, age in enumerate([12, 3, 17, 7, 10], start=1):
+        aggregator.add(make_child(child_id, age=age, city="Cali"))
+
+    buckets = [row["age_bucket"] for row in aggregator.query(("age_bucket",), ["count"])]
+    assert buckets == ["0-4", "5-9", "10-14", "15-19"]
+    rows = aggregator.query(parse_group_by("age_bucket,city"), ["count"])
+    assert [row["age_bucket"] for row in rows] == ["0-4", "5-9", "10-14", "15-19"]
+
+
+def test_kids_by_city_and_gender_uses_counters(make_child_create):
+    service = ABBService()
+    for child_id in range(1, 10):
+        service.add_child(make_child_create(child_id))
+
+    result = service.get_kids_by_city_and_gender()
+    assert result["total_children"] == 9
+    assert sum(city["total"] for city in result["cities"]) == 9
+    assert [city["city"] for city in result["cities"]] == sorted(city["city"] for city in result["cities"])
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_aggregate_endpoint(prefix, service, make_child_create):
+    service.clear_tree()
+    service.add_child(make_child_create(1, city="Cali", gender="female", age=4))
+    service.add_child(make_child_create(2, city="Cali", gender="female", age=8))
+    service.add_child(make_child_create(3, city="Pasto", gender="male", age=5))
+
+    response = client.get(f"{prefix}/aggregate", params={"group_by": "gender,city", "metrics": "count,avg_age"})
+    assert response.status_code == 200
+    assert response.json()["groups"] == [
+        {"city": "Cali", "gender": "female", "count": 2, "avg_age": 6.0},
+        {"city": "Pasto", "gender": "male", "count": 1, "avg_age": 5.0},
+    ]
+
+    assert client.get(f"{prefix}/aggregate", params={"group_by": "gender,age_bucket"}).status_code == 400
+    service.clear_tree()
+    assert client.get(f"{prefix}/aggregate").json()["groups"] == []
@@ -0,0 +1,15 @@
+"""
+Pruebas del modelo AVLTree.
+"""
+
+from app.models.avl_model import AVLTree
+
+
+def test_sequential_inserts_stay_balanced(make_child):
+    tree = AVLTree()
+    for child_id in range(1, 256):
+        assert tree.insert(make_child(child_id))
+
+    assert tree.is_balanced()
+    assert tree.get_tree_height() == 8
+    assert [c.id for c in tree.inorder_traversal()] == list(range(1, 256))
@@ -0,0 +1,108 @@
+"""
+Pruebas de propiedades de split, join, delete_range y merge del AVLTree,
+contra una lista ordenada de referencia.
+"""
+
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.avl_model import AVLTree
+from app.services.avl_service import avl_service
+
+client = TestClient(app)
+
+SEEDS = range(25)
+
+
+def _tree(make_child, ids):
+    tree = AVLTree()
+    for child_id in ids:
+        tree.insert(make_child(child_id))
+    return tree
+
+
+def _check(tree, expected):
+    """El árbol contiene exactamente `expected`, está balanceado y sus tamaños son correctos."""
+    assert [c.id for c in tree.inorder_traversal()] == sorted(expected)
+    assert tree.get_count() == len(expected)
+    assert tree.is_balanced()
+
+    def sizes(node):
+        if node is None:
+            return 0
+        size = 1 + sizes(node.left) + sizes(node.right)
+        assert node.size == size
+        assert node.height == 1 + max(node.left.height if node.left else 0, node.right.height if node.right else 0)
+        return size
+
+    sizes(tree.root)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_split_matches_reference(seed, make_child):
+    rng = random.Random(seed)
+    ids = rng.sample(range(1, 1000), rng.randint(0, 200))
+    key = rng.randint(0, 1001)
+    left, right = _tree(make_child, ids).split(key)
+    _check(left, [i for i in ids if i < key])
+    _check(right, [i for i in ids if i >= key])
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_join_matches_reference(seed, make_child):
+    rng = random.Random(seed)
+    # Tamaños muy distintos para ejercitar el descenso por el lado más alto
+    cut = rng.randint(1, 999)
+    left_ids = rng.sample(range(1, cut), min(cut - 1, rng.choice([0, 3, 50, 300])))
+    right_ids = rng.sample(range(cut, 2000), rng.choice([0, 1, 40, 400]))
+    joined = AVLTree.join(_tree(make_child, left_ids), _tree(make_child, right_ids))
+    _check(joined, left_ids + right_ids)
+
+
+def test_join_rejects_overlapping_trees(make_child):
+    with pytest.raises(ValueError):
+        AVLTree.join(_tree(make_child, [1, 5]), _tree(make_child, [5, 9]))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_delete_range_and_merge_match_reference(seed, make_child):
+    rng = random.Random(seed)
+    ids = rng.sample(range(1, 600), 250)
+    tree = _tree(make_child, ids)
+    low = rng.randint(0, 600)
+    high = rng.randint(low, 650)
+
+    removed = tree.delete_range(low, high)
+    kept = [i for i in ids if not low <= i <= high]
+    assert [c.id for c in removed] == sorted(i for i in ids if low <= i <= high)
+    _check(tree, kept)
+
+    incoming = sorted(rng.sample(range(1, 800), 150))
+    duplicates = tree.merge(AVLTree.from_sorted([make_child(i) for i in incoming]))
+    assert sorted(c.id for c in duplicates) == sorted(set(kept) & set(incoming))
+    _check(tree, set(kept) | set(incoming))
+
+
+def test_range_delete_and_merge_endpoints(make_child_create):
+    avl_service.clear_tree()
+    for child_id in range(1, 21):
+        avl_service.add_child(make_child_create(child_id))
+
+    response = client.delete("/avl/children", params={"min_id": 5, "max_id": 14})
+    assert response.status_code == 200
+    assert response.json()["details"]["deleted"] == 10
+    assert avl_service.search_child(7) is None
+    assert avl_service.get_age_median()["total"] == 10
+    assert client.delete("/avl/children", params={"min_id": 9, "max_id": 2}).status_code == 400
+
+    payload = {"children": [make_child_create(i).dict() for i in [3, 7, 8, 25]]}
+    response = client.post("/avl/merge", json=payload)
+    assert response.status_code == 200
+    assert response.json()["details"] == {"inserted": 3, "duplicates": 1, "total_children": 13}
+    assert avl_service.search_child(25).id == 25
+    # Los índices secundarios siguen los cambios
+    assert [c["id"] for c in client.get("/avl/children", params={"city": "Cali"}).json()] == [2, 8, 17, 20]
+    avl_service.clear_tree()
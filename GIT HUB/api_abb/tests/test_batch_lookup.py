@@ -0,0 +1,60 @@
+"""
+Pruebas de la búsqueda múltiple (search_many y POST /children/lookup).
+"""
+
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.abb_model import BinarySearchTree
+from app.models.avl_model import AVLTree
+from app.models.sorted_array_model import SortedArrayTree
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("factory", [BinarySearchTree, AVLTree, lambda: SortedArrayTree(buffer_size=8)])
+def test_search_many_matches_individual_searches(factory, make_child):
+    rng = random.Random(3)
+    tree = factory()
+    stored = rng.sample(range(1, 500), 120)
+    for child_id in stored:
+        tree.insert(make_child(child_id))
+
+    requested = rng.sample(range(1, 500), 80) + stored[:5]  # incluye repetidos
+    found, missing = tree.search_many(requested)
+
+    expected_found = sorted(i for i in set(requested) if tree.search(i) is not None)
+    assert [c.id for c in found] == expected_found
+    assert missing == sorted(set(requested) - set(expected_found))
+
+
+def test_search_many_on_empty_tree():
+    found, missing = AVLTree().search_many([3, 1, 2])
+    assert found == []
+    assert missing == [1, 2, 3]
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_lookup_endpoint_lists_hits_and_misses(prefix, service, make_child_create):
+    service.clear_tree()
+    for child_id in [10, 5, 15]:
+        service.add_child(make_child_create(child_id))
+
+    response = client.post(f"{prefix}/children/lookup", json={"ids": [15, 99, 5, 5]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [c["id"] for c in body["found"]] == [5, 15]
+    assert body["missing"] == [99]
+    assert body["total_found"] == 2 and body["total_missing"] == 1
+    service.clear_tree()
+
+
+def test_lookup_endpoint_rejects_empty_list():
+    response = client.post("/abb/children/lookup", json={"ids": []})
+    assert response.status_code == 422
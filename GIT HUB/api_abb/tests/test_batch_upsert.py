@@ -0,0 +1,223 @@
+"""
+Pruebas de la eliminación en los motores y de los lotes atómicos
+(POST /children/batch).
+"""
+
+import random
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.abb_model import BinarySearchTree
+from app.models.avl_model import AVLTree
+from app.models.persistent_avl_model import PersistentAVLTree
+from app.models.schemas import BatchItem, ChildUpdate
+from app.models.sorted_array_model import SortedArrayTree
+from app.models.splay_model import SplayTree
+from app.services.abb_service import ABBService, abb_service
+from app.services.avl_service import AVLService, avl_service
+from app.utils.batch import BatchConflictError, apply_operations
+
+client = TestClient(app)
+
+ENGINES = [
+    BinarySearchTree,
+    lambda: BinarySearchTree(scapegoat_alpha=0.7),
+    AVLTree,
+    PersistentAVLTree,
+    lambda: SortedArrayTree(buffer_size=16),
+    SplayTree,
+]
+
+
+@pytest.mark.parametrize("factory", ENGINES)
+def test_engines_delete_matches_reference(factory, make_child):
+    rng = random.Random(45)
+    tree, expected = factory(), set()
+    for _ in range(2000):
+        child_id = rng.randint(1, 300)
+        if rng.random() < 0.55:
+            assert tree.insert(make_child(child_id)) == (child_id not in expected)
+            expected.add(child_id)
+        else:
+            removed = tree.delete(child_id)
+            assert (removed.id if removed else None) == (child_id if child_id in expected else None)
+            expected.discard(child_id)
+        assert tree.get_count() == len(expected)
+    assert [c.id for c in tree.inorder_traversal()] == sorted(expected)
+    if isinstance(tree, (AVLTree, PersistentAVLTree)):
+        assert tree.is_balanced()
+
+
+def _item(op, child_id, **fields):
+    return BatchItem(op=op, id=child_id, **fields)
+
+
+def _full(child_id, **overrides):
+    data = {"name": f"Niño{child_id}", "age": 5, "city": "Cali", "gender": "male"}
+    data.update(overrides)
+    return data
+
+
+@pytest.mark.parametrize("engine", AVLService.ENGINES)
+def test_failed_batch_leaves_every_engine_untouched(engine, make_child_create):
+    service = AVLService(engine=engine)
+    for child_id in range(1, 21):
+        service.add_child(make_child_create(child_id))
+    before = [c.dict() for c in service.get_all_children()]
+    version = service._version
+
+    items = [
+        _item("insert", 50, **_full(50)),
+        _item("update", 3, name="Cambiado"),
+        _item("delete", 7),
+        _item("upsert", 4, **_full(4, city="Pasto")),
+        _item("delete", 999),
+    ]
+    with pytest.raises(BatchConflictError) as error:
+        service.apply_batch(items)
+    assert error.value.index == 4
+
+    assert [c.dict() for c in service.get_all_children()] == before
+    assert service._version == version
+    assert service.search_by_name_prefix("cambiado", 5) == []
+
+
+class _RecordingPersistentTree(PersistentAVLTree):
+    """AVL persistente que registra cada versión publicada (cada asignación de _state)."""
+
+    def __init__(self):
+        self.published = []
+        super().__init__()
+
+    def __setattr__(self, name, value):
+        if name == "_state":
+            self.published.append(value)
+        super().__setattr__(name, value)
+
+
+def test_persistent_batch_publishes_a_single_version(make_child):
+    tree = _RecordingPersistentTree()
+    for child_id in range(1, 11):
+        tree.insert(make_child(child_id))
+    root = tree.root
+    tree.published.clear()
+
+    items = [
+        _item("insert", 50, **_full(50)),
+        _item("update", 3, name="Cambiado"),
+        _item("delete", 7),
+        _item("delete", 999),
+    ]
+    with pytest.raises(BatchConflictError):
+        apply_operations(tree, items)
+    # Los lectores nunca vieron las tres primeras operaciones ni su deshacer
+    assert tree.published == []
+    assert tree.root is root
+
+    assert len(apply_operations(tree, items[:3])) == 3
+    assert len(tree.published) == 1
+    assert tree.get_count() == 10
+    assert tree.search(3).name == "Cambiado" and tree.search(7) is None
+
+
+def _mutations(service, make_child_create):
+    """Operaciones públicas del servicio que modifican el árbol."""
+    mutations = [
+        lambda: service.add_child(make_child_create(2)),
+        lambda: service.update_child(1, ChildUpdate(name="Otro")),
+        lambda: service.import_children_chunk([make_child_create(3)]),
+        lambda: service.apply_batch([_item("delete", 3)]),
+        lambda: service.clear_tree(),
+    ]
+    if isinstance(service, ABBService):
+        mutations.append(service.rebalance_tree)
+    else:
+        mutations.append(lambda: service.merge_children([make_child_create(4)]))
+        mutations.append(lambda: service.delete_children_range(4, 4))
+    return mutations
+
+
+@pytest.mark.parametrize("factory", [ABBService, AVLService])
+def test_every_mutation_takes_the_write_lock(factory, make_child_create):
+    service = factory()
+    service.add_child(make_child_create(1))
+    errors = []
+
+    def run(mutation):
+        try:
+            mutation()
+        except Exception as exc:  # se informa en el hilo principal
+            errors.append(exc)
+
+    for mutation in _mutations(service, make_child_create):
+        with service._write_lock:
+            worker = threading.Thread(target=run, args=(mutation,))
+            worker.start()
+            worker.join(timeout=0.05)
+            assert worker.is_alive()
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+        service.add_child(make_child_create(1))
+    assert errors == []
+
+
+@pytest.fixture(params=[("/abb", abb_service), ("/avl", avl_service)])
+def populated(request, make_child_create):
+    prefix, service = request.param
+    service.clear_tree()
+    for child_id in range(1, 11):
+        service.add_child(make_child_create(child_id, city="Cali", gender="male", age=5))
+    yield prefix, service
+    service.clear_tree()
+
+
+def test_batch_endpoint_applies_mixed_operations(populated):
+    prefix, service = populated
+    assert client.get(f"{prefix}/children/2").json()["age"] == 5
+
+    items = [
+        {"op": "insert", "id": 11, **_full(11, city="Pasto")},
+        {"op": "upsert", "id": 12, **_full(12)},
+        {"op": "upsert", "id": 2, **_full(2, name="Sofía", age=9)},
+        {"op": "update", "id": 3, "city": "Pasto"},
+        {"op": "delete", "id": 4},
+        {"op": "delete", "id": 12},
+    ]
+    response = client.post(f"{prefix}/children/batch", json={"items": items})
+    assert response.status_code == 200
+    assert response.json() == {"inserted": 2, "updated": 2, "deleted": 2, "total_children": 10}
+
+    ids = [c["id"] for c in client.get(f"{prefix}/children").json()]
+    assert ids == [1, 2, 3, 5, 6, 7, 8, 9, 10, 11]
+    assert client.get(f"{prefix}/children/2").json()["name"] == "Sofía"
+    assert [c.id for c in service.search_by_name_prefix("sof", 5)] == [2]
+    filtered = client.get(f"{prefix}/children", params={"city": "Pasto"}).json()
+    assert [c["id"] for c in filtered] == [3, 11]
+    groups = client.get(f"{prefix}/aggregate", params={"group_by": "city", "metrics": "count"}).json()["groups"]
+    assert {g["city"]: g["count"] for g in groups} == {"Cali": 8, "Pasto": 2}
+    assert service.count_by_age(9, 9)["count"] == 1
+
+
+def test_batch_endpoint_rolls_back_and_validates(populated):
+    prefix, _service = populated
+    before = client.get(f"{prefix}/children").json()
+
+    items = [{"op": "delete", "id": 1}, {"op": "insert", "id": 5, **_full(5)}]
+    response = client.post(f"{prefix}/children/batch", json={"items": items})
+    assert response.status_code == 409
+    assert response.json()["detail"].startswith("Operación 1 (insert del ID 5)")
+    assert client.get(f"{prefix}/children").json() == before
+
+    invalid = [
+        [{"op": "insert", "id": 20, "name": "Ana"}],
+        [{"op": "update", "id": 1}],
+        [{"op": "delete", "id": 1, "age": 3}],
+        [{"op": "merge", "id": 1}],
+        [],
+    ]
+    for items in invalid:
+        assert client.post(f"{prefix}/children/batch", json={"items": items}).status_code == 422
+    assert client.get(f"{prefix}/children").json() == before
@@ -0,0 +1,117 @@
+"""
+Pruebas de la importación masiva en streaming (POST /import).
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.schemas import ExportFormat
+from app.services.abb_service import ABBService, abb_service
+from app.services.avl_service import avl_service
+from app.utils.bulk_import import import_children_stream, iter_lines
+
+client = TestClient(app)
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+async def _collect(async_iterator):
+    return [item async for item in async_iterator]
+
+
+def test_iter_lines_handles_split_characters_and_bom():
+    data = "﻿uno\r\nñandú\ndos".encode("utf-8")
+    parts = [data[:5], data[5:9], data[9:]]  # la ñ queda partida entre bloques
+    lines = asyncio.run(_collect(iter_lines(_chunks(*parts))))
+    assert lines == [(1, "uno"), (2, "ñandú"), (3, "dos")]
+
+
+def test_import_stream_inserts_by_chunks_and_reports_lines():
+    service = ABBService()
+    rows = [
+        json.dumps({"id": 1, "name": "Ana", "age": 5, "city": "Cali", "gender": "female"}),
+        json.dumps({"id": 2, "name": "Luis", "age": 200, "city": "Cali", "gender": "male"}),
+        "{no es json",
+        "",
+        json.dumps({"id": 1, "name": "Ana", "age": 5, "city": "Cali", "gender": "female"}),
+        json.dumps({"id": 3, "name": "Eva", "age": 4, "city": "Pasto", "gender": "other"}),
+    ]
+    calls = []
+
+    def insert_chunk(children):
+        calls.append(len(children))
+        return service.import_children_chunk(children)
+
+    body = ("\n".join(rows) + "\n").encode("utf-8")
+    result = asyncio.run(import_children_stream(_chunks(body), ExportFormat.NDJSON, insert_chunk, 2))
+
+    assert (result.inserted, result.duplicates, result.invalid) == (2, 1, 2)
+    assert result.total_rows == 5
+    assert [error.line for error in result.invalid_rows] == [2, 3]
+    assert calls == [1, 1, 1]  # solo las filas válidas de cada bloque
+    assert service.get_tree_count() == 2
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_import_raw_ndjson_body(prefix, service):
+    service.clear_tree()
+    body = "\n".join(
+        json.dumps({"id": i, "name": f"N{i}", "age": 3, "city": "Bogotá", "gender": "male"})
+        for i in (5, 3, 8)
+    )
+
+    response = client.post(f"{prefix}/import", data=body.encode("utf-8"),
+                           headers={"Content-Type": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.json()["inserted"] == 3
+    assert [c.id for c in service.get_all_children()] == [3, 5, 8]
+    service.clear_tree()
+
+
+def test_import_multipart_csv_file():
+    abb_service.clear_tree()
+    csv_text = "id,name,age,city,gender\n1,Sofía,6,Medellín,female\n2,,7,Cali,male\n"
+    files = {"file": ("ninos.csv", csv_text.encode("utf-8"), "text/csv")}
+
+    response = client.post("/abb/import", files=files)
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["format"] == "csv"
+    assert body["inserted"] == 1 and body["invalid"] == 1
+    assert body["invalid_rows"][0]["line"] == 3
+    assert abb_service.search_child(1).name == "Sofía"
+    abb_service.clear_tree()
+
+
+def test_import_rejects_bad_csv_header():
+    response = client.post("/abb/import?format=csv", data=b"id,nombre\n1,Ana\n")
+    assert response.status_code == 400
+
+
+def test_import_reports_csv_field_over_limit_as_invalid_row():
+    abb_service.clear_tree()
+    long_field = "a" * 131073  # supera csv.field_size_limit() por defecto
+    body = f'id,name,age,city,gender\n1,Ana,5,Cali,female\n2,"{long_field}",6,Cali,male\n'
+
+    response = client.post("/abb/import?format=csv", data=body.encode("utf-8"))
+
+    result = response.json()
+    assert response.status_code == 200
+    assert result["inserted"] == 1 and result["invalid"] == 1
+    assert result["invalid_rows"][0]["line"] == 3
+    abb_service.clear_tree()
+
+
+def test_import_rejects_csv_header_over_field_limit():
+    header = "id,name,age,city,gender," + "x" * 131073
+    response = client.post("/abb/import?format=csv", data=f"{header}\n1,Ana,5,Cali,female\n".encode("utf-8"))
+    assert response.status_code == 400
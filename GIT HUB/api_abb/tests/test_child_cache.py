@@ -0,0 +1,67 @@
+"""
+Pruebas de la caché de respuestas serializadas de GET /children/{id}.
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.abb_service import ABBService, abb_service
+from app.services.avl_service import AVLService, avl_service
+from app.utils.lru_cache import LRUCache
+
+client = TestClient(app)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_size=2)
+    cache.put(1, b"a")
+    cache.put(2, b"b")
+    assert cache.get(1) == b"a"  # 1 pasa a ser el más reciente
+    cache.put(3, b"c")           # desaloja a 2
+
+    assert cache.get(2) is None
+    assert cache.get(3) == b"c"
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2 and stats["misses"] == 1
+
+
+def test_lru_cache_with_zero_size_is_disabled():
+    cache = LRUCache(max_size=0)
+    cache.put(1, b"a")
+    assert cache.get(1) is None
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("service_cls", [ABBService, AVLService])
+def test_payload_is_cached_and_invalidated_on_clear(service_cls, make_child_create):
+    service = service_cls()
+    service.add_child(make_child_create(7, name="Lucía"))
+
+    first = service.get_child_payload(7)
+    second = service.get_child_payload(7)
+    assert first is second
+    assert json.loads(first)["name"] == "Lucía"
+    assert service.get_cache_stats()["hits"] == 1
+
+    service.clear_tree()
+    assert service.get_child_payload(7) is None
+    assert service.get_cache_stats()["size"] == 0
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_endpoint_serves_same_json_as_response_model(prefix, service, make_child_create):
+    service.clear_tree()
+    service.add_child(make_child_create(3, name="José", city="Bogotá"))
+
+    response = client.get(f"{prefix}/children/3")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == service.search_child(3).dict()
+
+    assert client.get(f"{prefix}/children/404").status_code == 404
+    assert client.get(f"{prefix}/cache/stats").json()["size"] == 1
+    service.clear_tree()
@@ -0,0 +1,73 @@
+"""
+Pruebas de la copia columnar y de /stats/ages y /stats/histogram.
+"""
+
+import math
+import statistics
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+from app.utils.columnar import ColumnarSnapshot, parse_percentiles
+
+client = TestClient(app)
+
+
+def _nearest_rank(ages, p):
+    ages = sorted(ages)
+    return ages[max(1, math.ceil(p * len(ages) / 100)) - 1]
+
+
+def test_age_stats_match_python_loops(make_child):
+    children = [make_child(child_id, age=(child_id * 7) % 18) for child_id in range(1, 200)]
+    snapshot = ColumnarSnapshot(children, version=1)
+    groups = snapshot.age_stats(("city", "gender"), [25, 90])
+
+    for group in groups:
+        ages = [c.age for c in children if c.city == group["city"] and c.gender == group["gender"]]
+        assert group["count"] == len(ages)
+        assert group["mean_age"] == round(statistics.mean(ages), 2)
+        assert group["median_age"] == statistics.median(ages)
+        assert group["percentiles"] == {"p25": _nearest_rank(ages, 25), "p90": _nearest_rank(ages, 90)}
+    assert sum(group["count"] for group in groups) == len(children)
+
+
+def test_histogram_filters(make_child):
+    children = [make_child(child_id) for child_id in range(1, 61)]
+    snapshot = ColumnarSnapshot(children, version=1)
+    bins = snapshot.histogram(5, city="Cali")
+    expected = [c.age // 5 for c in children if c.city == "Cali"]
+    assert [item["count"] for item in bins] == [expected.count(i) for i in sorted(set(expected))]
+    assert snapshot.histogram(5, city="Lima") == []
+
+
+def test_parse_percentiles_rejects_invalid():
+    assert parse_percentiles("50, 99.5") == [50.0, 99.5]
+    for text in ["0", "101", "abc"]:
+        with pytest.raises(ValueError):
+            parse_percentiles(text)
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_snapshot_rebuilt_only_after_mutations(prefix, service, make_child_create):
+    service.clear_tree()
+    for child_id in [5, 3, 8]:
+        service.add_child(make_child_create(child_id, age=child_id))
+
+    body = client.get(f"{prefix}/stats/ages", params={"group_by": "", "percentiles": "50"}).json()
+    assert body["groups"][0]["count"] == 3 and body["groups"][0]["median_age"] == 5
+    snapshot = service._get_snapshot()
+    assert service._get_snapshot() is snapshot
+
+    service.add_child(make_child_create(10, age=10))
+    assert service._get_snapshot() is not snapshot
+    stats = client.get(f"{prefix}/stats").json()
+    assert (stats["min_id"], stats["max_id"]) == (3, 10)
+
+    histogram = client.get(f"{prefix}/stats/histogram", params={"bin_size": 5}).json()
+    assert [(item["min_age"], item["count"]) for item in histogram["bins"]] == [(0, 1), (5, 2), (10, 1)]
+    assert client.get(f"{prefix}/stats/ages", params={"group_by": "age_bucket"}).status_code == 400
+    service.clear_tree()
@@ -0,0 +1,79 @@
+"""
+Pruebas de la paginación por cursor (iter_inorder y GET /children?limit=&cursor=).
+"""
+
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.abb_model import BinarySearchTree
+from app.models.avl_model import AVLTree
+from app.models.sorted_array_model import SortedArrayTree
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+from app.utils.cursor import decode_cursor, encode_cursor
+
+client = TestClient(app)
+
+FACTORIES = [BinarySearchTree, AVLTree, lambda: SortedArrayTree(buffer_size=5)]
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_iter_inorder_seeks_after_id(factory, make_child):
+    tree = factory()
+    ids = random.Random(9).sample(range(1, 200), 60)
+    for child_id in ids:
+        tree.insert(make_child(child_id))
+
+    assert [c.id for c in tree.iter_inorder()] == sorted(ids)
+    for after_id in [0, 50, 100, 199, sorted(ids)[10]]:
+        expected = [i for i in sorted(ids) if i > after_id]
+        assert [c.id for c in tree.iter_inorder(after_id)] == expected
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor(42)) == 42
+    for bad in ["", "not-a-cursor", encode_cursor(1)[:-3] + "$$$"]:
+        with pytest.raises(ValueError):
+            decode_cursor(bad)
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_pages_cover_tree_and_survive_inserts(prefix, service, make_child_create):
+    service.clear_tree()
+    for child_id in range(10, 110, 10):
+        service.add_child(make_child_create(child_id))
+
+    first = client.get(f"{prefix}/children", params={"limit": 4}).json()
+    assert [c["id"] for c in first["children"]] == [10, 20, 30, 40]
+
+    # Una inserción entre páginas no invalida el cursor
+    service.add_child(make_child_create(45))
+    service.add_child(make_child_create(5))
+
+    seen = [c["id"] for c in first["children"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = client.get(f"{prefix}/children", params={"limit": 4, "cursor": cursor}).json()
+        seen.extend(c["id"] for c in page["children"])
+        cursor = page["next_cursor"]
+
+    assert seen == [10, 20, 30, 40, 45, 50, 60, 70, 80, 90, 100]
+    service.clear_tree()
+
+
+def test_unpaginated_listing_and_bad_requests(make_child_create):
+    abb_service.clear_tree()
+    abb_service.add_child(make_child_create(1))
+
+    assert isinstance(client.get("/abb/children").json(), list)
+    page = client.get("/abb/children", params={"after_id": 0}).json()
+    assert page["limit"] == 100 and page["next_cursor"] is None
+
+    assert client.get("/abb/children", params={"cursor": "???"}).status_code == 400
+    both = {"cursor": encode_cursor(1), "after_id": 1}
+    assert client.get("/abb/children", params=both).status_code == 400
+    assert client.get("/abb/children", params={"limit": 0}).status_code == 422
+    abb_service.clear_tree()
@@ -0,0 +1,95 @@
+"""
+Pruebas de la medición de memoria y de GET /debug/memory.
+"""
+
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.abb_model import BinarySearchTree
+from app.services.abb_service import ABBService, abb_service
+from app.services.avl_service import AVLService, avl_service
+from app.utils.memory import allocation_tracker, deep_sizeof
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def clean_services():
+    abb_service.clear_tree()
+    avl_service.clear_tree()
+    yield
+    allocation_tracker.stop()
+    abb_service.clear_tree()
+    avl_service.clear_tree()
+
+
+def test_deep_sizeof_does_not_count_shared_objects_twice():
+    shared = list(range(1000))
+    seen = set()
+    first, _ = deep_sizeof({"a": shared}, seen)
+    second, _ = deep_sizeof({"b": shared}, seen)
+    assert first > sys.getsizeof(shared)
+    assert second < sys.getsizeof(shared)
+
+
+def test_deep_sizeof_handles_degenerate_tree(make_child):
+    # Inserción ascendente: una cadena de 5000 nodos más profunda que el límite de recursión
+    tree = BinarySearchTree()
+    for child_id in range(1, 5001):
+        tree.insert(make_child(child_id))
+    size, objects = deep_sizeof(tree, set())
+    assert objects > 5000 and size > 0
+
+
+@pytest.mark.parametrize("engine", AVLService.ENGINES)
+def test_avl_memory_usage_splits_categories(engine, make_child_create):
+    service = AVLService(engine=engine)
+    for child_id in range(1, 201):
+        service.add_child(make_child_create(child_id))
+    service.get_age_stats("city", "50")  # construye la copia columnar
+    service.get_child_payload(1)
+
+    usage = service.get_memory_usage()
+    assert usage["engine"] == engine
+    assert usage["total_children"] == 200
+    assert usage["nodes"]["bytes"] > 0 and usage["children"]["bytes"] > 0
+    assert usage["indexes"]["columnar_snapshot"] > 0
+    assert usage["caches"]["payload_cache"] > 0
+    parts = (
+        usage["nodes"]["bytes"] + usage["children"]["bytes"] + usage["strings"]["bytes"]
+        + sum(usage["indexes"].values()) + sum(usage["caches"].values())
+    )
+    assert usage["total_bytes"] == parts
+
+
+def test_strings_report_duplicate_city_bytes(make_child_create):
+    service = ABBService()
+    for child_id in range(1, 101):
+        # Textos construidos en tiempo de ejecución: objetos distintos con igual valor
+        service.add_child(make_child_create(child_id, city="".join(["Bogo", "tá"])))
+    strings = service.get_memory_usage()["strings"]
+    assert strings["references"] == 200
+    assert strings["duplicate_bytes"] > 0
+
+
+def test_debug_memory_endpoint_reports_trees_and_allocators(make_child_create):
+    response = client.get("/debug/memory")
+    assert response.status_code == 200
+    assert response.json()["tracemalloc"] == {
+        "tracing": False, "current_bytes": None, "peak_bytes": None, "top_allocators": []
+    }
+
+    assert client.post("/debug/memory/reset").json()["tracing"] is True
+    for child_id in range(1, 51):
+        abb_service.add_child(make_child_create(child_id))
+
+    body = client.get("/debug/memory", params={"top": 5}).json()
+    assert body["trees"]["abb"]["total_children"] == 50
+    assert body["trees"]["avl"]["total_children"] == 0
+    assert 0 < len(body["tracemalloc"]["top_allocators"]) <= 5
+    assert body["tracemalloc"]["peak_bytes"] >= body["tracemalloc"]["current_bytes"]
+
+    assert client.delete("/debug/memory/tracing").json()["tracing"] is False
@@ -0,0 +1,86 @@
+"""
+Pruebas de la exportación en streaming (GET /export).
+"""
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.schemas import ExportFormat
+from app.services.abb_service import ABBService, abb_service
+from app.services.avl_service import AVLService, avl_service
+from app.utils.export import accepts_gzip, gzip_chunks, iter_csv, iter_ndjson
+
+client = TestClient(app)
+
+
+def test_serializers_batch_rows(make_child):
+    children = [make_child(i, name="Ñandú, \"el\"") for i in range(1, 8)]
+
+    ndjson_chunks = list(iter_ndjson(children, batch_size=3))
+    assert len(ndjson_chunks) == 3
+    rows = [json.loads(line) for line in b"".join(ndjson_chunks).decode("utf-8").splitlines()]
+    assert [r["id"] for r in rows] == list(range(1, 8))
+    assert rows[0]["name"] == "Ñandú, \"el\""
+
+    csv_text = b"".join(iter_csv(children, batch_size=3)).decode("utf-8")
+    records = list(csv.DictReader(io.StringIO(csv_text)))
+    assert [int(r["id"]) for r in records] == list(range(1, 8))
+    assert records[0]["name"] == "Ñandú, \"el\""
+
+
+def test_gzip_chunks_round_trip():
+    data = [b"hola\n" * 100, b"mundo\n" * 100]
+    assert gzip.decompress(b"".join(gzip_chunks(data))) == b"".join(data)
+
+
+@pytest.mark.parametrize("header,expected", [
+    (None, False),
+    ("identity", False),
+    ("gzip", True),
+    ("br, gzip;q=0.5", True),
+    ("gzip;q=0", False),
+    ("*", True),
+])
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_export_endpoint_streams_in_id_order(prefix, service, make_child_create):
+    service.clear_tree()
+    for child_id in [30, 10, 20]:
+        service.add_child(make_child_create(child_id))
+
+    response = client.get(f"{prefix}/export", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [10, 20, 30]
+
+    response = client.get(f"{prefix}/export", params={"format": "csv"})
+    assert response.headers["content-encoding"] == "gzip"
+    lines = response.text.splitlines()  # requests descomprime gzip automáticamente
+    assert lines[0] == "id,name,age,city,gender"
+    assert [int(line.split(",")[0]) for line in lines[1:]] == [10, 20, 30]
+    service.clear_tree()
+
+
+@pytest.mark.parametrize("factory", [ABBService, AVLService, lambda: AVLService(engine="sorted_array")])
+def test_export_is_taken_before_concurrent_writes(factory, make_child_create):
+    service = factory()
+    for child_id in range(1, 21):
+        service.add_child(make_child_create(child_id))
+    export = service.export_children(ExportFormat.NDJSON)
+
+    # Escrituras que llegan mientras el flujo aún no se consumió
+    service.clear_tree()
+    for child_id in range(100, 0, -1):
+        service.add_child(make_child_create(child_id))
+
+    rows = [json.loads(line)["id"] for line in b"".join(export).decode("utf-8").splitlines()]
+    assert rows == list(range(1, 21))
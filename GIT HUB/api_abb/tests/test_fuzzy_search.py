@@ -0,0 +1,76 @@
+"""
+Pruebas del índice de trigramas y de GET /children/fuzzy.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+from app.utils.ngram_index import TrigramIndex, trigrams
+
+client = TestClient(app)
+
+NAMES = {1: "Lucas", 2: "Lucía", 3: "Luis", 4: "Mateo", 5: "Lucas", 6: "Valentina"}
+
+
+def _dice(a, b):
+    ga, gb = trigrams(a), trigrams(b)
+    return 2 * len(ga & gb) / (len(ga) + len(gb))
+
+
+def test_trigrams_are_padded():
+    assert trigrams("ana") == {"  a", " an", "ana", "na "}
+
+
+def test_search_ranks_typos_first():
+    index = TrigramIndex()
+    for child_id, name in NAMES.items():
+        index.add(child_id, name)
+
+    result = index.search("Lucaz", k=3)
+    assert [child_id for child_id, _ in result] == [1, 5, 2]
+    assert result[0][1] == round(_dice("lucaz", "lucas"), 4)
+    assert index.search("zzzz", k=3) == []
+
+
+def test_prefix_filter_matches_exhaustive_scores():
+    index = TrigramIndex()
+    for child_id, name in NAMES.items():
+        index.add(child_id, name)
+
+    for query in ["Lucas", "valentin", "mate", "lu"]:
+        expected = sorted(
+            ((round(_dice(query.lower(), name.lower().replace("í", "i")), 4), child_id)
+             for child_id, name in NAMES.items()),
+            key=lambda item: -item[0]
+        )
+        expected = {(child_id, score) for score, child_id in expected if score >= 0.3}
+        assert set(index.search(query, k=10)) == expected
+
+
+def test_remove_drops_unused_names():
+    index = TrigramIndex()
+    index.add(1, "Lucas")
+    index.add(2, "Lucas")
+    index.remove(1, "Lucas")
+    assert [child_id for child_id, _ in index.search("Lucas", 5)] == [2]
+    index.remove(2, "Lucas")
+    assert index.search("Lucas", 5) == []
+    assert index._postings == {}
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_fuzzy_endpoint(prefix, service, make_child_create):
+    service.clear_tree()
+    for child_id, name in NAMES.items():
+        service.add_child(make_child_create(child_id, name=name))
+
+    response = client.get(f"{prefix}/children/fuzzy", params={"q": "Lusia", "k": 2})
+    assert response.status_code == 200
+    body = response.json()
+    assert body[0]["child"]["name"] == "Lucía"
+    assert len(body) == 2 and body[0]["score"] >= body[1]["score"]
+    assert client.get(f"{prefix}/children/fuzzy", params={"q": "  "}).status_code == 400
+    service.clear_tree()
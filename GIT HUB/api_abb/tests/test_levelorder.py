@@ -0,0 +1,104 @@
+"""
+Pruebas del recorrido por niveles y de GET /traversal/levelorder.
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.avl_model import AVLTree
+from app.models.sorted_array_model import SortedArrayTree
+from app.services.abb_service import ABBService, abb_service
+from app.services.avl_service import AVLService, avl_service
+from app.utils.export import iter_levels
+
+client = TestClient(app)
+
+
+class CountingNode:
+    """Nodo que cuenta los accesos a sus hijos."""
+
+    visits = 0
+
+    def __init__(self, child, left=None, right=None):
+        self.child, self._left, self._right = child, left, right
+
+    @property
+    def left(self):
+        CountingNode.visits += 1
+        return self._left
+
+    @property
+    def right(self):
+        CountingNode.visits += 1
+        return self._right
+
+
+@pytest.mark.parametrize("factory", [AVLTree, lambda: SortedArrayTree(buffer_size=4)])
+def test_levels_match_tree_shape(factory, make_child):
+    tree = factory()
+    for child_id in range(1, 16):
+        tree.insert(make_child(child_id))
+
+    levels = [[c.id for c in level] for level in iter_levels(tree.root)]
+    assert levels == [[8], [4, 12], [2, 6, 10, 14], [1, 3, 5, 7, 9, 11, 13, 15]]
+    assert [[c.id for c in level] for level in iter_levels(tree.root, max_level=1)] == [[8], [4, 12]]
+    assert list(iter_levels(None)) == []
+
+
+def test_max_level_does_not_expand_deeper_nodes(make_child):
+    def build(lo, hi):
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        return CountingNode(make_child(mid), build(lo, mid - 1), build(mid + 1, hi))
+
+    root = build(1, 1023)
+    CountingNode.visits = 0
+    assert len(list(iter_levels(root, max_level=2))) == 3
+    # Solo se leen los hijos de los niveles 0 y 1 (3 nodos, 2 accesos cada uno)
+    assert CountingNode.visits == 6
+
+
+@pytest.mark.parametrize("prefix, service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_levelorder_endpoint_streams_one_line_per_level(prefix, service, make_child_create):
+    service.clear_tree()
+    for child_id in [50, 30, 70, 20, 40, 60, 80, 10]:
+        service.add_child(make_child_create(child_id))
+
+    response = client.get(f"{prefix}/traversal/levelorder")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["level"] for line in lines] == [0, 1, 2, 3]
+    flattened = [child["id"] for line in lines for child in line["children"]]
+    assert sorted(flattened) == [10, 20, 30, 40, 50, 60, 70, 80]
+    assert lines[0]["children"][0] == service.search_child(lines[0]["children"][0]["id"]).dict()
+
+    top = client.get(f"{prefix}/traversal/levelorder", params={"max_level": 1}).text.splitlines()
+    assert [json.loads(line) for line in top] == lines[:2]
+
+    compressed = client.get(f"{prefix}/traversal/levelorder", headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert client.get(f"{prefix}/traversal/levelorder", params={"max_level": -1}).status_code == 422
+
+    service.clear_tree()
+    assert client.get(f"{prefix}/traversal/levelorder").text == ""
+
+
+@pytest.mark.parametrize("factory", [ABBService, AVLService, lambda: AVLService(engine="sorted_array")])
+def test_levelorder_is_taken_before_concurrent_writes(factory, make_child_create):
+    service = factory()
+    for child_id in [50, 30, 70, 20, 40, 60, 80, 10]:
+        service.add_child(make_child_create(child_id))
+    levels = service.export_levelorder()
+    expected = [[c.id for c in level] for level in iter_levels(service._tree.root)]
+
+    # Escrituras que llegan mientras el flujo aún no se consumió
+    service.clear_tree()
+    for child_id in range(100, 0, -1):
+        service.add_child(make_child_create(child_id))
+
+    assert [[child["id"] for child in json.loads(line)["children"]] for line in levels] == expected
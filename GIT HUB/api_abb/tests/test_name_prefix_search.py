@@ -0,0 +1,59 @@
+"""
+Pruebas del trie de nombres y de GET /children/search.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+from app.utils.name_index import NameTrie, normalize_name
+
+client = TestClient(app)
+
+
+def test_normalize_name_removes_accents_and_case():
+    assert normalize_name("  José   MARÍA ") == "jose maria"
+    assert normalize_name("Íñigo") == "inigo"
+
+
+def test_trie_prefix_search_is_ordered_and_bounded():
+    trie = NameTrie()
+    names = {1: "Lucas", 2: "Lucía", 3: "luis", 4: "Luz", 5: "Ana", 6: "Lucía"}
+    for child_id, name in names.items():
+        trie.add(child_id, name)
+
+    assert trie.search_prefix("LUC", 10) == [1, 2, 6]
+    assert trie.search_prefix("lu", 3) == [1, 2, 6]
+    assert trie.search_prefix("x", 5) == []
+
+
+def test_trie_remove_prunes_branches():
+    trie = NameTrie()
+    trie.add(1, "Sara")
+    trie.add(2, "Sarita")
+    trie.remove(2, "Sarita")
+
+    assert trie.search_prefix("sar", 5) == [1]
+    assert "i" not in trie._root.children["s"].children["a"].children["r"].children
+    trie.remove(1, "Sara")
+    assert trie._root.children == {}
+
+
+@pytest.mark.parametrize("prefix,service", [("/abb", abb_service), ("/avl", avl_service)])
+def test_search_endpoint(prefix, service, make_child_create):
+    service.clear_tree()
+    for child_id, name in [(5, "Sebastián"), (2, "Sofía"), (9, "sebas"), (4, "Ana")]:
+        service.add_child(make_child_create(child_id, name=name))
+
+    response = client.get(f"{prefix}/children/search", params={"name_prefix": "SEBA"})
+    assert response.status_code == 200
+    assert [c["id"] for c in response.json()] == [9, 5]
+
+    limited = client.get(f"{prefix}/children/search", params={"name_prefix": "s", "limit": 1})
+    assert [c["name"] for c in limited.json()] == ["sebas"]
+
+    assert client.get(f"{prefix}/children/search", params={"name_prefix": " "}).status_code == 400
+    assert client.get(f"{prefix}/children/9").json()["name"] == "sebas"
+    service.clear_tree()
@@ -0,0 +1,125 @@
+"""
+Pruebas de los espacios de nombres /trees/{name} y su descarga a disco.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.controllers import namespace_controller
+from app.main import app
+from app.services.namespace_service import NamespaceExistsError, NamespaceRegistry
+
+client = TestClient(app)
+
+
+class FakeClock:
+    """Reloj monotónico controlado por la prueba."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(tmp_path, clock, monkeypatch):
+    registry = NamespaceRegistry(str(tmp_path), idle_seconds=60, default_engine="avl", clock=clock)
+    monkeypatch.setattr(namespace_controller, "namespace_registry", registry)
+    return registry
+
+
+def _add(name, child_id, make_child_create):
+    return client.post(f"/trees/{name}/children", json=make_child_create(child_id).dict())
+
+
+def test_namespaces_are_independent(registry, make_child_create):
+    assert client.post("/trees/school-a", params={"engine": "abb"}).status_code == 201
+    assert _add("school-a", 1, make_child_create).status_code == 201
+    # Escribir en un espacio inexistente lo crea con el motor por defecto
+    assert _add("school-b", 1, make_child_create).status_code == 201
+    assert _add("school-b", 2, make_child_create).status_code == 201
+    assert _add("school-b", 2, make_child_create).status_code == 409
+
+    assert client.get("/trees/school-a/children/1").json()["id"] == 1
+    assert client.get("/trees/school-a/children/2").status_code == 404
+    listing = client.get("/trees").json()
+    assert {(info["name"], info["engine"], info["nodes"]) for info in listing["namespaces"]} == {
+        ("school-a", "abb", 1), ("school-b", "avl", 2)
+    }
+    assert listing["total_nodes"] == 3
+
+    info = client.get("/trees/school-b").json()
+    assert info["state"] == "loaded" and info["memory_bytes"] > 0
+
+
+def test_invalid_name_engine_and_duplicates(registry):
+    assert client.post("/trees/Bad.Name").status_code == 400
+    assert client.post("/trees/ok", params={"engine": "btree"}).status_code == 400
+    assert client.post("/trees/ok").status_code == 201
+    assert client.post("/trees/ok").status_code == 409
+    # Las acciones administrativas no ocupan nombres válidos
+    assert client.post("/trees/evict").status_code == 201
+    assert client.post("/trees/_evict").status_code == 200
+    assert client.get("/trees/missing").status_code == 404
+    assert client.get("/trees/missing/children").status_code == 404
+    with pytest.raises(NamespaceExistsError):
+        registry.create("ok")
+
+
+def test_idle_namespace_is_evicted_and_reloaded_transparently(registry, clock, tmp_path, make_child_create):
+    client.post("/trees/school-a", params={"engine": "abb"})
+    # El ABB debe volver con la misma forma (mismo preorden)
+    for child_id in (5, 3, 8, 1, 4, 9):
+        _add("school-a", child_id, make_child_create)
+    client.patch("/trees/school-a/children/4", json={"age": 12})
+    preorder = client.get("/trees/school-a/traversal/preorder").json()["children"]
+
+    clock.now += 61
+    assert client.post("/trees/_evict").json() == {"evicted": ["school-a"]}
+    assert (tmp_path / "school-a.ndjson.gz").exists()
+    info = client.get("/trees").json()["namespaces"][0]
+    assert info["state"] == "evicted" and info["nodes"] == 6 and info["snapshot_bytes"] > 0
+
+    # El siguiente acceso la recarga: mismos datos y misma forma
+    assert client.get("/trees/school-a/traversal/preorder").json()["children"] == preorder
+    assert client.get("/trees/school-a/children/4").json()["age"] == 12
+    assert not (tmp_path / "school-a.ndjson.gz").exists()
+    assert client.get("/trees/school-a").json()["reloads"] == 1
+
+
+def test_access_keeps_namespace_loaded_and_others_are_evicted(registry, clock, make_child_create):
+    _add("busy", 1, make_child_create)
+    _add("idle", 1, make_child_create)
+    for _ in range(3):
+        clock.now += 40
+        client.get("/trees/busy/children/1")
+    states = {info["name"]: info["state"] for info in client.get("/trees").json()["namespaces"]}
+    assert states == {"busy": "loaded", "idle": "evicted"}
+
+
+def test_delete_removes_loaded_and_evicted_namespaces(registry, clock, tmp_path, make_child_create):
+    _add("gone", 1, make_child_create)
+    clock.now += 61
+    registry.evict_idle()
+    assert client.delete("/trees/gone").status_code == 200
+    assert list(tmp_path.iterdir()) == []
+    assert client.delete("/trees/gone").status_code == 404
+
+
+@pytest.mark.parametrize("engine", ["abb", "avl", "sorted_array", "persistent", "splay"])
+def test_every_engine_survives_a_snapshot(registry, clock, engine, make_child_create):
+    registry.create("school", engine)
+    batch = [{"op": "insert", **make_child_create(child_id).dict()} for child_id in range(1, 51)]
+    assert client.post("/trees/school/children/batch", json={"items": batch}).json()["inserted"] == 50
+    clock.now += 61
+    registry.evict_idle()
+
+    children = client.get("/trees/school/children").json()
+    assert [child["id"] for child in children] == list(range(1, 51))
+    assert client.get("/trees/school").json()["engine"] == engine
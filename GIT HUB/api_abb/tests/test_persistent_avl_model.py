@@ -0,0 +1,86 @@
+"""
+Pruebas del motor de almacenamiento PersistentAVLTree.
+"""
+
+import random
+import threading
+
+from app.models.avl_model import AVLTree
+from app.models.persistent_avl_model import PersistentAVLTree
+from app.services.avl_service import AVLService
+
+
+def test_matches_mutable_avl(make_child):
+    ids = list(range(1, 400))
+    random.Random(11).shuffle(ids)
+    persistent, mutable = PersistentAVLTree(), AVLTree()
+    for child_id in ids:
+        assert persistent.insert(make_child(child_id)) == mutable.insert(make_child(child_id))
+    assert not persistent.insert(make_child(ids[0]))
+
+    assert persistent.get_count() == mutable.get_count() == len(ids)
+    assert persistent.is_balanced()
+    assert persistent.get_tree_height() == mutable.get_tree_height()
+    for traversal in ("inorder_traversal", "preorder_traversal", "postorder_traversal"):
+        assert [c.id for c in getattr(persistent, traversal)()] == [c.id for c in getattr(mutable, traversal)()]
+    assert [c.id for c in persistent.iter_inorder(after_id=390)] == list(range(391, 400))
+    found, missing = persistent.search_many([5, 1000, 7])
+    assert [c.id for c in found] == [5, 7] and missing == [1000]
+
+
+def test_snapshot_is_isolated_from_later_writes(make_child):
+    tree = PersistentAVLTree()
+    for child_id in range(1, 11):
+        tree.insert(make_child(child_id))
+
+    snapshot = tree.snapshot()
+    iterator = tree.iter_inorder()
+    first = next(iterator)
+    for child_id in range(11, 21):
+        tree.insert(make_child(child_id))
+    tree.clear()
+
+    assert snapshot.get_count() == 10
+    assert [c.id for c in snapshot.inorder_traversal()] == list(range(1, 11))
+    assert [first.id] + [c.id for c in iterator] == list(range(1, 11))
+    assert tree.is_empty() and snapshot.search(5).id == 5
+
+
+def test_concurrent_readers_always_see_a_consistent_version(make_child):
+    tree = PersistentAVLTree()
+    errors = []
+    done = threading.Event()
+
+    def writer(start):
+        for child_id in range(start, 2000, 4):
+            tree.insert(make_child(child_id))
+
+    def reader():
+        while not done.is_set():
+            snapshot = tree.snapshot()
+            ids = [c.id for c in snapshot.iter_inorder()]
+            if len(ids) != snapshot.get_count() or ids != sorted(ids) or not snapshot.is_balanced():
+                errors.append(len(ids))
+
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    writers = [threading.Thread(target=writer, args=(start,)) for start in range(1, 5)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    done.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert tree.get_count() == 1999
+
+
+def test_avl_service_persistent_engine(make_child_create):
+    service = AVLService(engine="persistent")
+    for child_id in [10, 5, 15]:
+        assert service.add_child(make_child_create(child_id))["success"]
+    stats = service.get_tree_stats()
+    assert stats["storage_engine"] == "persistent"
+    assert stats["root_child"].id == 10 and stats["is_balanced"]
+    assert service.get_tree_structure().root.left.child.id == 5
@@ -0,0 +1,111 @@
+"""
+Pruebas del perfilado por muestreo de peticiones y de /debug/profiles.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.controllers import avl_controller, debug_controller
+from app.main import app
+from app.utils.profiling import ProfileStore, ProfilingMiddleware, StackSampler, profile_store
+
+# Aplicación con el perfilado activado por header, como en main.py con
+# DEBUG=True y PROFILE_HEADER=X-Debug-Profile
+profiled_app = FastAPI()
+profiled_app.add_middleware(
+    ProfilingMiddleware, store=profile_store, header="X-Debug-Profile", sample_rate=0.0, interval=0.001
+)
+profiled_app.include_router(avl_controller.router, prefix="/avl")
+profiled_app.include_router(debug_controller.router, prefix="/debug")
+
+client = TestClient(profiled_app)
+
+
+@pytest.fixture(autouse=True)
+def isolated_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(profile_store, "directory", str(tmp_path))
+    profile_store.clear()
+    yield
+    profile_store.clear()
+
+
+def _busy(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_sampler_collects_collapsed_stacks_of_the_thread():
+    with StackSampler(threading.get_ident(), interval=0.001) as sampler:
+        _busy(0.05)
+    assert sum(sampler.stacks.values()) > 0
+    lines = sampler.collapsed().splitlines()
+    stacks = [line.rsplit(" ", 1) for line in lines]
+    assert all(int(count) > 0 for _stack, count in stacks)
+    # Raíz primero: la función ocupada aparece debajo de la prueba
+    assert any(stack.split(";")[-1].startswith("_busy") for stack, _count in stacks)
+
+
+def test_store_keeps_only_the_latest_profiles(tmp_path):
+    store = ProfileStore(str(tmp_path), max_profiles=2)
+    for index in range(3):
+        store.save(f"p{index}", {"path": "/"}, "a;b 1\n")
+    assert [profile["id"] for profile in store.list()] == ["p2", "p1"]
+    assert store.read("p0") is None
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["p1.collapsed", "p2.collapsed"]
+    assert store.read("../p1") is None
+
+
+def test_profiling_is_off_by_default():
+    # La configuración por defecto no registra el middleware: el header no tiene efecto
+    response = TestClient(app).get("/avl/tree", headers={"X-Debug-Profile": "1"})
+    assert "x-profile-id" not in response.headers
+    assert profile_store.list() == []
+
+
+def test_requests_without_header_are_not_profiled():
+    assert "x-profile-id" not in client.get("/avl/tree").headers
+    assert client.get("/debug/profiles").json()["total"] == 0
+
+
+def test_request_with_header_is_profiled_and_listed():
+    response = client.get("/avl/tree", headers={"X-Debug-Profile": "1"})
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+
+    listing = client.get("/debug/profiles").json()
+    assert listing["total"] == 1
+    profile = listing["profiles"][0]
+    assert profile["id"] == profile_id
+    assert profile["method"] == "GET" and profile["path"] == "/avl/tree"
+    assert profile["status_code"] == 200 and profile["duration_ms"] >= 0
+
+    collapsed = client.get(f"/debug/profiles/{profile_id}")
+    assert collapsed.status_code == 200
+    assert collapsed.headers["content-type"].startswith("text/plain")
+    assert client.get("/debug/profiles/desconocido").status_code == 404
+
+
+def test_sample_rate_profiles_without_header(tmp_path):
+    calls = []
+
+    async def inner(scope, receive, send):
+        calls.append(scope["path"])
+        await send({"type": "http.response.start", "status": 204, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    store = ProfileStore(str(tmp_path), max_profiles=10)
+    middleware = ProfilingMiddleware(inner, store, header=None, sample_rate=1.0, interval=0.001)
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(middleware({"type": "http", "method": "GET", "path": "/x", "headers": []}, None, send))
+    assert calls == ["/x"]
+    assert (b"x-profile-id", store.list()[0]["id"].encode()) in sent[0]["headers"]
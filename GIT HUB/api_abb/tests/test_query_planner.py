@@ -0,0 +1,96 @@
+"""
+Pruebas del planificador de consultas con filtros y de GET /children?city=...
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+from app.utils.bitmap_index import BitmapIndex, RowBitmaps, popcount
+
+client = TestClient(app)
+
+
+def test_bitmap_index_counts_and_grows():
+    index = BitmapIndex()
+    for row in [0, 63, 64, 5000]:
+        index.add("Cali", row)
+    words = 5000 // 64 + 1
+    assert index.count("Cali") == popcount(index.bitmap("Cali", words)) == 4
+    index.remove("Cali", 63)
+    assert index.count("Cali") == 3
+    assert popcount(index.union(["Cali", "Bogotá"], words)) == 3
+
+
+def test_row_bitmaps_translate_rows_to_sorted_ids(make_child):
+    bitmaps = RowBitmaps()
+    for child_id in [50, 10, 30, 20, 40]:
+        bitmaps.add(make_child(child_id, city="Cali"))
+    bitmaps.remove(make_child(30, city="Cali"))
+    cali = bitmaps.index("city").bitmap("Cali", bitmaps.words)
+    assert bitmaps.ids(cali).tolist() == [10, 20, 40, 50]
+    assert bitmaps.ids(cali, min_id=15, max_id=45).tolist() == [20, 40]
+
+
+@pytest.fixture(params=[("/abb", abb_service), ("/avl", avl_service)])
+def populated(request, make_child_create):
+    prefix, service = request.param
+    service.clear_tree()
+    for child_id in range(1, 301):
+        # Género independiente de la ciudad para que las intersecciones no queden vacías
+        gender = ["male", "female", "other"][child_id // 3 % 3]
+        service.add_child(make_child_create(child_id, age=child_id % 18, gender=gender))
+    yield prefix, service
+    service.clear_tree()
+
+
+def _expected(service, **filters):
+    result = []
+    for child in service.get_all_children():
+        if "city" in filters and child.city != filters["city"]:
+            continue
+        if "gender" in filters and child.gender != filters["gender"]:
+            continue
+        if not filters.get("min_age", 0) <= child.age <= filters.get("max_age", 150):
+            continue
+        if not filters.get("min_id", 0) <= child.id <= filters.get("max_id", 10 ** 9):
+            continue
+        result.append(child.id)
+    return result
+
+
+@pytest.mark.parametrize("filters,strategy", [
+    ({"city": "Cali", "gender": "female", "min_age": 5, "max_age": 8}, "bitmap_intersection"),
+    ({"min_age": 3, "max_age": 3}, "bitmap_intersection"),
+    ({"min_id": 10, "max_id": 40, "city": "Bogotá"}, "id_range_scan"),
+    ({"min_age": 0, "max_age": 150}, "full_scan"),
+])
+def test_filters_match_full_scan(populated, filters, strategy):
+    prefix, service = populated
+    response = client.get(f"{prefix}/children", params={**filters, "explain": "true"})
+    assert response.status_code == 200
+    body = response.json()
+    expected = _expected(service, **filters)
+    assert expected and [child["id"] for child in body["children"]] == expected
+    assert body["plan"]["strategy"] == strategy
+    assert body["plan"]["rows_returned"] == len(body["children"])
+
+    plain = client.get(f"{prefix}/children", params=filters).json()
+    assert plain == body["children"]
+
+
+def test_intersection_examines_only_matching_rows(populated):
+    prefix, _service = populated
+    plan = client.get(
+        f"{prefix}/children", params={"city": "Cali", "gender": "female", "explain": "true"}
+    ).json()["plan"]
+    assert plan["rows_examined"] == plan["rows_returned"] == plan["bitmap_rows"] > 0
+    assert plan["rows_examined"] < plan["total_rows"] / 3
+
+
+def test_invalid_filters(populated):
+    prefix, _service = populated
+    assert client.get(f"{prefix}/children", params={"min_age": 9, "max_age": 2}).status_code == 400
+    assert client.get(f"{prefix}/children", params={"city": "Cali", "limit": 5}).status_code == 400
@@ -0,0 +1,103 @@
+"""
+Pruebas del registro JSON de operaciones lentas.
+"""
+
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.avl_model import AVLTree
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+from app.utils.slow_log import search_depth, slow_operation_log
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def clean_services():
+    abb_service.clear_tree()
+    avl_service.clear_tree()
+    yield
+    abb_service.clear_tree()
+    avl_service.clear_tree()
+
+
+@pytest.fixture
+def log_everything(monkeypatch, caplog):
+    """Umbral 0: se registran todas las operaciones medidas."""
+    monkeypatch.setattr(slow_operation_log, "threshold_ms", 0)
+    caplog.set_level(logging.WARNING, logger="app.utils.slow_log")
+    return caplog
+
+
+def _entries(caplog):
+    return [json.loads(record.getMessage()) for record in caplog.records if record.name == "app.utils.slow_log"]
+
+
+def test_disabled_log_writes_nothing(caplog, make_child_create):
+    caplog.set_level(logging.WARNING, logger="app.utils.slow_log")
+    assert client.post("/abb/children", json=make_child_create(1).dict()).status_code == 201
+    assert client.get("/abb/traversal/inorder").status_code == 200
+    assert _entries(caplog) == []
+
+
+def test_degenerate_abb_insert_reports_shape_and_phases(log_everything, make_child_create):
+    for child_id in range(1, 31):
+        response = client.post("/abb/children", json=make_child_create(child_id).dict())
+        assert response.status_code == 201
+    assert response.json()["child"]["id"] == 30
+
+    entry = _entries(log_everything)[-1]
+    assert entry["event"] == "slow_operation"
+    assert entry["op"] == "insert" and entry["tree_type"] == "abb"
+    assert entry["count"] == 30 and entry["height"] == 30
+    # IDs crecientes: la búsqueda del último recorre toda la cadena
+    assert entry["comparisons"] == 30
+    assert entry["rotations"] is None
+    timings = entry["timings_ms"]
+    assert set(timings) == {"model", "pydantic", "json", "other", "total"}
+    assert timings["total"] >= timings["model"] + timings["pydantic"] + timings["json"] - 0.01
+
+
+def test_avl_entries_count_rotations_per_operation(log_everything, make_child_create):
+    for child_id in (1, 2):
+        client.post("/avl/children", json=make_child_create(child_id).dict())
+    client.post("/avl/children", json=make_child_create(3).dict())  # rotación RR
+
+    entry = _entries(log_everything)[-1]
+    assert entry["tree_type"] == "avl" and entry["engine"] == avl_service.get_operation_shape()["engine"]
+    if entry["engine"] == "avl":
+        assert entry["rotations"] == 1
+
+
+def test_search_traversal_and_serialize_are_logged(log_everything, make_child_create):
+    for child_id in (2, 1, 3):
+        client.post("/abb/children", json=make_child_create(child_id).dict())
+    log_everything.clear()
+
+    assert client.get("/abb/children/3").json()["id"] == 3
+    assert client.get("/abb/children/99").status_code == 404
+    assert [c["id"] for c in client.get("/abb/traversal/preorder").json()["children"]] == [2, 1, 3]
+    assert client.get("/abb/tree").json()["root"]["child"]["id"] == 2
+
+    entries = _entries(log_everything)
+    assert [entry["op"] for entry in entries] == ["search", "search", "traversal", "serialize"]
+    assert entries[0]["child_id"] == 3 and entries[0]["comparisons"] == 2
+    assert entries[0]["timings_ms"]["json"] > 0
+    assert entries[2]["child_id"] is None and entries[2]["comparisons"] is None
+
+
+def test_avl_tree_counts_rotations():
+    from tests.conftest import build_child
+
+    tree = AVLTree()
+    for child_id in range(1, 8):
+        tree.insert(build_child(child_id))
+    # Inserciones crecientes en un AVL de 7 nodos: 4 rotaciones simples
+    assert tree.rotations == 4
+    assert search_depth(tree.root, 4) == 1
+    assert search_depth(tree.root, 7) == 3
@@ -0,0 +1,102 @@
+"""
+Pruebas del motor de almacenamiento SortedArrayTree.
+"""
+
+import random
+
+import pytest
+
+from app.config import settings
+from app.models.sorted_array_model import SortedArrayTree
+from app.services.avl_service import AVLService
+
+
+def test_insert_and_search_across_array_and_buffer(make_child):
+    tree = SortedArrayTree(buffer_size=4)
+    ids = list(range(1, 30))
+    random.Random(7).shuffle(ids)
+
+    for child_id in ids:
+        assert tree.insert(make_child(child_id))
+
+    assert tree.get_count() == len(ids)
+    # Parte de los datos está en el arreglo y parte en el búfer
+    assert len(tree._keys) > 0
+    for child_id in ids:
+        assert tree.search(child_id).id == child_id
+    assert tree.search(1000) is None
+
+
+def test_rejects_duplicates_in_array_and_buffer(make_child):
+    tree = SortedArrayTree(buffer_size=2)
+    tree.insert(make_child(1))
+    tree.insert(make_child(2))  # llena el búfer y lo fusiona
+    tree.insert(make_child(3))  # queda en el búfer
+
+    assert not tree.insert(make_child(1))
+    assert not tree.insert(make_child(3))
+    assert tree.get_count() == 3
+
+
+def test_traversals_match_implicit_balanced_tree(make_child):
+    tree = SortedArrayTree(buffer_size=100)
+    for child_id in [4, 2, 6, 1, 3, 5, 7]:
+        tree.insert(make_child(child_id))
+
+    assert [c.id for c in tree.inorder_traversal()] == [1, 2, 3, 4, 5, 6, 7]
+    assert [c.id for c in tree.preorder_traversal()] == [4, 2, 1, 3, 6, 5, 7]
+    assert [c.id for c in tree.postorder_traversal()] == [1, 3, 2, 5, 7, 6, 4]
+    assert tree.root.child.id == 4
+    assert tree.get_tree_height() == 3
+    assert tree.is_balanced()
+
+    schema = tree.to_tree_schema()
+    assert schema.child.id == 4
+    assert schema.left.child.id == 2
+    assert schema.right.right.child.id == 7
+    # Las vistas estructurales no fusionan el búfer
+    assert tree._buffer.get_count() == 7 and len(tree._keys) == 0
+
+
+def test_clear_and_empty_tree(make_child):
+    tree = SortedArrayTree(buffer_size=3)
+    assert tree.is_empty()
+    assert tree.root is None
+    assert tree.to_tree_schema() is None
+
+    for child_id in range(1, 6):
+        tree.insert(make_child(child_id))
+    tree.clear()
+
+    assert tree.is_empty()
+    assert tree.get_count() == 0
+    assert tree.inorder_traversal() == []
+
+
+def test_avl_service_uses_configured_engine(make_child_create):
+    service = AVLService(engine="sorted_array")
+    for child_id in [10, 5, 15]:
+        assert service.add_child(make_child_create(child_id))["success"]
+
+    assert service.search_child(5).id == 5
+    stats = service.get_tree_stats()
+    assert stats["storage_engine"] == "sorted_array"
+    assert stats["root_child"].id == 10
+    assert stats["min_id"] == 5 and stats["max_id"] == 15
+
+
+def test_avl_service_add_child_keeps_the_write_buffer(make_child_create):
+    service = AVLService(engine="sorted_array")
+    inserts = settings.SORTED_ARRAY_BUFFER_SIZE - 1
+    for child_id in range(1, inserts + 1):
+        result = service.add_child(make_child_create(child_id))
+        assert result["tree_height"] == child_id.bit_length()
+
+    # Ninguna inserción fusionó el búfer: todo sigue en él
+    assert service._tree._buffer.get_count() == inserts
+    assert len(service._tree._keys) == 0
+
+
+def test_avl_service_rejects_unknown_engine():
+    with pytest.raises(ValueError):
+        AVLService(engine="btree")
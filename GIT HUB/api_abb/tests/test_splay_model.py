@@ -0,0 +1,144 @@
+"""
+Pruebas del motor de almacenamiento SplayTree.
+"""
+
+import random
+import threading
+
+import pytest
+
+from app.models.avl_model import AVLTree
+from app.models.splay_model import SplayTree
+from app.services.avl_service import AVLService
+
+
+@pytest.mark.parametrize("read_mostly", [False, True])
+def test_matches_avl_contents(read_mostly, make_child):
+    ids = list(range(1, 500))
+    random.Random(43).shuffle(ids)
+    splay, avl = SplayTree(read_mostly=read_mostly), AVLTree()
+    for child_id in ids:
+        assert splay.insert(make_child(child_id)) == avl.insert(make_child(child_id))
+    assert not splay.insert(make_child(ids[0]))
+
+    assert splay.get_count() == avl.get_count() == len(ids)
+    assert [c.id for c in splay.inorder_traversal()] == list(range(1, 500))
+    assert sorted(c.id for c in splay.preorder_traversal()) == list(range(1, 500))
+    assert splay.postorder_traversal()[-1].id == splay.root.child.id == splay.preorder_traversal()[0].id
+    assert [c.id for c in splay.iter_inorder(after_id=490)] == list(range(491, 500))
+    for child_id in ids[:50] + [0, 1000]:
+        found = splay.search(child_id)
+        assert (found.id if found else None) == (child_id if 1 <= child_id < 500 else None)
+    found, missing = splay.search_many([5, 1000, 7, 5])
+    assert [c.id for c in found] == [5, 7] and missing == [1000]
+
+
+def test_search_moves_child_to_root(make_child):
+    tree = SplayTree()
+    for child_id in range(1, 1001):
+        tree.insert(make_child(child_id))
+    # Las inserciones crecientes dejan una cadena: el splay la acorta
+    assert tree.get_tree_height() == 1000 and not tree.is_balanced()
+    assert tree.search(1).id == 1 and tree.root.child.id == 1
+    assert tree.get_tree_height() < 600
+    assert tree.search(2000) is None
+    assert tree.get_count() == 1000
+
+
+def test_read_mostly_splays_only_deep_nodes(make_child):
+    tree = SplayTree(read_mostly=True, splay_depth=3)
+    for child_id in range(1, 101):
+        tree.insert(make_child(child_id))
+
+    # 100 es la raíz tras la última inserción: no se reorganiza
+    assert tree.search(100).id == 100 and tree.search_splays == 0
+    assert tree.search(1).id == 1 and tree.search_splays == 1
+    assert tree.root.child.id == 1
+    assert tree.search(1).id == 1 and tree.search_splays == 1
+
+    with pytest.raises(ValueError):
+        SplayTree(splay_depth=0)
+
+
+def test_iter_inorder_survives_concurrent_splays(make_child):
+    tree = SplayTree()
+    for child_id in range(1, 301):
+        tree.insert(make_child(child_id))
+
+    iterator = tree.iter_inorder()
+    seen = [next(iterator).id for _ in range(100)]
+    for child_id in (250, 3, 150, 299):
+        tree.search(child_id)
+    seen += [c.id for c in iterator]
+    assert seen == list(range(1, 301))
+
+
+def test_concurrent_readers_and_writers(make_child):
+    tree = SplayTree(read_mostly=True)
+    for child_id in range(2, 4002, 2):
+        tree.insert(make_child(child_id))
+    errors = []
+
+    def reader(seed):
+        rng = random.Random(seed)
+        for _ in range(3000):
+            child_id = rng.randrange(2, 4002, 2)
+            found = tree.search(child_id)
+            if found is None or found.id != child_id:
+                errors.append(child_id)
+
+    def writer(start):
+        for child_id in range(start, 4002, 4):
+            tree.insert(make_child(child_id))
+
+    threads = [threading.Thread(target=reader, args=(seed,)) for seed in range(3)]
+    threads += [threading.Thread(target=writer, args=(start,)) for start in (1, 3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert [c.id for c in tree.inorder_traversal()] == list(range(1, 4002))
+
+
+@pytest.mark.parametrize("engine", ["splay", "splay_read_mostly"])
+def test_avl_service_splay_engines(engine, make_child_create, monkeypatch):
+    service = AVLService(engine=engine)
+
+    def full_walk():
+        raise AssertionError("add_child no debe recorrer todo el árbol")
+
+    monkeypatch.setattr(service._tree, "_heights", full_walk)
+    for child_id in [10, 5, 15]:
+        result = service.add_child(make_child_create(child_id))
+        assert result["success"]
+        assert result["tree_height"] is None and result["balanced"] is None
+    monkeypatch.undo()
+    assert service.get_tree_stats()["storage_engine"] == engine
+    assert service.search_child(5).id == 5
+    assert [c.id for c in service.get_inorder_traversal().children] == [5, 10, 15]
+
+
+def test_deep_splay_tree_structure_is_rejected_with_levelorder_hint(make_child_create, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.controllers import avl_controller
+    from app.main import app
+
+    # IDs crecientes: el splay queda como una cadena tan profunda como el árbol
+    service = AVLService(engine="splay")
+    for child_id in range(1, 1501):
+        service.add_child(make_child_create(child_id))
+    assert service.get_operation_shape()["height"] == 1500
+
+    with pytest.raises(ValueError, match="levelorder"):
+        service.get_tree_structure()
+
+    monkeypatch.setattr(avl_controller, "avl_service", service)
+    client = TestClient(app)
+    response = client.get("/avl/tree")
+    assert response.status_code == 400
+    assert "/traversal/levelorder" in response.json()["detail"]
+    levels = client.get("/avl/traversal/levelorder", params={"max_level": 2}).text.splitlines()
+    assert len(levels) == 3
@@ -0,0 +1,100 @@
+"""
+Pruebas de la actualización en el lugar de niños y de PATCH /children/{id}.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.abb_model import BinarySearchTree
+from app.models.avl_model import AVLTree
+from app.models.persistent_avl_model import PersistentAVLTree
+from app.models.sorted_array_model import SortedArrayTree
+from app.models.splay_model import SplayTree
+from app.services.abb_service import abb_service
+from app.services.avl_service import avl_service
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("factory", [
+    BinarySearchTree, AVLTree, PersistentAVLTree, SplayTree, lambda: SortedArrayTree(buffer_size=8),
+])
+def test_engines_update_payload_in_place(factory, make_child):
+    tree = factory()
+    for child_id in range(1, 21):
+        tree.insert(make_child(child_id))
+    preorder = [c.id for c in tree.preorder_traversal()]
+
+    # 3 está en el arreglo principal y 20 en el búfer del SortedArrayTree
+    for child_id in (3, 20):
+        previous, child = tree.update(child_id, {"name": "Renombrado", "age": 99})
+        assert previous.name == f"Niño{child_id}" and previous.age == child_id % 15
+        assert (child.id, child.name, child.age, child.city) == (child_id, "Renombrado", 99, previous.city)
+        assert tree.search_many([child_id])[0] == [child]
+
+    assert tree.update(500, {"age": 1}) is None
+    assert [c.id for c in tree.preorder_traversal()] == preorder
+    assert tree.get_count() == 20
+    with pytest.raises(ValueError):
+        tree.update(5, {"name": "   "})
+    with pytest.raises(ValueError):
+        tree.update(5, {"id": 6})
+
+
+def test_persistent_update_keeps_snapshots_isolated(make_child):
+    tree = PersistentAVLTree()
+    for child_id in range(1, 8):
+        tree.insert(make_child(child_id))
+    snapshot = tree.snapshot()
+    tree.update(4, {"city": "Pasto"})
+    assert snapshot.search(4).city != "Pasto"
+    assert tree.search(4).city == "Pasto"
+    assert tree.is_balanced()
+
+
+@pytest.fixture(params=[("/abb", abb_service), ("/avl", avl_service)])
+def populated(request, make_child_create):
+    prefix, service = request.param
+    service.clear_tree()
+    for child_id in range(1, 31):
+        service.add_child(make_child_create(child_id, city="Cali", gender="male", age=5))
+    yield prefix, service
+    service.clear_tree()
+
+
+def test_patch_updates_child_and_indexes(populated):
+    prefix, service = populated
+    # Llenar la caché de respuestas antes de actualizar
+    assert client.get(f"{prefix}/children/7").json()["name"] == "Niño7"
+
+    response = client.patch(f"{prefix}/children/7", json={"name": "Valentina", "age": 9, "city": "Pasto"})
+    assert response.status_code == 200
+    assert response.json() == {"id": 7, "name": "Valentina", "age": 9, "city": "Pasto", "gender": "male"}
+    assert client.get(f"{prefix}/children/7").json()["name"] == "Valentina"
+
+    assert [c.id for c in service.search_by_name_prefix("valen", 10)] == [7]
+    assert service.search_by_name_prefix("Niño7", 10) == []
+    assert service.fuzzy_search_by_name("Valentna", 1)[0].child.id == 7
+
+    filtered = client.get(f"{prefix}/children", params={"city": "Pasto", "min_age": 9}).json()
+    assert [c["id"] for c in filtered] == [7]
+    assert len(client.get(f"{prefix}/children", params={"city": "Cali"}).json()) == 29
+    assert service.count_by_age(9, 9)["count"] == 1
+    groups = client.get(f"{prefix}/aggregate", params={"group_by": "city", "metrics": "count"}).json()["groups"]
+    assert {g["city"]: g["count"] for g in groups} == {"Cali": 29, "Pasto": 1}
+    stats = client.get(f"{prefix}/stats/ages", params={"group_by": "city"}).json()["groups"]
+    assert {g["city"]: g["max_age"] for g in stats} == {"Cali": 5, "Pasto": 9}
+
+    # Solo cambia el género: ciudad y edad se conservan
+    assert client.patch(f"{prefix}/children/7", json={"gender": "female"}).json()["city"] == "Pasto"
+    assert [c["id"] for c in client.get(f"{prefix}/children", params={"gender": "female"}).json()] == [7]
+
+
+def test_patch_errors(populated):
+    prefix, _service = populated
+    assert client.patch(f"{prefix}/children/999", json={"age": 3}).status_code == 404
+    assert client.patch(f"{prefix}/children/1", json={}).status_code == 400
+    assert client.patch(f"{prefix}/children/1", json={"name": "   "}).status_code == 400
+    assert client.patch(f"{prefix}/children/1", json={"id": 2}).status_code == 422
+    assert client.patch(f"{prefix}/children/1", json={"age": 200}).status_code == 422